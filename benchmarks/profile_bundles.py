@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark exporting and importing profiles as bundles.
+
+Compares one file per profile with tar.gz and tar.xz bundles: archive
+size, export and import throughput, and the peak memory traced while
+importing. Run from the repository root:
+    
+    python benchmarks/profile_bundles.py [--profiles 300 5000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from steamlaunchergui.config import TAB_CONFIGS
+from steamlaunchergui.models.launch_options import LaunchOptions
+from steamlaunchergui.models.profile_bundle import export_bundle, import_bundle
+from steamlaunchergui.models.profiles import Profile, ProfileManager
+
+# Launch strings the generated profiles cycle through
+COMMANDS = [
+    "PROTON_LOG=1 DXVK_HUD=fps %command%",
+    "gamemoderun %command% -novid",
+    "mangohud %command%",
+    "PROTON_USE_WINED3D=1 %command% -dx11",
+]
+
+def make_profile(number):
+    """Generate a profile with its own game argument."""
+    launch_options = LaunchOptions()
+    launch_options.parse_command(f"{COMMANDS[number % len(COMMANDS)]} -x{number}", TAB_CONFIGS)
+    return Profile(f"p{number:05d}", f"desc {number}", launch_options)
+
+def timed(function, *args):
+    """Run a function and return its result and the seconds it took."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def export_files(manager, directory):
+    """Export every profile to its own file, as the single-profile dialog does."""
+    for profile in manager.get_profiles():
+        manager.export_profile(profile.name, directory / f"{profile.name}.json")
+
+def import_files(manager, source, directory):
+    """Import the files written by export_files."""
+    for profile in source.get_profiles():
+        manager.import_profile(directory / f"{profile.name}.json")
+
+def run(count):
+    """Run the benchmark with the given number of profiles and print the results."""
+    directory = Path(tempfile.mkdtemp(prefix="profile-bundles-"))
+    ProfileManager(directory / "source").import_profiles(make_profile(number) for number in range(count))
+    # Reopened so profiles load lazily, as after a restart
+    source = ProfileManager(directory / "source")
+    raw = sum(len(json.dumps(profile.to_dict(), indent=2)) for profile in source.get_profiles())
+    
+    print(f"{count} profiles, {raw / 1024:.0f} KiB of JSON:")
+    if count <= 1000:
+        files = directory / "files"
+        files.mkdir()
+        _, export_time = timed(export_files, source, files)
+        _, import_time = timed(import_files, ProfileManager(directory / "single"), source, files)
+        print(f"  single files: export {_format(export_time)}, import {_format(import_time)}")
+    
+    for extension in ("tar.gz", "tar.xz"):
+        bundle = directory / f"profiles.{extension}"
+        _, export_time = timed(export_bundle, source, bundle)
+        result, import_time = timed(import_bundle, ProfileManager(directory / f"import-{extension}"), bundle)
+        
+        target = ProfileManager(directory / f"traced-{extension}")
+        tracemalloc.start()
+        import_bundle(target, bundle)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        print(f"  {extension}: {os.path.getsize(bundle) / 1024:.0f} KiB, "
+              f"export {_format(export_time)} ({count / export_time:.0f} profiles/s), "
+              f"import {_format(import_time)} ({count / import_time:.0f} profiles/s), "
+              f"import peak {peak / 1024 / 1024:.0f} MiB, {result.imported} imported")
+
+def _format(seconds):
+    """Format a duration in s or ms."""
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    return f"{seconds * 1000:.0f} ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark profile bundle export and import")
+    parser.add_argument("--profiles", type=int, nargs="+", default=[300, 5000],
+                        help="Numbers of profiles to benchmark")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    for count in args.profiles:
+        run(count)
+
+if __name__ == "__main__":
+    main()
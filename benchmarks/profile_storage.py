@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON and SQLite profile backends.
+
+Stores the same generated profiles in both backends and times saving,
+listing, loading and searching them, then the migration from JSON to
+SQLite. Run from the repository root:
+    
+    python benchmarks/profile_storage.py [--profiles 10000]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from steamlaunchergui.config import TAB_CONFIGS
+from steamlaunchergui.models.launch_options import LaunchOptions
+from steamlaunchergui.models.profile_db import SqliteProfileManager, migrate_profiles
+from steamlaunchergui.models.profiles import Profile, ProfileManager
+
+# Words the generated launch strings are drawn from
+WORDS = [
+    "DXVK_ASYNC=1", "gamemoderun", "mangohud", "PROTON_LOG=1", "PROTON_USE_WINED3D=1",
+    "DXVK_HUD=fps", "__GL_SHADER_DISK_CACHE=1",
+]
+
+def make_profiles(count, seed=1):
+    """Generate profiles sharing 60 distinct option sets."""
+    rng = random.Random(seed)
+    option_sets = []
+    for _ in range(60):
+        launch_options = LaunchOptions()
+        command = " ".join(rng.sample(WORDS, 3)) + " %command% -novid"
+        launch_options.parse_command(command, TAB_CONFIGS)
+        option_sets.append(launch_options)
+    return [Profile(f"Profile {number}", "Generated", rng.choice(option_sets).copy())
+            for number in range(count)]
+
+def timed(function, *args):
+    """Run a function and return its result and the seconds it took."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def scan_json(manager, option):
+    """Find the profiles setting an option by loading every profile."""
+    return [profile for profile in manager.get_profiles()
+            if option in profile.launch_options.effective_options()]
+
+def run(count):
+    """Run the benchmark with the given number of profiles and print the results."""
+    directory = Path(tempfile.mkdtemp(prefix="profile-storage-"))
+    json_dir = directory / "profiles"
+    database = directory / "profiles.db"
+    results = {}
+    
+    for name, open_manager in (("JSON", lambda: ProfileManager(json_dir)),
+                               ("SQLite", lambda: SqliteProfileManager(database))):
+        manager = open_manager()
+        _, results[(name, "bulk save")] = timed(manager.import_profiles, make_profiles(count))
+        
+        profile = manager.get_profile("Profile 0")
+        profile.description = "Changed"
+        _, results[(name, "single save")] = timed(manager.save_profile, profile)
+        manager.close()
+        
+        manager, results[(name, "list at startup")] = timed(open_manager)
+        _, results[(name, "load all bodies")] = timed(
+            lambda: [profile.launch_options for profile in manager.get_profiles()]
+        )
+        if name == "JSON":
+            found, results[(name, "profiles setting DXVK_ASYNC")] = timed(
+                scan_json, manager, "DXVK_ASYNC"
+            )
+        else:
+            found, results[(name, "profiles setting DXVK_ASYNC")] = timed(
+                manager.find_profiles, "DXVK_ASYNC"
+            )
+        results[(name, "found")] = len(found)
+        manager.close()
+    
+    target, migration = timed(migrate_profiles, json_dir, directory / "migrated.db")
+    target.close()
+    
+    print(f"Benchmark with {count} profiles in {directory}:")
+    print()
+    print(f"  {'':30} {'JSON':>9} {'SQLite':>9}")
+    for label in ("bulk save", "single save", "list at startup", "load all bodies",
+                  "profiles setting DXVK_ASYNC"):
+        print(f"  {label:30} {_format(results[('JSON', label)]):>9} "
+              f"{_format(results[('SQLite', label)]):>9}")
+    print(f"  (both found {results[('JSON', 'found')]} and {results[('SQLite', 'found')]} profiles)")
+    print()
+    print(f"Migrating {count} JSON profiles takes {_format(migration)}.")
+
+def _format(seconds):
+    """Format a duration in s or ms."""
+    if seconds >= 1:
+        return f"{seconds:.1f} s"
+    if seconds >= 0.01:
+        return f"{seconds * 1000:.0f} ms"
+    return f"{seconds * 1000:.2f} ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the profile storage backends")
+    parser.add_argument("--profiles", type=int, default=10000, help="Number of profiles")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    run(args.profiles)
+
+if __name__ == "__main__":
+    main()
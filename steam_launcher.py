@@ -16,12 +16,15 @@ except ValueError as e:
 import subprocess
 import os
 import json
-import shlex
 import pexpect
 import logging
 from collections import defaultdict
 import uuid
 
+from steamlaunchergui.config.option_catalog import get_option_catalog
+from steamlaunchergui.models.command_tokenizer import COMMAND, ENV, SEPARATOR, tokenize
+from steamlaunchergui.ui.update_scheduler import UpdateScheduler
+
 # SECTION: CONSTANTS
 SETTINGS_FILE = "steam_launcher_settings.json"
 LOG_FILE = 'steam_launcher.log'
@@ -472,6 +475,10 @@ class SteamLauncherWindow(Gtk.Window):
             self.set_border_width(10)
             self.set_default_size(1000, 700)
 
+            # Summary refreshes are coalesced into one per frame
+            self.update_scheduler = UpdateScheduler()
+            self.update_scheduler.register("summary", self.refresh_summary)
+
             # Main vertical box
             vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
             self.add(vbox)
@@ -498,6 +505,9 @@ class SteamLauncherWindow(Gtk.Window):
             self.notebook = Gtk.Notebook()
             vbox.pack_start(self.notebook, True, True, 0)
 
+            # Option lookups, needed before any widget can update the summary
+            self.build_detection_mappings()
+
             # General Tab
             self.toggles = {}
             self.inputs = {}
@@ -587,7 +597,6 @@ class SteamLauncherWindow(Gtk.Window):
             )
 
             self.connect("destroy", self.on_destroy)
-            GLib.idle_add(self.build_detection_mappings)
             GLib.idle_add(self.load_settings)
         except Exception as e:
             print(f"Error initializing application: {e}")
@@ -675,6 +684,9 @@ class SteamLauncherWindow(Gtk.Window):
 
     # SECTION: SUMMARY METHODS
     def update_summary(self, *args):
+        self.update_scheduler.request("summary")
+
+    def refresh_summary(self):
         summary_data = self.collect_summary_data()
         summary_text = self.format_summary(summary_data)
         self.summary_buffer.set_text(summary_text)
@@ -685,14 +697,14 @@ class SteamLauncherWindow(Gtk.Window):
         # General Tab - Toggles
         for flag, toggle in self.toggles.items():
             if toggle.get_active():
-                description = next((desc for f, desc in GENERAL_OPTIONS if f == flag), flag)
+                description = self.option_catalog.describe(flag)
                 summary_data[self.get_general_category(flag)].append((flag, description))
 
         # General Tab - Inputs
         for flag, entry in self.inputs.items():
             value = entry.get_text().strip()
             if value:
-                description = next((desc for f, desc, _ in GENERAL_INPUTS if f == flag), flag)
+                description = self.option_catalog.describe(flag)
                 summary_data[self.get_general_category(flag)].append((f"{flag} {value}", description))
 
         # General Tab - Dropdowns (dxlevel)
@@ -700,7 +712,7 @@ class SteamLauncherWindow(Gtk.Window):
             for flag, combo in self.general_dropdowns.items():
                 value = combo.get_active_text()
                 if value is not None:
-                    description = next((desc for f, desc, _ in GENERAL_INPUTS if f == flag), flag)
+                    description = self.option_catalog.describe(flag)
                     summary_data["Performance and Graphics"].append((f"{flag} {value}", description))
 
         # Other Tabs
@@ -1252,25 +1264,7 @@ class SteamLauncherWindow(Gtk.Window):
         pass  # No software checks as per original code
 
     def build_detection_mappings(self):
-        self.toggle_mappings = {flag: flag for flag, _ in GENERAL_OPTIONS}
-        self.input_mappings = {flag: flag for flag, _, _ in GENERAL_INPUTS}
-        self.tab_toggle_mappings = {}
-        self.tab_input_mappings = {}
-        self.tab_dropdown_mappings = {}
-        self.tab_slider_mappings = {}
-        for tab_name, config in TAB_CONFIGS.items():
-            if "toggles" in config:
-                for option, _ in config["toggles"]:
-                    self.tab_toggle_mappings[option] = (tab_name, option)
-            if "inputs" in config:
-                for option, _, _ in config["inputs"]:
-                    self.tab_input_mappings[option] = (tab_name, option)
-            if "dropdowns" in config:
-                for key in config["dropdowns"]:
-                    self.tab_dropdown_mappings[key] = (tab_name, key)
-            if "sliders" in config:
-                for option, _, _, _ in config["sliders"]:
-                    self.tab_slider_mappings[option] = (tab_name, option)
+        self.option_catalog = get_option_catalog(TAB_CONFIGS, GENERAL_OPTIONS, GENERAL_INPUTS)
 
     def load_settings(self):
         try:
@@ -1474,6 +1468,8 @@ class SteamLauncherWindow(Gtk.Window):
         self.update_summary()
 
     def on_destroy(self, widget):
+        self.update_scheduler.cancel()
+        logging.debug(f"Summary refresh stats: {self.update_scheduler.stats()}")
         self.on_save_clicked(None)
         Gtk.main_quit()
 
@@ -1486,80 +1482,64 @@ class SteamLauncherWindow(Gtk.Window):
             # Reset all settings before parsing
             self.on_reset_clicked(None)
             
-            # Split command, preserving quoted strings
-            parts = shlex.split(command.replace('%command%', ''))
+            catalog = self.option_catalog
             env_vars = {}
             flags = []
-            current_env = []
             
-            for part in parts:
-                if '=' in part and not part.startswith('-'):
-                    # Handle environment variables
-                    key, value = part.split('=', 1)
-                    env_vars[key] = value
-                elif part in TAB_CONFIGS.get("Gamescope", {}).get("command_suffix", ""):
+            for token in tokenize(command, catalog.prefixes, catalog.suffixes):
+                if token.kind == ENV:
+                    env_vars[token.name] = token.value
+                elif token.kind in (SEPARATOR, COMMAND):
                     continue
                 else:
-                    # Handle flags and command prefixes
-                    flags.append(part)
+                    # Handle flags, game arguments and command prefixes
+                    flags.append(token.value)
             
             # Process environment variables
             for key, value in env_vars.items():
-                if key in self.tab_toggle_mappings:
-                    tab_name, option = self.tab_toggle_mappings[key]
-                    if value == "1":
-                        self.tab_data[tab_name]['toggles'][option].set_active(True)
-                        self.tab_data[tab_name]['enable_toggle'].set_active(True)
-                elif key in self.tab_input_mappings:
-                    tab_name, option = self.tab_input_mappings[key]
-                    self.tab_data[tab_name]['inputs'][option].set_text(value)
+                spec = catalog.env_toggles.get(key)
+                if spec and value == "1":
+                    self.tab_data[spec.tab]['toggles'][key].set_active(True)
+                    self.tab_data[spec.tab]['enable_toggle'].set_active(True)
+                elif key in catalog.inputs:
+                    tab_name = catalog.inputs[key].tab
+                    self.tab_data[tab_name]['inputs'][key].set_text(value)
                     self.tab_data[tab_name]['enable_toggle'].set_active(True)
-                elif key in self.tab_dropdown_mappings:
-                    tab_name, key = self.tab_dropdown_mappings[key]
+                elif key in catalog.dropdowns:
+                    tab_name = catalog.dropdowns[key].tab
                     combo = self.tab_data[tab_name]['dropdowns'][key]
                     for i in range(combo.get_model().iter_n_children(None)):
                         if combo.get_model()[i][0] == value:
                             combo.set_active(i)
                             self.tab_data[tab_name]['enable_toggle'].set_active(True)
                             break
-                elif key in self.tab_slider_mappings:
-                    tab_name, option = self.tab_slider_mappings[key]
+                elif key in catalog.sliders:
+                    tab_name = catalog.sliders[key].tab
                     try:
-                        self.tab_data[tab_name]['sliders'][option].set_value(float(value))
+                        self.tab_data[tab_name]['sliders'][key].set_value(float(value))
                         self.tab_data[tab_name]['enable_toggle'].set_active(True)
                     except ValueError:
                         pass
             
             # Process flags
-            for flag in flags:
-                if flag in self.toggle_mappings:
+            for i, flag in enumerate(flags):
+                next_part = flags[i + 1] if i + 1 < len(flags) else None
+                if flag == "-dxlevel":
+                    self.dxlevel_toggle.set_active(True)
+                    if next_part is not None:
+                        combo = self.general_dropdowns["-dxlevel"]
+                        for j in range(combo.get_model().iter_n_children(None)):
+                            if combo.get_model()[j][0] == next_part:
+                                combo.set_active(j)
+                                break
+                elif flag in catalog.general_toggles:
                     self.toggles[flag].set_active(True)
-                elif flag in self.input_mappings:
+                elif flag in catalog.general_inputs:
                     # Handle inputs that require a value
-                    try:
-                        idx = flags.index(flag)
-                        if idx + 1 < len(flags):
-                            self.inputs[flag].set_text(flags[idx + 1])
-                    except ValueError:
-                        pass
-                elif flag == "-dxlevel":
-                    self.dxlevel_toggle.set_active(True)
-                    try:
-                        idx = flags.index(flag)
-                        if idx + 1 < len(flags):
-                            value = flags[idx + 1]
-                            combo = self.general_dropdowns["-dxlevel"]
-                            for i in range(combo.get_model().iter_n_children(None)):
-                                if combo.get_model()[i][0] == value:
-                                    combo.set_active(i)
-                                    break
-                    except ValueError:
-                        pass
-                else:
-                    # Check for command prefixes
-                    for tab_name, config in TAB_CONFIGS.items():
-                        if "command_prefix" in config and flag == config["command_prefix"]:
-                            self.tab_data[tab_name]['enable_toggle'].set_active(True)
+                    if next_part is not None and flag in self.inputs:
+                        self.inputs[flag].set_text(next_part)
+                elif flag in catalog.prefixes:
+                    self.tab_data[catalog.prefixes[flag]]['enable_toggle'].set_active(True)
             
             self.update_summary()
             logging.info(f"Parsed command: {command}")
@@ -5,3 +5,4 @@ Configuration handling for SteamLauncherGUI.
 from .constants import *
 from .tab_configs import *
 from .config_manager import ConfigManager
+from .option_catalog import OptionCatalog, OptionSpec, TabSpec, get_option_catalog
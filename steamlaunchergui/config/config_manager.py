@@ -8,23 +8,46 @@ import logging
 from pathlib import Path
 import shutil
 import tempfile
+import threading
 import time
+from collections import OrderedDict
 
-from .constants import SETTINGS_FILE
+from .constants import (
+    FSYNC_ALWAYS, FSYNC_NEVER, FSYNC_ON_FLUSH, SETTINGS_FILE, SETTINGS_FSYNC,
+    SETTINGS_JOURNAL_LIMIT
+)
 
 logger = logging.getLogger(__name__)
 
 class ConfigManager:
     """
     Configuration manager class for handling application settings.
+    
+    Settings are kept as a snapshot in the settings file plus a journal next
+    to it, with one JSON record per line for each change since the
+    snapshot. Saving a change appends its record; once the journal grows
+    past SETTINGS_JOURNAL_LIMIT it is compacted into a new snapshot.
+    Loading reads the snapshot and replays the journal.
+    
+    By default every change is written at once. In write-behind mode a
+    change only marks the settings dirty and starts a timer; when it fires,
+    all changes made meanwhile are written together on the timer thread,
+    keeping only the last change of each key. flush() writes pending
+    changes at once and must be called before the application exits.
     """
     
-    def __init__(self, settings_file=None):
+    def __init__(self, settings_file=None, write_delay=0.0, fsync_policy=None, journal=True):
         """
         Initialize the configuration manager.
         
         Args:
             settings_file: Optional path to the settings file
+            write_delay: Seconds to wait before writing changes, 0 to write
+                each change at once
+            fsync_policy: FSYNC_ALWAYS, FSYNC_ON_FLUSH or FSYNC_NEVER, or None
+                for the "settings_fsync" setting
+            journal: Whether to append changes to the journal instead of
+                rewriting the settings file each time
         """
         self.settings_file = settings_file or SETTINGS_FILE
         
@@ -37,8 +60,36 @@ class ConfigManager:
             self.settings_file = os.path.join(
                 os.path.expanduser("~"), self.settings_file
             )
-            
+        
+        self.journal_file = self.settings_file + ".journal"
+        self.journal = journal
+        self._journal_size = 0
+        
+        # The lock guards the settings, the dirty flag and the pending
+        # records; the write lock keeps writes in order
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._compact = False
+        self._pending = OrderedDict()
+        self._pending_clear = False
+        self._timer = None
+        self.write_count = 0
+        
         self.settings = self._load_settings()
+        if self._replay_journal(self.settings):
+            # Start a clean journal rather than append after a bad record
+            self._dirty = self._compact = True
+        
+        self.write_delay = write_delay
+        self.fsync_policy = fsync_policy or self.settings.get("settings_fsync", SETTINGS_FSYNC)
+        if self.fsync_policy not in (FSYNC_ALWAYS, FSYNC_ON_FLUSH, FSYNC_NEVER):
+            logger.warning(f"Unknown fsync policy {self.fsync_policy}, using {SETTINGS_FSYNC}")
+            self.fsync_policy = SETTINGS_FSYNC
+        
+        if self._dirty:
+            self.flush()
+        
         logger.debug(f"ConfigManager initialized with settings file: {self.settings_file}")
     
     def _load_settings(self):
@@ -59,33 +110,293 @@ class ConfigManager:
                 return settings
         except json.JSONDecodeError as e:
             logger.error(f"Error decoding settings file: {e}")
-            
-            # Backup the corrupted file
-            backup_file = f"{self.settings_file}.bak.{int(time.time())}"
-            try:
-                shutil.copy2(self.settings_file, backup_file)
-                logger.info(f"Corrupted settings file backed up to: {backup_file}")
-            except Exception as e:
-                logger.error(f"Failed to backup corrupted settings file: {e}")
-            
+            self._backup_corrupted(self.settings_file)
             return {}
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
             return {}
     
+    def _backup_corrupted(self, path):
+        """
+        Keep a copy of a corrupted file before it is replaced.
+        
+        Args:
+            path: Path to the corrupted file
+        """
+        backup_file = f"{path}.bak.{int(time.time())}"
+        try:
+            shutil.copy2(path, backup_file)
+            logger.info(f"Corrupted settings file backed up to: {backup_file}")
+        except Exception as e:
+            logger.error(f"Failed to backup corrupted settings file: {e}")
+    
+    def _replay_journal(self, settings):
+        """
+        Apply the records of the journal to loaded settings.
+        
+        A record cut off by a crash at the end of the journal is dropped.
+        A journal with unreadable records is backed up, and the readable
+        records are applied.
+        
+        Args:
+            settings: Settings loaded from the snapshot, updated in place
+            
+        Returns:
+            bool: True if the journal needs to be replaced by a snapshot
+        """
+        try:
+            with open(self.journal_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error(f"Error reading settings journal: {e}")
+            return False
+        
+        self._journal_size = len(data)
+        lines = data.split(b"\n")
+        torn = lines.pop()
+        if torn:
+            logger.warning(f"Dropping incomplete last record of {self.journal_file}")
+        
+        corrupted = False
+        for line in lines:
+            if not line:
+                continue
+            try:
+                record = json.loads(line.decode("utf-8"))
+                if "set" in record:
+                    settings[record["set"]] = record["value"]
+                elif "delete" in record:
+                    settings.pop(record["delete"], None)
+                elif "clear" in record:
+                    settings.clear()
+                else:
+                    raise ValueError(f"unknown record {record}")
+            except (ValueError, TypeError, KeyError) as e:
+                if not corrupted:
+                    logger.error(f"Error decoding settings journal: {e}")
+                corrupted = True
+        
+        if corrupted:
+            self._backup_corrupted(self.journal_file)
+        logger.debug("Replayed %d settings journal records", len(lines))
+        return corrupted or bool(torn)
+    
     def save_settings(self, settings=None):
         """
         Save the current settings to the settings file.
         
+        The settings are written in full and the journal is emptied,
+        including pending write-behind changes.
+        
         Args:
             settings: Optional settings to save, uses self.settings if None
             
         Returns:
             bool: True if successful, False otherwise
         """
-        if settings is None:
-            settings = self.settings
+        if settings is None or settings is self.settings:
+            with self._lock:
+                self._dirty = self._compact = True
+            return self.flush()
+        
+        with self._write_lock:
+            return self._write_snapshot(json.dumps(settings, indent=4),
+                                        self.fsync_policy == FSYNC_ALWAYS)
+    
+    def flush(self):
+        """
+        Write pending changes at once.
+        
+        Returns:
+            bool: True if successful or nothing was pending, False otherwise
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return self._write_pending(self.fsync_policy != FSYNC_NEVER)
+    
+    def close(self):
+        """
+        Write pending changes and leave write-behind mode.
+        
+        Later changes are written at once.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.write_delay = 0.0
+        return self.flush()
+    
+    def _record(self, key, record):
+        """
+        Queue the journal record of a change.
         
+        Must be called with the lock held, after the change was applied.
+        
+        Args:
+            key: Key of the changed setting, or None for a clear
+            record: Journal record of the change
+        """
+        self._dirty = True
+        if key is None:
+            self._pending.clear()
+            self._pending_clear = True
+        else:
+            # Only the last change of a key needs to be written
+            self._pending.pop(key, None)
+            self._pending[key] = record
+    
+    def _schedule(self):
+        """
+        Write queued changes, now or after the write delay.
+        
+        Must be called without the lock held.
+        
+        Returns:
+            bool: True if the changes were written or scheduled, False if
+                writing failed
+        """
+        if self.write_delay <= 0:
+            return self.flush()
+        
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.write_delay, self._on_write_timer)
+                self._timer.start()
+        return True
+    
+    def _on_write_timer(self):
+        """Write the changes made since the timer was started."""
+        with self._lock:
+            self._timer = None
+        self._write_pending(self.fsync_policy == FSYNC_ALWAYS)
+    
+    def _write_pending(self, fsync):
+        """
+        Write the changes made since the last write.
+        
+        Changes are appended to the journal, or the settings are written in
+        full if the journal is off, a full save was asked for or the
+        journal outgrew its limit.
+        
+        Args:
+            fsync: Whether to sync the file to disk
+            
+        Returns:
+            bool: True if successful or nothing was pending, False otherwise
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                
+                records = None
+                try:
+                    if self.journal and not self._compact:
+                        records = [{"clear": True}] if self._pending_clear else []
+                        records.extend(self._pending.values())
+                        records = "".join(json.dumps(record, separators=(",", ":")) + "\n"
+                                          for record in records)
+                    else:
+                        snapshot = json.dumps(self.settings, indent=4)
+                except Exception as e:
+                    # The changes stay pending, so replacing the value
+                    # that cannot be serialized lets the next write succeed
+                    logger.error(f"Error serializing settings: {e}")
+                    return False
+                
+                self._dirty = self._compact = self._pending_clear = False
+                self._pending.clear()
+            
+            if records is not None:
+                success = self._append_journal(records, fsync)
+                if success and self._journal_size > SETTINGS_JOURNAL_LIMIT:
+                    # The journal holds every change, so a failed
+                    # compaction only leaves it longer
+                    try:
+                        with self._lock:
+                            snapshot = json.dumps(self.settings, indent=4)
+                        self._write_snapshot(snapshot, fsync)
+                    except Exception as e:
+                        logger.error(f"Error serializing settings: {e}")
+            else:
+                success = self._write_snapshot(snapshot, fsync)
+            
+            if not success:
+                # Which records made it is unknown, so write everything
+                with self._lock:
+                    self._dirty = self._compact = True
+            return success
+    
+    def _append_journal(self, records, fsync):
+        """
+        Append records to the journal.
+        
+        Args:
+            records: Journal lines to append
+            fsync: Whether to sync the journal to disk
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        data = records.encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.journal_file)), exist_ok=True)
+            with open(self.journal_file, "ab") as f:
+                f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._journal_size += len(data)
+            self.write_count += 1
+            logger.debug("Appended %d bytes to %s", len(data), self.journal_file)
+            return True
+        except Exception as e:
+            logger.error(f"Error writing settings journal: {e}")
+            return False
+    
+    def _write_snapshot(self, data, fsync):
+        """
+        Write serialized settings to the settings file and empty the journal.
+        
+        Must be called with the write lock held. Should the journal survive
+        a crash after the settings file was replaced, replaying it again
+        gives the same settings.
+        
+        Args:
+            data: JSON text of the settings
+            fsync: Whether to sync the file to disk before replacing
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self._write_file(data, fsync):
+            return False
+        
+        try:
+            os.remove(self.journal_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error removing settings journal: {e}")
+            return False
+        self._journal_size = 0
+        return True
+    
+    def _write_file(self, data, fsync):
+        """
+        Write serialized settings to the settings file atomically.
+        
+        Args:
+            data: JSON text to write
+            fsync: Whether to sync the file to disk before replacing
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(os.path.abspath(self.settings_file)), exist_ok=True)
         
@@ -96,10 +407,14 @@ class ConfigManager:
                 mode="w", delete=False, dir=os.path.dirname(self.settings_file)
             ) as temp:
                 temp_file = temp.name
-                json.dump(settings, temp, indent=4)
+                temp.write(data)
+                if fsync:
+                    temp.flush()
+                    os.fsync(temp.fileno())
             
             # Rename the temporary file to the actual settings file
             shutil.move(temp_file, self.settings_file)
+            self.write_count += 1
             logger.info(f"Settings saved to: {self.settings_file}")
             return True
         except Exception as e:
@@ -135,8 +450,10 @@ class ConfigManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        self.settings[key] = value
-        return self.save_settings()
+        with self._lock:
+            self.settings[key] = value
+            self._record(key, {"set": key, "value": value})
+        return self._schedule()
     
     def delete_setting(self, key):
         """
@@ -148,10 +465,12 @@ class ConfigManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        if key in self.settings:
+        with self._lock:
+            if key not in self.settings:
+                return True
             del self.settings[key]
-            return self.save_settings()
-        return True
+            self._record(key, {"delete": key})
+        return self._schedule()
     
     def clear_settings(self):
         """
@@ -160,8 +479,10 @@ class ConfigManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        self.settings = {}
-        return self.save_settings()
+        with self._lock:
+            self.settings = {}
+            self._record(None, {"clear": True})
+        return self._schedule()
     
     def create_backup(self, backup_dir=None):
         """
@@ -173,6 +494,10 @@ class ConfigManager:
         Returns:
             str: Path to the backup file or None if failed
         """
+        # The backup is a copy of the settings file, so fold the journal in
+        if self._dirty or os.path.exists(self.journal_file):
+            self.save_settings()
+        
         if not os.path.exists(self.settings_file):
             logger.warning(f"Cannot backup non-existent settings file: {self.settings_file}")
             return None
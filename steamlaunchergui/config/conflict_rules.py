@@ -0,0 +1,143 @@
+"""
+Option conflict rules for SteamLauncherGUI.
+
+Each rule names the options it reads. General options and environment
+variables are named as they appear in the command, wrapper commands by
+their command name (e.g. "gamescope"), and command-line flags of a tab by
+the tab name and flag (e.g. "Gamescope:-f").
+"""
+
+from .tab_configs import TAB_CONFIGS
+
+# Rule types
+CONFLICT = "conflict"    # At most one of the options may be set
+REQUIRES = "requires"    # The first option needs all of the others
+OVERRIDES = "overrides"  # The first option makes the others ineffective
+
+# Options configured on the DXVK tab, which WineD3D replaces
+_DXVK_OPTIONS = tuple(dict.fromkeys(
+    [option for option, _ in TAB_CONFIGS["DXVK"]["toggles"]]
+    + [option for option, _, _ in TAB_CONFIGS["DXVK"]["inputs"]]
+))
+
+# Messages may refer to the matching options as {options}
+CONFLICT_RULES = [
+    # Display and windowing
+    {
+        "type": CONFLICT,
+        "options": ("-fullscreen", "-windowed"),
+        "message": "Conflicting options: -fullscreen and -windowed cannot be used together",
+    },
+    {
+        "type": CONFLICT,
+        "options": ("-fullscreen", "-nofullscreen"),
+        "message": "Conflicting options: -fullscreen and -nofullscreen cannot be used together",
+    },
+    {
+        "type": OVERRIDES,
+        "options": ("-fullscreen", "-noborder"),
+        "message": "Potentially unnecessary: -noborder has no effect in fullscreen mode",
+    },
+    # Priority
+    {
+        "type": CONFLICT,
+        "options": ("-high", "-low", "-veryhigh", "-background"),
+        "message": "Conflicting priority options: {options}",
+    },
+    # Sound
+    {
+        "type": OVERRIDES,
+        "options": ("-nosound", "-soundbuffer"),
+        "message": "Conflicting sound options: -nosound will override -soundbuffer",
+    },
+    # Rendering
+    {
+        "type": CONFLICT,
+        "options": ("-vulkan", "-force-glcore", "-soft"),
+        "message": "Conflicting renderer options: {options}",
+    },
+    {
+        "type": CONFLICT,
+        "options": ("-secure", "-insecure"),
+        "message": "Conflicting options: -secure and -insecure cannot be used together",
+    },
+    # Wine synchronization
+    {
+        "type": CONFLICT,
+        "options": ("PROTON_NO_ESYNC", "WINEESYNC"),
+        "message": "Conflicting options: PROTON_NO_ESYNC disables the esync WINEESYNC enables",
+    },
+    {
+        "type": CONFLICT,
+        "options": ("PROTON_NO_FSYNC", "WINEFSYNC"),
+        "message": "Conflicting options: PROTON_NO_FSYNC disables the fsync WINEFSYNC enables",
+    },
+    # Direct3D translation
+    {
+        "type": OVERRIDES,
+        "options": ("PROTON_USE_WINED3D",) + _DXVK_OPTIONS,
+        "message": "PROTON_USE_WINED3D replaces DXVK, these settings have no effect: {options}",
+    },
+    {
+        "type": OVERRIDES,
+        "options": ("PROTON_DISABLE_D3D11", "PROTON_USE_WINED3D11",
+                    "PROTON_USE_D3D11LAYER", "PROTON_USE_D3D11MULTITHREADING"),
+        "message": "PROTON_DISABLE_D3D11 makes these settings ineffective: {options}",
+    },
+    {
+        "type": OVERRIDES,
+        "options": ("PROTON_DISABLE_D3D10", "PROTON_USE_WINED3D10",
+                    "PROTON_USE_D3D10LAYER", "PROTON_USE_D3D10MULTITHREADING"),
+        "message": "PROTON_DISABLE_D3D10 makes these settings ineffective: {options}",
+    },
+    {
+        "type": CONFLICT,
+        "options": ("PROTON_USE_VULKAN", "PROTON_USE_OPENGL"),
+        "message": "Conflicting options: PROTON_USE_VULKAN and PROTON_USE_OPENGL cannot be used together",
+    },
+    {
+        "type": CONFLICT,
+        "options": ("PROTON_ENABLE_NVAPI", "PROTON_DISABLE_NVAPI"),
+        "message": "Conflicting options: PROTON_ENABLE_NVAPI and PROTON_DISABLE_NVAPI cannot be used together",
+    },
+    # Audio
+    {
+        "type": CONFLICT,
+        "options": ("PROTON_USE_PULSEAUDIO", "PROTON_USE_PIPEWIRE",
+                    "PROTON_USE_ALSA", "PROTON_USE_JACK"),
+        "message": "Conflicting audio backends: {options}",
+    },
+    # Logging
+    {
+        "type": REQUIRES,
+        "options": ("PROTON_LOG_DIR", "PROTON_LOG"),
+        "message": "PROTON_LOG_DIR has no effect without {options}",
+    },
+    # Overlays
+    {
+        "type": CONFLICT,
+        "options": ("MESA_OVERLAY_SHORT", "MESA_OVERLAY_FULL"),
+        "message": "Conflicting options: MESA_OVERLAY_SHORT and MESA_OVERLAY_FULL cannot be used together",
+    },
+    {
+        "type": REQUIRES,
+        "options": ("MESA_OVERLAY_LOG_FILE", "MESA_OVERLAY_LOG"),
+        "message": "MESA_OVERLAY_LOG_FILE has no effect without {options}",
+    },
+    # Gamescope
+    {
+        "type": CONFLICT,
+        "options": ("Gamescope:-f", "Gamescope:-b"),
+        "message": "Conflicting Gamescope options: -f (fullscreen) and -b (borderless)",
+    },
+    {
+        "type": REQUIRES,
+        "options": ("Gamescope:-W", "Gamescope:-H"),
+        "message": "Gamescope window width (-W) is set without a window height (-H)",
+    },
+    {
+        "type": REQUIRES,
+        "options": ("Gamescope:-w", "Gamescope:-h"),
+        "message": "Gamescope game width (-w) is set without a game height (-h)",
+    },
+]
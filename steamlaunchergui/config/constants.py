@@ -5,6 +5,26 @@ Constants used throughout the SteamLauncherGUI application.
 # File paths
 SETTINGS_FILE = "steam_launcher_settings.json"
 LOG_FILE = 'steam_launcher.log'
+SOFTWARE_CACHE_FILE = "~/.config/steamlaunchergui/software_cache.json"
+STEAM_LOCATIONS_FILE = "~/.config/steamlaunchergui/steam_locations.json"
+
+# How long cached software detection results stay valid (seconds)
+SOFTWARE_CACHE_TTL = 24 * 60 * 60
+
+# Delay before changed settings are written in write-behind mode; changes
+# made meanwhile are written together (seconds)
+SETTINGS_WRITE_DELAY = 1.0
+
+# When settings writes are synced to disk: on every write, only when
+# pending changes are flushed (e.g. at exit), or never
+FSYNC_ALWAYS = "always"
+FSYNC_ON_FLUSH = "flush"
+FSYNC_NEVER = "never"
+SETTINGS_FSYNC = FSYNC_ON_FLUSH
+
+# Size of the settings journal beyond which it is compacted into the
+# settings file (bytes)
+SETTINGS_JOURNAL_LIMIT = 64 * 1024
 
 # DirectX level presets
 DX_LEVEL_PRESETS = [
@@ -0,0 +1,330 @@
+"""
+Compiled option catalog for SteamLauncherGUI.
+
+The catalog is built once from the tab configurations and general option
+lists and provides constant-time lookups from an environment variable or
+command-line flag to the option it belongs to.
+"""
+
+import bisect
+import hashlib
+import logging
+import re
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .constants import GENERAL_INPUTS, GENERAL_OPTIONS
+from .tab_configs import TAB_CONFIGS
+
+logger = logging.getLogger(__name__)
+
+# Option kinds
+GENERAL_TOGGLE = "general_toggle"
+GENERAL_INPUT = "general_input"
+TAB_TOGGLE = "toggle"
+TAB_FLAG = "flag"
+TAB_INPUT = "input"
+TAB_DROPDOWN = "dropdown"
+TAB_SLIDER = "slider"
+
+# Search weights of the fields an option is indexed by
+SEARCH_WEIGHT_NAME = 3
+SEARCH_WEIGHT_LABEL = 2
+SEARCH_WEIGHT_TAB = 1
+
+_SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def _search_tokens(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric search tokens."""
+    return _SEARCH_TOKEN_RE.findall(text.lower())
+
+class OptionSpec(NamedTuple):
+    """A single configurable option."""
+    name: str
+    kind: str
+    tab: Optional[str]  # None for general options
+    description: str
+    index: int  # Stable position of the option within the catalog
+    meta: Mapping[str, Any] = MappingProxyType({})
+
+class TabSpec(NamedTuple):
+    """Command-level properties of a tab."""
+    name: str
+    command_prefix: Optional[str]
+    command_suffix: Optional[str]
+    software_requirement: Optional[str]
+
+class OptionCatalog:
+    """
+    Immutable, precompiled view of all known launch options.
+    
+    Options are split by kind so that a name used by more than one kind
+    (e.g. DXVK_HUD as both toggle and input, or -w as a general input and a
+    Gamescope input) resolves unambiguously.
+    """
+    
+    def __init__(self, tab_configs: Mapping[str, Any],
+                 general_options: Sequence[Tuple[str, str]],
+                 general_inputs: Sequence[Tuple[str, str, str]]):
+        """
+        Compile the catalog.
+        
+        Args:
+            tab_configs: Dictionary of tab configurations
+            general_options: General (flag-only) options as (flag, description)
+            general_inputs: General value options as (flag, description, placeholder)
+        """
+        options: List[OptionSpec] = []
+        general_toggles: Dict[str, OptionSpec] = {}
+        general_input_specs: Dict[str, OptionSpec] = {}
+        env_toggles: Dict[str, OptionSpec] = {}
+        flag_toggles: Dict[str, OptionSpec] = {}
+        inputs: Dict[str, OptionSpec] = {}
+        dropdowns: Dict[str, OptionSpec] = {}
+        sliders: Dict[str, OptionSpec] = {}
+        tabs: Dict[str, TabSpec] = {}
+        prefixes: Dict[str, str] = {}
+        
+        def add(target, name, kind, tab, description, meta=None):
+            spec = OptionSpec(name, kind, tab, description, len(options),
+                              MappingProxyType(dict(meta or {})))
+            options.append(spec)
+            # First definition wins, matching the order options are shown in
+            target.setdefault(name, spec)
+        
+        for flag, description in general_options:
+            add(general_toggles, flag, GENERAL_TOGGLE, None, description)
+        
+        for flag, description, placeholder in general_inputs:
+            add(general_input_specs, flag, GENERAL_INPUT, None, description,
+                {"placeholder": placeholder})
+        
+        for tab_name, config in tab_configs.items():
+            tab = TabSpec(
+                tab_name,
+                config.get("command_prefix"),
+                config.get("command_suffix"),
+                config.get("software_requirement"),
+            )
+            tabs[tab_name] = tab
+            if tab.command_prefix:
+                prefixes.setdefault(tab.command_prefix, tab_name)
+            
+            for option, description in config.get("toggles", []):
+                if option.startswith('-'):
+                    add(flag_toggles, option, TAB_FLAG, tab_name, description)
+                else:
+                    add(env_toggles, option, TAB_TOGGLE, tab_name, description)
+            
+            for option, description, placeholder in config.get("inputs", []):
+                add(inputs, option, TAB_INPUT, tab_name, description,
+                    {"placeholder": placeholder})
+            
+            for key, dropdown in config.get("dropdowns", {}).items():
+                add(dropdowns, key, TAB_DROPDOWN, tab_name,
+                    dropdown.get("tooltip", key), dropdown)
+            
+            for option, description, min_value, max_value in config.get("sliders", []):
+                add(sliders, option, TAB_SLIDER, tab_name, description,
+                    {"min": min_value, "max": max_value})
+        
+        self.options: Tuple[OptionSpec, ...] = tuple(options)
+        self.general_toggles: Mapping[str, OptionSpec] = MappingProxyType(general_toggles)
+        self.general_inputs: Mapping[str, OptionSpec] = MappingProxyType(general_input_specs)
+        self.env_toggles: Mapping[str, OptionSpec] = MappingProxyType(env_toggles)
+        self.flag_toggles: Mapping[str, OptionSpec] = MappingProxyType(flag_toggles)
+        self.inputs: Mapping[str, OptionSpec] = MappingProxyType(inputs)
+        self.dropdowns: Mapping[str, OptionSpec] = MappingProxyType(dropdowns)
+        self.sliders: Mapping[str, OptionSpec] = MappingProxyType(sliders)
+        self.tabs: Mapping[str, TabSpec] = MappingProxyType(tabs)
+        self.prefixes: Mapping[str, str] = MappingProxyType(prefixes)
+        self.suffixes: FrozenSet[str] = frozenset(
+            tab.command_suffix for tab in tabs.values() if tab.command_suffix
+        )
+        
+        by_name: Dict[str, List[OptionSpec]] = {}
+        by_key: Dict[Tuple[str, Optional[str], str], OptionSpec] = {}
+        for spec in options:
+            by_name.setdefault(spec.name, []).append(spec)
+            by_key.setdefault((spec.kind, spec.tab, spec.name), spec)
+        self._by_name: Mapping[str, Tuple[OptionSpec, ...]] = MappingProxyType(
+            {name: tuple(specs) for name, specs in by_name.items()}
+        )
+        self._by_key: Mapping[Tuple[str, Optional[str], str], OptionSpec] = MappingProxyType(by_key)
+        
+        # Identifies the option indices, for encodings that store them
+        digest = hashlib.blake2b(digest_size=8)
+        for spec in options:
+            digest.update(f"{spec.kind}\0{spec.tab or ''}\0{spec.name}\n".encode())
+        for tab_name in tabs:
+            digest.update(f"tab\0{tab_name}\n".encode())
+        self.fingerprint: bytes = digest.digest()
+        
+        # Inverted index for search: token -> {option index: field weight}
+        postings: Dict[str, Dict[int, int]] = {}
+        for spec in options:
+            fields = [(spec.name, SEARCH_WEIGHT_NAME),
+                      (spec.description, SEARCH_WEIGHT_LABEL),
+                      (spec.tab or "General", SEARCH_WEIGHT_TAB)]
+            for key in ("label", "tooltip"):
+                if isinstance(spec.meta.get(key), str):
+                    fields.append((spec.meta[key], SEARCH_WEIGHT_LABEL))
+            for text, weight in fields:
+                for token in _search_tokens(text):
+                    entry = postings.setdefault(token, {})
+                    if entry.get(spec.index, 0) < weight:
+                        entry[spec.index] = weight
+        self._search_vocabulary: Tuple[str, ...] = tuple(sorted(postings))
+        self._search_postings: Mapping[str, Mapping[int, int]] = MappingProxyType(
+            {token: MappingProxyType(entry) for token, entry in postings.items()}
+        )
+        
+        logger.debug(f"Compiled option catalog with {len(options)} options")
+    
+    def __len__(self) -> int:
+        return len(self.options)
+    
+    def lookup(self, name: str) -> Tuple[OptionSpec, ...]:
+        """
+        Get every option defined under a name.
+        
+        Args:
+            name: Environment variable or flag
+            
+        Returns:
+            Tuple[OptionSpec, ...]: Matching options, empty if unknown
+        """
+        return self._by_name.get(name, ())
+    
+    def find(self, name: str, kind: str, tab: Optional[str] = None) -> Optional[OptionSpec]:
+        """
+        Get the option of a given kind defined under a name.
+        
+        Args:
+            name: Environment variable or flag
+            kind: Option kind, e.g. TAB_INPUT
+            tab: Tab the option belongs to, or None for general options
+            
+        Returns:
+            OptionSpec or None: The option, or None if unknown
+        """
+        return self._by_key.get((kind, tab, name))
+    
+    def describe(self, name: str, tab: Optional[str] = None) -> str:
+        """
+        Get the description of an option.
+        
+        Args:
+            name: Environment variable or flag
+            tab: Tab to prefer when the name is defined more than once,
+                or None for general options
+            
+        Returns:
+            str: The description, or the name itself if unknown
+        """
+        specs = self.lookup(name)
+        for spec in specs:
+            if spec.tab == tab:
+                return spec.description
+        return specs[0].description if specs else name
+    
+    def search(self, query: str, limit: int = 20) -> List[OptionSpec]:
+        """
+        Find options by name, label, tooltip or tab.
+        
+        Every word of the query must be the start of a word in one of these
+        fields, so "dxvk lat" finds DXVK_MAX_FRAME_LATENCY. Matches in the
+        name rank above matches in the label, which rank above the tab.
+        
+        Args:
+            query: Search text
+            limit: Maximum number of results
+            
+        Returns:
+            List[OptionSpec]: Matching options, best first
+        """
+        terms = _search_tokens(query)
+        if not terms:
+            return []
+        
+        vocabulary = self._search_vocabulary
+        scores: Optional[Dict[int, int]] = None
+        for term in terms:
+            term_scores: Dict[int, int] = {}
+            position = bisect.bisect_left(vocabulary, term)
+            while position < len(vocabulary) and vocabulary[position].startswith(term):
+                token = vocabulary[position]
+                # Whole words count double
+                factor = 2 if token == term else 1
+                for index, weight in self._search_postings[token].items():
+                    if term_scores.get(index, 0) < weight * factor:
+                        term_scores[index] = weight * factor
+                position += 1
+            
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {index: score + term_scores[index]
+                          for index, score in scores.items() if index in term_scores}
+            if not scores:
+                return []
+        
+        # The exact name, whatever its punctuation, always comes first
+        joined = "".join(terms)
+        for index in scores:
+            if "".join(_search_tokens(self.options[index].name)) == joined:
+                scores[index] += 100
+        
+        ranked = sorted(scores, key=lambda index: (-scores[index], index))
+        return [self.options[index] for index in ranked[:limit]]
+
+_catalogs: Dict[Tuple[int, int, int], Tuple[Any, OptionCatalog]] = {}
+_catalogs_lock = threading.Lock()
+_default_catalog: Optional[OptionCatalog] = None
+
+def get_option_catalog(tab_configs: Optional[Mapping[str, Any]] = None,
+                       general_options: Optional[Sequence[Tuple[str, str]]] = None,
+                       general_inputs: Optional[Sequence[Tuple[str, str, str]]] = None) -> OptionCatalog:
+    """
+    Get the compiled catalog for a set of option definitions.
+    
+    Catalogs are compiled on first use and shared afterwards. Option
+    definitions are treated as constant once a catalog has been built.
+    
+    Args:
+        tab_configs: Tab configurations, defaults to TAB_CONFIGS
+        general_options: General options, defaults to GENERAL_OPTIONS
+        general_inputs: General inputs, defaults to GENERAL_INPUTS
+        
+    Returns:
+        OptionCatalog: The compiled catalog
+    """
+    global _default_catalog
+    if (tab_configs is None or tab_configs is TAB_CONFIGS) \
+            and general_options is None and general_inputs is None:
+        if _default_catalog is None:
+            _default_catalog = _get_catalog(TAB_CONFIGS, GENERAL_OPTIONS, GENERAL_INPUTS)
+        return _default_catalog
+    
+    return _get_catalog(tab_configs, general_options, general_inputs)
+
+def _get_catalog(tab_configs, general_options, general_inputs) -> OptionCatalog:
+    """Get or compile the catalog for explicit option definitions."""
+    sources = (
+        TAB_CONFIGS if tab_configs is None else tab_configs,
+        GENERAL_OPTIONS if general_options is None else general_options,
+        GENERAL_INPUTS if general_inputs is None else general_inputs,
+    )
+    key = tuple(id(source) for source in sources)
+    
+    entry = _catalogs.get(key)
+    if entry is None:
+        with _catalogs_lock:
+            entry = _catalogs.get(key)
+            if entry is None:
+                # Keep the sources alive so their ids cannot be reused
+                entry = (sources, OptionCatalog(*sources))
+                _catalogs[key] = entry
+    
+    return entry[1]
@@ -7,13 +7,14 @@ import sys
 import os
 import logging
 import argparse
+import signal
 import traceback
 from pathlib import Path
 
 import gi
 try:
     gi.require_version("Gtk", "3.0")
-    from gi.repository import Gtk
+    from gi.repository import GLib, Gtk
 except ValueError as e:
     print(f"Error importing GTK 3.0: {e}")
     print("Please ensure you have the GTK 3.0 development libraries installed.")
@@ -33,8 +34,146 @@ def parse_arguments():
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     parser.add_argument('--log-file', help='Path to log file')
     parser.add_argument('--no-log-file', action='store_true', help='Disable logging to file')
+    parser.add_argument('--audit', action='store_true',
+                        help='Check the launch options of all installed games for conflicts and exit')
+    parser.add_argument('--profile-report', action='store_true',
+                        help='Show the closest saved profile for each installed game and exit')
+    parser.add_argument('--migrate-profiles', action='store_true',
+                        help='Copy the JSON profiles into the profile database, use it from now on and exit')
     return parser.parse_args()
 
+def find_games():
+    """
+    Find the games of every detected Steam installation.
+    
+    Returns:
+        List[SteamGame]: Games sorted by name, without duplicates
+    """
+    from steamlaunchergui.models import SteamGame
+    from steamlaunchergui.utils import detect_steam_installs
+    
+    games = {}
+    for install in detect_steam_installs():
+        for game in SteamGame.find_steam_games(install.path):
+            games.setdefault(game.app_id, game)
+    return sorted(games.values(), key=lambda game: game.name.lower())
+
+def run_audit():
+    """
+    Print conflict warnings for the launch options of every installed game.
+    
+    Returns:
+        int: Exit code, 1 if any game has warnings
+    """
+    from steamlaunchergui.config import TAB_CONFIGS
+    from steamlaunchergui.models import LaunchOptions
+    from steamlaunchergui.utils.rule_engine import get_rule_engine
+    
+    engine = get_rule_engine()
+    games = find_games()
+    
+    flagged = 0
+    for game in games:
+        if not game.launch_options:
+            continue
+        
+        launch_options = LaunchOptions()
+        try:
+            launch_options.parse_command(game.launch_options, TAB_CONFIGS)
+        except ValueError as e:
+            print(f"{game.name} ({game.app_id}): cannot parse launch options: {e}")
+            flagged += 1
+            continue
+        
+        warnings = engine.evaluate(launch_options.effective_options())
+        if warnings:
+            flagged += 1
+            print(f"{game.name} ({game.app_id}): {game.launch_options}")
+            for warning in warnings:
+                print(f"  - {warning}")
+    
+    print(f"Checked {len(games)} games against {len(engine)} rules, {flagged} with warnings")
+    return 1 if flagged else 0
+
+def run_profile_report(threshold=0.5):
+    """
+    Print the closest saved profile of every installed game.
+    
+    Games whose options are close to, but not the same as, a profile are
+    listed with the options that drifted from it.
+    
+    Args:
+        threshold: Minimum similarity for a profile to count as a match
+        
+    Returns:
+        int: Exit code
+    """
+    from steamlaunchergui.config import TAB_CONFIGS, ConfigManager
+    from steamlaunchergui.models import LaunchOptions
+    from steamlaunchergui.models.profile_db import open_profile_manager
+    from steamlaunchergui.models.profile_index import describe_differences
+    
+    profile_manager = open_profile_manager(
+        ConfigManager().get_setting("profile_storage", "json")
+    )
+    index = profile_manager.index
+    matched = drifted = unmatched = 0
+    
+    for game in find_games():
+        if not game.launch_options:
+            continue
+        
+        launch_options = LaunchOptions()
+        try:
+            launch_options.parse_command(game.launch_options, TAB_CONFIGS)
+        except ValueError as e:
+            print(f"{game.name} ({game.app_id}): cannot parse launch options: {e}")
+            continue
+        
+        match = index.best_match(launch_options, threshold)
+        if match is None:
+            unmatched += 1
+            print(f"{game.name} ({game.app_id}): no similar profile")
+        elif match.score >= 1.0:
+            matched += 1
+            print(f"{game.name} ({game.app_id}): matches {match.profile.name}")
+        else:
+            drifted += 1
+            differences = describe_differences(
+                launch_options.snapshot(), match.profile.snapshot()
+            )
+            print(f"{game.name} ({game.app_id}): drifted from {match.profile.name} "
+                  f"({match.score:.0%}): {' '.join(differences)}")
+    
+    print(f"{len(index)} profiles: {matched} games match, {drifted} drifted, "
+          f"{unmatched} without a similar profile")
+    return 0
+
+def run_profile_migration():
+    """
+    Copy the JSON profiles into the profile database and switch to it.
+    
+    Returns:
+        int: Exit code
+    """
+    from steamlaunchergui.config import ConfigManager
+    from steamlaunchergui.models.profile_db import migrate_profiles
+    
+    profile_manager = migrate_profiles()
+    print(f"Profile database {profile_manager.database} holds {len(profile_manager.profiles)} profiles")
+    profile_manager.close()
+    
+    if not ConfigManager().set_setting("profile_storage", "sqlite"):
+        print("Could not save the profile storage setting")
+        return 1
+    return 0
+
+def on_terminate(window):
+    """Close the main window when the process is asked to terminate."""
+    logging.info("Received SIGTERM, closing")
+    window.destroy()
+    return GLib.SOURCE_REMOVE
+
 def main():
     """Main entry point for the application."""
     print("Starting Steam Launcher GUI...")
@@ -62,10 +201,20 @@ def main():
         print(f"Warning: Failed to set up logging: {e}")
         traceback.print_exc()
     
+    if args.audit:
+        return run_audit()
+    if args.profile_report:
+        return run_profile_report()
+    if args.migrate_profiles:
+        return run_profile_migration()
+    
     # Create and display the main window
     try:
         window = SteamLauncherWindow()
         window.show_all()
+        
+        # Close the window on SIGTERM so pending settings are written
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGTERM, on_terminate, window)
         Gtk.main()
     except Exception as e:
         logging.error(f"Application error: {e}")
@@ -7,4 +7,6 @@ separate from the UI presentation.
 
 from .launch_options import LaunchOptions
 from .steam_game import SteamGame
-from .profiles import Profile, ProfileManager 
\ No newline at end of file
+from .profiles import Profile, ProfileManager
+from .command_tree import CommandTree
+from .compact_options import CompactOptions 
\ No newline at end of file
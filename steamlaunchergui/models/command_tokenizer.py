@@ -0,0 +1,156 @@
+"""
+Launch string tokenizer for SteamLauncherGUI.
+
+Splits a Steam launch options string in a single regex-driven pass and
+classifies every word by its role in the command, keeping the source span
+of each token so callers can map tokens back onto the original text.
+"""
+
+import re
+import logging
+from typing import Container, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.config.option_catalog import get_option_catalog
+
+logger = logging.getLogger(__name__)
+
+# Token kinds
+ENV = "env"                # VAR=value assignment before the game command
+WRAPPER = "wrapper"        # Wrapper command such as mangohud or gamescope
+SEPARATOR = "separator"    # End of wrapper arguments, e.g. gamescope's --
+COMMAND = "command"        # The %command% placeholder
+ARG = "arg"                # Any other word before %command%
+GAME_ARG = "game_arg"      # Words after %command%, passed to the game
+
+COMMAND_PLACEHOLDER = "%command%"
+
+# A shell word: unquoted runs, backslash escapes and quoted sections
+_WORD_RE = re.compile(r'''(?:[^\s'"\\]+|\\.|'[^']*'|"(?:[^"\\]|\\.)*")+''', re.S)
+_QUOTED_RE = re.compile(r''''([^']*)'|"((?:[^"\\]|\\.)*)"|\\(.)''', re.S)
+_DOUBLE_QUOTE_ESCAPE_RE = re.compile(r'\\([\\"$`])')
+_ENV_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*=')
+
+class Token(NamedTuple):
+    """A classified word of a launch string."""
+    kind: str
+    text: str     # Source text of the token, including quotes
+    value: str    # Unquoted value (the assigned value for ENV tokens)
+    start: int    # Offset of the first character in the source
+    end: int      # Offset just past the last character
+    name: Optional[str] = None  # Variable name for ENV tokens
+
+def unquote(text: str) -> str:
+    """
+    Remove shell quoting from a single word.
+    
+    Args:
+        text: Source text of the word
+        
+    Returns:
+        str: The word as the shell would pass it
+    """
+    if "'" not in text and '"' not in text and '\\' not in text:
+        return text
+    
+    def replace(match):
+        single, double, escaped = match.groups()
+        if single is not None:
+            return single
+        if double is not None:
+            return _DOUBLE_QUOTE_ESCAPE_RE.sub(r'\1', double)
+        return escaped
+    
+    return _QUOTED_RE.sub(replace, text)
+
+def split_words(command: str) -> List[re.Match]:
+    """
+    Split a command into shell words.
+    
+    Args:
+        command: The command string
+        
+    Returns:
+        List[re.Match]: One match per word, spanning its source text
+        
+    Raises:
+        ValueError: If the command contains an unterminated quote or escape
+    """
+    matches = []
+    position = 0
+    
+    for match in _WORD_RE.finditer(command):
+        gap = command[position:match.start()]
+        if gap and not gap.isspace():
+            raise ValueError("No closing quotation")
+        matches.append(match)
+        position = match.end()
+    
+    if command[position:].strip():
+        raise ValueError("No closing quotation")
+    
+    return matches
+
+def tokenize(command: str, wrappers: Optional[Container[str]] = None,
+             separators: Optional[Container[str]] = None) -> List[Token]:
+    """
+    Tokenize a Steam launch options string.
+    
+    Args:
+        command: The launch options string
+        wrappers: Wrapper command names, defaults to the tab command prefixes
+        separators: Wrapper argument terminators, defaults to the tab command suffixes
+        
+    Returns:
+        List[Token]: Tokens in source order
+        
+    Raises:
+        ValueError: If the command contains an unterminated quote or escape
+    """
+    if wrappers is None or separators is None:
+        catalog = get_option_catalog()
+        wrappers = catalog.prefixes if wrappers is None else wrappers
+        separators = catalog.suffixes if separators is None else separators
+    
+    tokens = []
+    after_command = False
+    
+    for match in split_words(command):
+        text = match.group()
+        kind, value, name = classify_word(text, after_command, wrappers, separators)
+        if kind == COMMAND:
+            after_command = True
+        tokens.append(Token(kind, text, value, match.start(), match.end(), name))
+    
+    return tokens
+
+def classify_word(text: str, after_command: bool, wrappers: Container[str],
+                  separators: Container[str]) -> Tuple[str, str, Optional[str]]:
+    """
+    Classify a single shell word of a launch string.
+    
+    Args:
+        text: Source text of the word
+        after_command: Whether the word follows the %command% placeholder
+        wrappers: Wrapper command names
+        separators: Wrapper argument terminators
+        
+    Returns:
+        Tuple[str, str, Optional[str]]: Token kind, unquoted value and
+            variable name (ENV tokens only)
+    """
+    if after_command:
+        return GAME_ARG, unquote(text), None
+    
+    if text == COMMAND_PLACEHOLDER:
+        return COMMAND, text, None
+    
+    env = _ENV_RE.match(text)
+    if env:
+        return ENV, unquote(text[env.end():]), text[:env.end() - 1]
+    
+    value = unquote(text)
+    if value in wrappers:
+        return WRAPPER, value, None
+    if value in separators:
+        return SEPARATOR, value, None
+    return ARG, value, None
@@ -0,0 +1,220 @@
+"""
+Concrete syntax tree for Steam launch strings.
+
+The tree keeps every word of a launch string together with the whitespace
+in front of it, so unknown words, ordering and quoting survive a round trip
+unchanged. Edits are applied incrementally: only the words touching the
+edited range are re-tokenized.
+"""
+
+import logging
+from bisect import bisect_right
+from typing import Container, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.config.option_catalog import get_option_catalog
+from steamlaunchergui.models.command_tokenizer import (
+    COMMAND, Token, classify_word, split_words
+)
+
+logger = logging.getLogger(__name__)
+
+class Node(NamedTuple):
+    """A word of a launch string and the whitespace preceding it."""
+    kind: str
+    space: str
+    text: str
+    value: str
+    name: Optional[str] = None
+
+class CommandTree:
+    """
+    Lossless, incrementally editable representation of a launch string.
+    
+    Node offsets are computed lazily from the front and only invalidated
+    behind an edit, so a run of edits around the cursor costs time
+    proportional to the edited words rather than to the whole string.
+    """
+    
+    def __init__(self, source: str = "", wrappers: Optional[Container[str]] = None,
+                 separators: Optional[Container[str]] = None):
+        """
+        Parse a launch string into a tree.
+        
+        Args:
+            source: The launch string
+            wrappers: Wrapper command names, defaults to the tab command prefixes
+            separators: Wrapper argument terminators, defaults to the tab command suffixes
+        """
+        if wrappers is None or separators is None:
+            catalog = get_option_catalog()
+            wrappers = catalog.prefixes if wrappers is None else wrappers
+            separators = catalog.suffixes if separators is None else separators
+        self._wrappers = wrappers
+        self._separators = separators
+        
+        self.nodes: List[Node] = []
+        self.trailing = ""
+        self.error: Optional[str] = None
+        self._source = ""
+        self._starts: List[int] = []
+        self._valid = 0
+        self._command_index: Optional[int] = None
+        
+        self.reset(source)
+    
+    @property
+    def source(self) -> str:
+        """The launch string the tree represents."""
+        return self._source
+    
+    def __str__(self) -> str:
+        return self._source
+    
+    def reset(self, source: str) -> None:
+        """
+        Replace the whole tree with a fresh parse.
+        
+        A string with an unterminated quote leaves the tree empty with
+        `error` set; the next edit retries the parse.
+        
+        Args:
+            source: The new launch string
+        """
+        self._source = source
+        self.error = None
+        try:
+            self.nodes, self.trailing = self._parse(source, False)
+        except ValueError as e:
+            self.nodes, self.trailing = [], ""
+            self.error = str(e)
+        self._starts = [0] * len(self.nodes)
+        self._valid = 0
+        self._command_index = next(
+            (i for i, node in enumerate(self.nodes) if node.kind == COMMAND), None
+        )
+    
+    def tokens(self) -> List[Token]:
+        """
+        Get the words of the tree as tokens with absolute source spans.
+        
+        Returns:
+            List[Token]: Tokens in source order
+        """
+        tokens = []
+        position = 0
+        for node in self.nodes:
+            start = position + len(node.space)
+            position = start + len(node.text)
+            tokens.append(Token(node.kind, node.text, node.value, start, position, node.name))
+        return tokens
+    
+    def edit(self, start: int, end: int, text: str) -> Optional[Tuple[int, int]]:
+        """
+        Replace a range of the source and re-parse only the words it touches.
+        
+        Args:
+            start: Offset of the first replaced character
+            end: Offset just past the last replaced character
+            text: Replacement text
+            
+        Returns:
+            Tuple[int, int] or None: Range of node indices that changed, or
+                None if the whole tree was re-parsed
+        """
+        source = self._source[:start] + text + self._source[end:]
+        
+        if self.error is not None or not self.nodes:
+            self.reset(source)
+            return None
+        
+        first = max(0, self._locate(start) - 1)
+        last = self._locate(end) + 1
+        changed = self._reparse(first, last, start, end, text)
+        if changed is None:
+            self.reset(source)
+            return None
+        
+        self._source = source
+        return changed
+    
+    def _reparse(self, first, last, start, end, text):
+        """Re-tokenize nodes[first:last] with the edit applied."""
+        if self._command_index is not None and first <= self._command_index < last:
+            # Removing %command% reclassifies everything after it
+            return None
+        
+        after_command = self._command_index is not None and self._command_index < first
+        region_start = self._offset(first)
+        
+        while True:
+            if last < len(self.nodes):
+                region_end = self._offset(last)
+            else:
+                region_end = len(self._source)
+            region = (self._source[region_start:start] + text
+                      + self._source[end:region_end])
+            try:
+                nodes, trailing = self._parse(region, after_command)
+                break
+            except ValueError:
+                if last >= len(self.nodes):
+                    return None
+                # An opened quote may swallow the rest of the string
+                last = len(self.nodes)
+        
+        if not after_command and any(node.kind == COMMAND for node in nodes):
+            return None
+        
+        if self._command_index is not None and self._command_index >= last:
+            self._command_index += len(nodes) - (last - first)
+        
+        if last < len(self.nodes):
+            following = self.nodes[last]
+            nodes.append(following._replace(space=trailing + following.space))
+            last += 1
+        else:
+            self.trailing = trailing
+        
+        self.nodes[first:last] = nodes
+        self._starts[first:last] = [0] * len(nodes)
+        self._valid = min(self._valid, first)
+        
+        return first, first + len(nodes)
+    
+    def _parse(self, source, after_command):
+        """Split source into nodes, returning them and the trailing whitespace."""
+        nodes = []
+        position = 0
+        for match in split_words(source):
+            word = match.group()
+            kind, value, name = classify_word(
+                word, after_command, self._wrappers, self._separators
+            )
+            if kind == COMMAND:
+                after_command = True
+            nodes.append(Node(kind, source[position:match.start()], word, value, name))
+            position = match.end()
+        return nodes, source[position:]
+    
+    def _offset(self, index):
+        """Get the source offset of a node, including its leading whitespace."""
+        self._extend_offsets(lambda: self._valid <= index)
+        return self._starts[index]
+    
+    def _locate(self, position):
+        """Get the index of the node covering a source offset."""
+        self._extend_offsets(lambda: self._starts[self._valid - 1] <= position)
+        return max(0, bisect_right(self._starts, position, 0, self._valid) - 1)
+    
+    def _extend_offsets(self, needed):
+        """Compute node offsets from the front until needed() is false."""
+        nodes = self.nodes
+        while self._valid < len(nodes) and (self._valid == 0 or needed()):
+            index = self._valid
+            if index == 0:
+                self._starts[0] = 0
+            else:
+                previous = nodes[index - 1]
+                self._starts[index] = (self._starts[index - 1]
+                                       + len(previous.space) + len(previous.text))
+            self._valid += 1
@@ -0,0 +1,424 @@
+"""
+Compact, immutable encoding of launch options.
+
+Options are stored by their OptionCatalog index: toggles and enabled tabs
+as integer bitsets, values as small sorted tuples of (index, value) pairs.
+Two option sets can then be hashed and compared with a few integer and
+tuple operations, and serialized to a canonical byte string.
+"""
+
+import struct
+import logging
+from typing import Any, List, Optional, Tuple
+
+from steamlaunchergui.config.option_catalog import (
+    GENERAL_INPUT, GENERAL_TOGGLE, TAB_DROPDOWN, TAB_FLAG, TAB_INPUT, TAB_SLIDER,
+    TAB_TOGGLE, OptionCatalog, get_option_catalog
+)
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes of the binary serialization
+MAGIC = b"SLO1"
+
+# Fields of options that are not in the catalog, see CompactOptions.extra
+_EXTRA_FIELDS = (
+    "general_toggles", "general_inputs", "general_dropdowns", "tab_enabled",
+    "tab_toggles", "tab_inputs", "tab_dropdowns", "tab_sliders",
+)
+_BOOL_FIELDS = frozenset({"general_toggles", "tab_enabled", "tab_toggles"})
+_DOUBLE = struct.Struct("<d")
+
+class CompactOptions:
+    """
+    Immutable launch options keyed by option catalog indices.
+    
+    Disabled toggles, empty values and zero sliders are not stored, so two
+    option sets that differ only in unset options compare equal. Options of
+    a disabled tab are kept, so that enabling the tab again restores them;
+    option sets can therefore differ while generating the same command.
+    Options the catalog does not know are kept in `extra` so no setting is
+    lost.
+    """
+    
+    __slots__ = ("catalog", "toggles", "tabs", "inputs", "dropdowns", "sliders",
+                 "extra", "extra_env", "game_args", "_hash")
+    
+    def __init__(self, catalog: OptionCatalog, toggles: int = 0, tabs: int = 0,
+                 inputs: Tuple[Tuple[int, str], ...] = (),
+                 dropdowns: Tuple[Tuple[int, str], ...] = (),
+                 sliders: Tuple[Tuple[int, float], ...] = (),
+                 extra: Tuple[Tuple[str, str, str, Any], ...] = (),
+                 extra_env: Tuple[str, ...] = (),
+                 game_args: Tuple[str, ...] = ()):
+        """
+        Initialize the options. Use from_launch_options or from_bytes
+        rather than calling this directly.
+        
+        Args:
+            catalog: Catalog the indices refer to
+            toggles: Bitset of enabled toggle options
+            tabs: Bitset of enabled tabs, by position in catalog.tabs
+            inputs: Sorted (option index, value) pairs of input options
+            dropdowns: Sorted (option index, value) pairs of dropdowns
+            sliders: Sorted (option index, value) pairs of sliders
+            extra: Sorted (field, section, option, value) entries of
+                options unknown to the catalog
+            extra_env: Unknown environment assignments
+            game_args: Arguments passed to the game
+        """
+        self.catalog = catalog
+        self.toggles = toggles
+        self.tabs = tabs
+        self.inputs = inputs
+        self.dropdowns = dropdowns
+        self.sliders = sliders
+        self.extra = extra
+        self.extra_env = extra_env
+        self.game_args = game_args
+        self._hash = None
+    
+    def _key(self):
+        return (self.toggles, self.tabs, self.inputs, self.dropdowns, self.sliders,
+                self.extra, self.extra_env, self.game_args)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactOptions):
+            return NotImplemented
+        if self is other:
+            return True
+        return (self.toggles == other.toggles and self.tabs == other.tabs
+                and self.catalog.fingerprint == other.catalog.fingerprint
+                and self._key() == other._key())
+    
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._key())
+        return self._hash
+    
+    def __repr__(self) -> str:
+        return (f"CompactOptions(toggles={bin(self.toggles).count('1')}, "
+                f"tabs={bin(self.tabs).count('1')}, inputs={len(self.inputs)}, "
+                f"dropdowns={len(self.dropdowns)}, sliders={len(self.sliders)}, "
+                f"extra={len(self.extra)})")
+    
+    @classmethod
+    def from_launch_options(cls, launch_options, catalog: Optional[OptionCatalog] = None) -> 'CompactOptions':
+        """
+        Encode a LaunchOptions model.
+        
+        Args:
+            launch_options: The model
+            catalog: Catalog to index options by, defaults to the built-in one
+            
+        Returns:
+            CompactOptions: The encoded options
+        """
+        catalog = catalog or get_option_catalog()
+        tab_positions = {name: position for position, name in enumerate(catalog.tabs)}
+        toggles = 0
+        tabs = 0
+        inputs = []
+        dropdowns = []
+        sliders = []
+        extra = []
+        
+        for option, enabled in launch_options.general_toggles.items():
+            if enabled:
+                spec = catalog.find(option, GENERAL_TOGGLE)
+                if spec:
+                    toggles |= 1 << spec.index
+                else:
+                    extra.append(("general_toggles", "", option, True))
+        
+        for field, target in (("general_inputs", inputs), ("general_dropdowns", dropdowns)):
+            for option, value in getattr(launch_options, field).items():
+                if value:
+                    # Values are text; hand-edited profiles may hold numbers
+                    value = str(value)
+                    spec = catalog.find(option, GENERAL_INPUT)
+                    if spec:
+                        target.append((spec.index, value))
+                    else:
+                        extra.append((field, "", option, value))
+        
+        for tab_name, enabled in launch_options.tab_enabled.items():
+            if enabled:
+                if tab_name in tab_positions:
+                    tabs |= 1 << tab_positions[tab_name]
+                else:
+                    extra.append(("tab_enabled", tab_name, "", True))
+        
+        for tab_name, options in launch_options.tab_toggles.items():
+            for option, enabled in options.items():
+                if enabled:
+                    kind = TAB_FLAG if option.startswith('-') else TAB_TOGGLE
+                    spec = catalog.find(option, kind, tab_name)
+                    if spec:
+                        toggles |= 1 << spec.index
+                    else:
+                        extra.append(("tab_toggles", tab_name, option, True))
+        
+        for field, kind, target in (("tab_inputs", TAB_INPUT, inputs),
+                                    ("tab_dropdowns", TAB_DROPDOWN, dropdowns),
+                                    ("tab_sliders", TAB_SLIDER, sliders)):
+            for tab_name, options in getattr(launch_options, field).items():
+                for option, value in options.items():
+                    if not value:
+                        continue
+                    if kind == TAB_SLIDER:
+                        value = float(value)
+                    else:
+                        value = str(value)
+                    spec = catalog.find(option, kind, tab_name)
+                    if spec:
+                        target.append((spec.index, value))
+                    else:
+                        extra.append((field, tab_name, option, value))
+        
+        return cls(
+            catalog, toggles, tabs, tuple(sorted(inputs)), tuple(sorted(dropdowns)),
+            tuple(sorted(sliders)), tuple(sorted(extra, key=_extra_key)),
+            tuple(launch_options.extra_env), tuple(launch_options.game_args),
+        )
+    
+    def to_launch_options(self):
+        """
+        Decode into a new LaunchOptions model.
+        
+        Returns:
+            LaunchOptions: The decoded model
+        """
+        from steamlaunchergui.models.launch_options import LaunchOptions
+        
+        launch_options = LaunchOptions()
+        options = self.catalog.options
+        tab_names = list(self.catalog.tabs)
+        
+        toggles = self.toggles
+        while toggles:
+            bit = toggles & -toggles
+            spec = options[bit.bit_length() - 1]
+            if spec.tab is None:
+                launch_options.general_toggles[spec.name] = True
+            else:
+                launch_options._ensure_tab_toggles(spec.tab)[spec.name] = True
+            toggles ^= bit
+        
+        for position, tab_name in enumerate(tab_names):
+            if self.tabs >> position & 1:
+                launch_options.tab_enabled[tab_name] = True
+        
+        for index, value in self.inputs:
+            spec = options[index]
+            if spec.tab is None:
+                launch_options.general_inputs[spec.name] = value
+            else:
+                launch_options._ensure_tab_inputs(spec.tab)[spec.name] = value
+        
+        for index, value in self.dropdowns:
+            spec = options[index]
+            if spec.tab is None:
+                launch_options.general_dropdowns[spec.name] = value
+            else:
+                launch_options._ensure_tab_dropdowns(spec.tab)[spec.name] = value
+        
+        for index, value in self.sliders:
+            spec = options[index]
+            launch_options._ensure_tab_sliders(spec.tab)[spec.name] = value
+        
+        for field, section, option, value in self.extra:
+            target = getattr(launch_options, field)
+            if field == "tab_enabled":
+                target[section] = value
+            elif field.startswith("general_"):
+                target[option] = value
+            else:
+                target.setdefault(section, {})[option] = value
+        
+        launch_options.extra_env = list(self.extra_env)
+        launch_options.game_args = list(self.game_args)
+        launch_options.invalidate()
+        return launch_options
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to a canonical byte string.
+        
+        Equal options always serialize to the same bytes. The catalog
+        fingerprint is included, so bytes are only decoded against the
+        catalog they were written with.
+        
+        Returns:
+            bytes: The serialized options
+        """
+        out = bytearray(MAGIC)
+        out += self.catalog.fingerprint
+        _write_int(out, self.toggles)
+        _write_int(out, self.tabs)
+        
+        for pairs in (self.inputs, self.dropdowns):
+            _write_uint(out, len(pairs))
+            for index, value in pairs:
+                _write_uint(out, index)
+                _write_str(out, value)
+        
+        _write_uint(out, len(self.sliders))
+        for index, value in self.sliders:
+            _write_uint(out, index)
+            out += _DOUBLE.pack(value)
+        
+        _write_uint(out, len(self.extra))
+        for field, section, option, value in self.extra:
+            _write_uint(out, _EXTRA_FIELDS.index(field))
+            _write_str(out, section)
+            _write_str(out, option)
+            if field in _BOOL_FIELDS:
+                out.append(1 if value else 0)
+            elif field == "tab_sliders":
+                out += _DOUBLE.pack(value)
+            else:
+                _write_str(out, value)
+        
+        for words in (self.extra_env, self.game_args):
+            _write_uint(out, len(words))
+            for word in words:
+                _write_str(out, word)
+        
+        return bytes(out)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, catalog: Optional[OptionCatalog] = None) -> 'CompactOptions':
+        """
+        Deserialize options written by to_bytes.
+        
+        Args:
+            data: The serialized options
+            catalog: Catalog the options were written with, defaults to
+                the built-in one
+            
+        Returns:
+            CompactOptions: The options
+            
+        Raises:
+            ValueError: If the data is malformed or was written with a
+                different catalog
+        """
+        catalog = catalog or get_option_catalog()
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a serialized launch options record")
+        position = len(MAGIC)
+        if data[position:position + 8] != catalog.fingerprint:
+            raise ValueError("Launch options were serialized with a different option catalog")
+        position += 8
+        
+        try:
+            toggles, position = _read_int(data, position)
+            tabs, position = _read_int(data, position)
+            
+            pair_lists: List[Tuple[Tuple[int, str], ...]] = []
+            for _ in range(2):
+                count, position = _read_uint(data, position)
+                pairs = []
+                for _ in range(count):
+                    index, position = _read_uint(data, position)
+                    value, position = _read_str(data, position)
+                    pairs.append((index, value))
+                pair_lists.append(tuple(pairs))
+            
+            count, position = _read_uint(data, position)
+            sliders = []
+            for _ in range(count):
+                index, position = _read_uint(data, position)
+                sliders.append((index, _DOUBLE.unpack_from(data, position)[0]))
+                position += _DOUBLE.size
+            
+            count, position = _read_uint(data, position)
+            extra = []
+            for _ in range(count):
+                field_index, position = _read_uint(data, position)
+                field = _EXTRA_FIELDS[field_index]
+                section, position = _read_str(data, position)
+                option, position = _read_str(data, position)
+                if field in _BOOL_FIELDS:
+                    value = bool(data[position])
+                    position += 1
+                elif field == "tab_sliders":
+                    value = _DOUBLE.unpack_from(data, position)[0]
+                    position += _DOUBLE.size
+                else:
+                    value, position = _read_str(data, position)
+                extra.append((field, section, option, value))
+            
+            word_lists = []
+            for _ in range(2):
+                count, position = _read_uint(data, position)
+                words = []
+                for _ in range(count):
+                    word, position = _read_str(data, position)
+                    words.append(word)
+                word_lists.append(tuple(words))
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Truncated or corrupt launch options record: {e}") from e
+        
+        if position != len(data):
+            raise ValueError("Trailing data after launch options record")
+        
+        if toggles >> len(catalog.options) or tabs >> len(catalog.tabs) or any(
+            index >= len(catalog.options)
+            for pairs in (*pair_lists, sliders) for index, _ in pairs
+        ):
+            raise ValueError("Launch options record refers to unknown options")
+        
+        return cls(catalog, toggles, tabs, pair_lists[0], pair_lists[1], tuple(sliders),
+                   tuple(extra), word_lists[0], word_lists[1])
+
+def _extra_key(entry):
+    """Sort key of extra entries, whose values may be of mixed types."""
+    field, section, option, value = entry
+    return field, section, option, str(value)
+
+def _write_uint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 integer."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_uint(data: bytes, position: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 integer, returning it and the next position."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+def _write_int(out: bytearray, value: int) -> None:
+    """Append a bitset as a length-prefixed little-endian integer."""
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "little")
+    _write_uint(out, len(raw))
+    out += raw
+
+def _read_int(data: bytes, position: int) -> Tuple[int, int]:
+    """Read a bitset written by _write_int."""
+    length, position = _read_uint(data, position)
+    if position + length > len(data):
+        raise IndexError("bitset runs past the end of the data")
+    return int.from_bytes(data[position:position + length], "little"), position + length
+
+def _write_str(out: bytearray, value: str) -> None:
+    """Append a length-prefixed UTF-8 string."""
+    raw = value.encode("utf-8")
+    _write_uint(out, len(raw))
+    out += raw
+
+def _read_str(data: bytes, position: int) -> Tuple[str, int]:
+    """Read a string written by _write_str."""
+    length, position = _read_uint(data, position)
+    if position + length > len(data):
+        raise IndexError("string runs past the end of the data")
+    return data[position:position + length].decode("utf-8"), position + length
@@ -0,0 +1,144 @@
+"""
+Cache of parsed launch options and resolved details per game.
+
+Switching between games re-parsed the game's launch string and looked up
+its Proton prefix and version on disk every time. Entries here are keyed
+by the app ID and the launch string, so a changed launch string misses
+the cache by itself, and are evicted least recently used first. The
+Proton details carry the modification times of the files they were read
+from, so a lookup can tell when Steam changed them.
+"""
+
+import os
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of games kept in the cache
+GAME_CACHE_SIZE = 128
+
+class GameDetails(NamedTuple):
+    """Parsed launch options and resolved details of a game."""
+    options: Optional[Dict[str, Any]]   # LaunchOptions.to_dict(), None if unparsable
+    error: Optional[str]                # Parse error message
+    proton_prefix: str
+    proton_version: str
+    source: Any = None                  # LaunchOptions.source, to keep the written command
+    proton_files: Tuple[str, ...] = ()  # Files the Proton details were read from
+    proton_stamp: Tuple = ()            # file_stamp(proton_files) before they were read
+
+def file_stamp(paths: Iterable[str]) -> Tuple:
+    """
+    Get the modification times of files, None for missing ones.
+    
+    Args:
+        paths: Paths of the files
+        
+    Returns:
+        Tuple: One entry per path, equal as long as no file changed
+    """
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def copy_options(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a LaunchOptions.to_dict() result.
+    
+    The data nests dicts and lists at most two levels deep, so this is
+    several times cheaper than copy.deepcopy.
+    
+    Args:
+        data: Options dictionary
+        
+    Returns:
+        Dict: An independent copy
+    """
+    result = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            value = {inner_key: dict(inner) if isinstance(inner, dict) else inner
+                     for inner_key, inner in value.items()}
+        elif isinstance(value, list):
+            value = list(value)
+        result[key] = value
+    return result
+
+class GameOptionsCache:
+    """
+    Bounded LRU cache of GameDetails keyed by (app_id, launch options).
+    
+    Only the newest launch string of each game is kept.
+    """
+    
+    def __init__(self, max_entries: int = GAME_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of cached games
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, GameDetails]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, app_id: str, launch_options: str) -> Optional[GameDetails]:
+        """
+        Get the cached details of a game.
+        
+        Args:
+            app_id: Steam App ID
+            launch_options: The game's current launch string
+            
+        Returns:
+            GameDetails or None: The details, or None if not cached
+        """
+        entry = self._entries.get(app_id)
+        if entry is None or entry[0] != (launch_options or ""):
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(app_id)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, app_id: str, launch_options: str, details: GameDetails) -> None:
+        """
+        Cache the details of a game.
+        
+        Any entry for an older launch string of the same game is replaced.
+        
+        Args:
+            app_id: Steam App ID
+            launch_options: The launch string the details belong to
+            details: The details; options are copied
+        """
+        if details.options is not None:
+            details = details._replace(options=copy_options(details.options))
+        
+        self._entries.pop(app_id, None)
+        self._entries[app_id] = (launch_options or "", details)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, app_id: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+        
+        Args:
+            app_id: Game to drop, or None to drop every game
+        """
+        if app_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(app_id, None)
@@ -0,0 +1,148 @@
+"""
+Search index over game names and app IDs.
+
+Every game is indexed by the trigrams of its normalized name and app ID,
+and by the one- and two-character prefixes of its words. A query term is
+answered by intersecting posting sets and checking the few remaining
+candidates, so filtering stays fast with thousands of games. Queries
+without any substring match fall back to trigram overlap, which tolerates
+typos.
+"""
+
+import re
+import logging
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+# Share of query trigrams a fuzzy match must contain
+FUZZY_THRESHOLD = 0.5
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for matching.
+    
+    Args:
+        text: Game name, app ID or query
+        
+    Returns:
+        str: Case-folded words separated by single spaces
+    """
+    return _NON_WORD_RE.sub(" ", text.casefold()).strip()
+
+def _trigrams(text: str) -> Set[str]:
+    """Get the trigrams of each word of normalized text."""
+    grams = set()
+    for word in text.split():
+        for start in range(len(word) - 2):
+            grams.add(word[start:start + 3])
+    return grams
+
+class GameSearchIndex:
+    """
+    Immutable search index over (name, app_id) entries.
+    
+    Results are positions in the entry list the index was built from.
+    """
+    
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        """
+        Build the index.
+        
+        Args:
+            entries: (name, app_id) pairs, in display order
+        """
+        self._texts: List[str] = []
+        trigrams: Dict[str, Set[int]] = {}
+        prefixes: Dict[str, Set[int]] = {}
+        
+        for position, (name, app_id) in enumerate(entries):
+            text = normalize(f"{name} {app_id}")
+            self._texts.append(text)
+            
+            for gram in _trigrams(text):
+                trigrams.setdefault(gram, set()).add(position)
+            for word in text.split():
+                prefixes.setdefault(word[:1], set()).add(position)
+                if len(word) > 1:
+                    prefixes.setdefault(word[:2], set()).add(position)
+        
+        self._trigrams: Dict[str, FrozenSet[int]] = {
+            gram: frozenset(positions) for gram, positions in trigrams.items()
+        }
+        self._prefixes: Dict[str, FrozenSet[int]] = {
+            prefix: frozenset(positions) for prefix, positions in prefixes.items()
+        }
+        self.all: FrozenSet[int] = frozenset(range(len(self._texts)))
+    
+    def __len__(self) -> int:
+        return len(self._texts)
+    
+    def search(self, query: str) -> FrozenSet[int]:
+        """
+        Find the entries matching every word of a query.
+        
+        Words of one or two characters match the start of a word, longer
+        words match anywhere. If nothing matches, entries sharing most of
+        the query's trigrams are returned instead.
+        
+        Args:
+            query: Search text
+            
+        Returns:
+            FrozenSet[int]: Positions of matching entries, all entries
+                for an empty query
+        """
+        terms = normalize(query).split()
+        if not terms:
+            return self.all
+        
+        # Rarest terms first, so the candidate set shrinks fastest
+        postings = sorted((self._postings(term) for term in terms), key=len)
+        result = postings[0]
+        for positions in postings[1:]:
+            if not result:
+                break
+            result = result & positions
+        
+        if result:
+            long_terms = [term for term in terms if len(term) > 2]
+            if long_terms:
+                texts = self._texts
+                result = frozenset(
+                    position for position in result
+                    if all(term in texts[position] for term in long_terms)
+                )
+        
+        if not result:
+            result = self._fuzzy(terms)
+        return result
+    
+    def _postings(self, term: str) -> FrozenSet[int]:
+        """Get the candidate entries for a single query word."""
+        if len(term) <= 2:
+            return self._prefixes.get(term, frozenset())
+        
+        grams = sorted((self._trigrams.get(gram, frozenset()) for gram in _trigrams(term)), key=len)
+        result = grams[0]
+        for positions in grams[1:]:
+            if not result:
+                break
+            result = result & positions
+        return result
+    
+    def _fuzzy(self, terms: List[str]) -> FrozenSet[int]:
+        """Get entries containing most of the trigrams of the query."""
+        grams = _trigrams(" ".join(terms))
+        if not grams:
+            return frozenset()
+        
+        counts: Dict[int, int] = {}
+        for gram in grams:
+            for position in self._trigrams.get(gram, ()):
+                counts[position] = counts.get(position, 0) + 1
+        
+        needed = max(1, int(len(grams) * FUZZY_THRESHOLD + 0.5))
+        return frozenset(position for position, count in counts.items() if count >= needed)
@@ -3,12 +3,37 @@ Launch options model for SteamLauncherGUI.
 """
 
 import os
+import copy
 import shlex
 import logging
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.config.option_catalog import get_option_catalog
+from steamlaunchergui.models.command_tokenizer import (
+    ARG, COMMAND, ENV, GAME_ARG, SEPARATOR, WRAPPER
+)
+from steamlaunchergui.models.command_tree import CommandTree
+from steamlaunchergui.models.compact_options import CompactOptions
 
 logger = logging.getLogger(__name__)
 
+# Section name used for general options in change notifications
+GENERAL_SECTION = "General"
+
+# Places of rendered text in a command, in the order generate_command emits them
+ENV_PART, PREFIX_PART, ARG_PART, TAIL_PART, COMMAND_PART, GAME_PART = range(6)
+
+class _Piece(NamedTuple):
+    """Text of one option in a command."""
+    key: Optional[Tuple[str, ...]]  # Option the text belongs to, None for words kept as written
+    part: int                       # Place in the command, e.g. ENV_PART
+    text: str                       # Rendered text, or source text with its leading whitespace
+
+class _Source(NamedTuple):
+    """Words of a parsed command and what its options rendered to then."""
+    pieces: Tuple[_Piece, ...]
+    rendered: Tuple[Tuple[Optional[Tuple[str, ...]], str], ...]
+
 class LaunchOptions:
     """
     Model class for Steam launch options.
@@ -30,9 +55,35 @@ class LaunchOptions:
         self.tab_inputs: Dict[str, Dict[str, str]] = {}
         self.tab_dropdowns: Dict[str, Dict[str, str]] = {}
         self.tab_sliders: Dict[str, Dict[str, float]] = {}
+        
+        # Words of a parsed command that don't map to a known option
+        self.extra_env: List[str] = []
+        self.game_args: List[str] = []
+        
+        # Rendered command pieces per section, see generate_command
+        self._fragments: Dict[str, List[_Piece]] = {}
+        self._fragments_catalog = None
+        self._command: Optional[str] = None
+        
+        # Words of the parsed command, and the rendering of each option at
+        # parse time; options unchanged since are emitted as written
+        self._source: Optional[_Source] = None
+        self._source_rendered: Dict[Optional[Tuple[str, ...]], str] = {}
+        
+        # Compact snapshot shared by snapshot() calls until the next change
+        self._snapshot: Optional[CompactOptions] = None
+        
+        # Callbacks notified as callback(launch_options, section, option)
+        self._listeners: List[Callable[['LaunchOptions', Optional[str], Optional[str]], None]] = []
     
     def reset(self) -> None:
         """Reset all options to their default state."""
+        self._clear()
+        self._attach_source(None)
+        self.invalidate()
+    
+    def _clear(self) -> None:
+        """Clear all options without notifying listeners."""
         self.general_toggles.clear()
         self.general_inputs.clear()
         self.general_dropdowns.clear()
@@ -42,82 +93,383 @@ class LaunchOptions:
         self.tab_inputs.clear()
         self.tab_dropdowns.clear()
         self.tab_sliders.clear()
+        
+        self.extra_env.clear()
+        self.game_args.clear()
+    
+    # Change tracking
+    def add_listener(self, callback: Callable[['LaunchOptions', Optional[str], Optional[str]], None]) -> None:
+        """
+        Register a callback for option changes.
+        
+        The callback receives the model, the changed section (a tab name or
+        GENERAL_SECTION) and the changed option. Both are None when the
+        whole model was replaced, e.g. by parse_command or reset.
+        
+        Args:
+            callback: Function to call after each change
+        """
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[['LaunchOptions', Optional[str], Optional[str]], None]) -> None:
+        """
+        Unregister a change callback.
+        
+        Args:
+            callback: Previously registered function
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def invalidate(self, section: Optional[str] = None) -> None:
+        """
+        Mark rendered command fragments as stale and notify listeners.
+        
+        Call this after changing the option dictionaries directly instead
+        of through the setters.
+        
+        Args:
+            section: Tab name or GENERAL_SECTION, or None for everything
+        """
+        if section is None:
+            self._fragments.clear()
+        else:
+            self._fragments.pop(section, None)
+        self._command = None
+        self._snapshot = None
+        self._notify(section, None)
+    
+    def _changed(self, section: str, option: Optional[str]) -> None:
+        """Drop the fragment of a changed section and notify listeners."""
+        self._fragments.pop(section, None)
+        self._command = None
+        self._snapshot = None
+        self._notify(section, option)
+    
+    def _notify(self, section: Optional[str], option: Optional[str]) -> None:
+        """Call the registered listeners."""
+        for callback in list(self._listeners):
+            try:
+                callback(self, section, option)
+            except Exception as e:
+                logger.error(f"Error in launch options listener: {e}")
+    
+    # Setters
+    def set_general_toggle(self, option: str, enabled: bool) -> None:
+        """
+        Set a general flag option.
+        
+        Args:
+            option: The flag, e.g. -fullscreen
+            enabled: Whether the flag is passed
+        """
+        if self.general_toggles.get(option) != enabled:
+            self.general_toggles[option] = enabled
+            self._changed(GENERAL_SECTION, option)
+    
+    def set_general_input(self, option: str, value: str) -> None:
+        """
+        Set a general option value, removing it when empty.
+        
+        Args:
+            option: The flag, e.g. -w, or "custom_options"
+            value: The value
+        """
+        self._set_value(self.general_inputs, GENERAL_SECTION, option, value)
+    
+    def set_general_dropdown(self, option: str, value: str) -> None:
+        """
+        Set a general dropdown value, removing it when empty.
+        
+        Args:
+            option: The flag
+            value: The selected value
+        """
+        self._set_value(self.general_dropdowns, GENERAL_SECTION, option, value)
+    
+    def set_tab_enabled(self, tab_name: str, enabled: bool) -> None:
+        """
+        Enable or disable a tab.
+        
+        Args:
+            tab_name: Name of the tab
+            enabled: Whether the tab's options are used
+        """
+        if self.tab_enabled.get(tab_name) != enabled:
+            self.tab_enabled[tab_name] = enabled
+            self._changed(tab_name, None)
+    
+    def set_tab_toggle(self, tab_name: str, option: str, enabled: bool) -> None:
+        """
+        Set a tab toggle option.
+        
+        Args:
+            tab_name: Name of the tab
+            option: The environment variable or flag
+            enabled: Whether the option is set
+        """
+        toggles = self._ensure_tab_toggles(tab_name)
+        if toggles.get(option) != enabled:
+            toggles[option] = enabled
+            self._changed(tab_name, option)
+    
+    def set_tab_input(self, tab_name: str, option: str, value: str) -> None:
+        """
+        Set a tab input option.
+        
+        Args:
+            tab_name: Name of the tab
+            option: The environment variable or flag
+            value: The value
+        """
+        inputs = self._ensure_tab_inputs(tab_name)
+        if inputs.get(option) != value:
+            inputs[option] = value
+            self._changed(tab_name, option)
+    
+    def set_tab_dropdown(self, tab_name: str, key: str, value: str) -> None:
+        """
+        Set a tab dropdown option.
+        
+        Args:
+            tab_name: Name of the tab
+            key: The environment variable
+            value: The selected value
+        """
+        dropdowns = self._ensure_tab_dropdowns(tab_name)
+        if dropdowns.get(key) != value:
+            dropdowns[key] = value
+            self._changed(tab_name, key)
+    
+    def set_tab_slider(self, tab_name: str, option: str, value: float) -> None:
+        """
+        Set a tab slider option.
+        
+        Args:
+            tab_name: Name of the tab
+            option: The environment variable
+            value: The slider value
+        """
+        sliders = self._ensure_tab_sliders(tab_name)
+        if sliders.get(option) != value:
+            sliders[option] = value
+            self._changed(tab_name, option)
+    
+    def _set_value(self, values: Dict[str, str], section: str, option: str, value: str) -> None:
+        """Set or remove a value in one of the general dictionaries."""
+        if value:
+            if values.get(option) == value:
+                return
+            values[option] = value
+        elif option in values:
+            del values[option]
+        else:
+            return
+        self._changed(section, option)
     
     def generate_command(self, tab_configs: Dict[str, Any]) -> str:
         """
         Generate a Steam launch command from the current options.
         
+        Each section (the general options and every tab) is rendered into
+        cached pieces. Only sections changed since the last call are
+        rendered again before the pieces are joined.
+        
+        If the options were parsed from a command, that command is kept:
+        options unchanged since are emitted as written, with their order,
+        quoting and spacing, changed options are rendered in place and new
+        options are inserted where they belong.
+        
         Args:
             tab_configs: Dictionary of tab configurations
             
         Returns:
             str: The generated launch command
         """
-        command_parts = []
-        env_vars = []
+        catalog = get_option_catalog(tab_configs)
+        if catalog is not self._fragments_catalog:
+            self._fragments.clear()
+            self._fragments_catalog = catalog
+            self._command = None
+        
+        if self._command is None:
+            pieces = self._render(catalog)
+            if self._source is None:
+                self._command = self._join_pieces(pieces)
+            else:
+                self._command = self._merge_source(pieces)
+        return self._command
+    
+    def _render(self, catalog) -> List[_Piece]:
+        """Render all options into pieces, in command order."""
+        fragments = self._fragments
+        general = fragments.get(GENERAL_SECTION)
+        if general is None:
+            general = fragments[GENERAL_SECTION] = self._render_general()
+        
+        tabs = []
+        for tab_name, enabled in self.tab_enabled.items():
+            if not enabled:
+                continue
+            fragment = fragments.get(tab_name)
+            if fragment is None:
+                fragment = fragments[tab_name] = self._render_tab(tab_name, catalog)
+            tabs.append(fragment)
+        
+        # Environment first, then wrappers (the last enabled tab's wrapper
+        # outermost), general flags, tab arguments and custom options
+        pieces = []
+        if self.extra_env:
+            pieces.append(_Piece(("extra_env",), ENV_PART, " ".join(self.extra_env)))
+        for fragment in tabs:
+            pieces.extend(piece for piece in fragment if piece.part == ENV_PART)
+        for fragment in reversed(tabs):
+            pieces.extend(piece for piece in fragment if piece.part == PREFIX_PART)
+        pieces.extend(piece for piece in general if piece.part == ARG_PART)
+        for fragment in tabs:
+            pieces.extend(piece for piece in fragment if piece.part == ARG_PART)
+        pieces.extend(piece for piece in general if piece.part == TAIL_PART)
+        if self.game_args:
+            pieces.append(_Piece(("game_args",), GAME_PART, " ".join(self.game_args)))
+        return pieces
+    
+    @staticmethod
+    def _join_pieces(pieces: List[_Piece]) -> str:
+        """Join rendered pieces into a command with %command% in place."""
+        command = " ".join(piece.text for piece in pieces if piece.part != GAME_PART)
+        game_args = [piece.text for piece in pieces if piece.part == GAME_PART]
+        if command or game_args:
+            command += " %command%"
+        if game_args:
+            command += " " + " ".join(game_args)
+        return command.strip()
+    
+    def _merge_source(self, pieces: List[_Piece]) -> str:
+        """Render the parsed command with the changes made since applied."""
+        rendered = {}
+        for piece in pieces:
+            rendered.setdefault(piece.key, piece.text)
+        
+        # Walk the source words, keeping those of unchanged options
+        output = []
+        seen = set()
+        for piece in self._source.pieces:
+            text = rendered.get(piece.key)
+            if text == self._source_rendered.get(piece.key):
+                output.append(piece)
+            elif text is not None and piece.key not in seen:
+                output.append(piece._replace(text=text))
+            seen.add(piece.key)
+        
+        # Options that are new or were not written in the source
+        added = {}
+        for piece in pieces:
+            if piece.key in seen or self._source_rendered.get(piece.key) == piece.text:
+                continue
+            seen.add(piece.key)
+            added.setdefault(piece.part, []).append(piece)
+        
+        def first(parts):
+            return next((i for i, piece in enumerate(output) if piece.part in parts), None)
+        
+        def after_last(part):
+            index = next((i for i in range(len(output) - 1, -1, -1)
+                          if output[i].part == part), -1)
+            return index + 1
+        
+        output.extend(added.get(GAME_PART, []))
+        arguments = added.get(ARG_PART, []) + added.get(TAIL_PART, [])
+        if arguments:
+            index = first((COMMAND_PART, GAME_PART))
+            output[index if index is not None else len(output):0] = arguments
+        if PREFIX_PART in added:
+            index = first((PREFIX_PART,))
+            output[index if index is not None else after_last(ENV_PART):0] = added[PREFIX_PART]
+        if ENV_PART in added:
+            output[after_last(ENV_PART):0] = added[ENV_PART]
+        
+        if all(piece.part == COMMAND_PART for piece in output):
+            return ""
+        
+        command = ""
+        for piece in output:
+            if command and not piece.text[:1].isspace():
+                command += " "
+            command += piece.text
+        return command.strip()
+    
+    def _render_general(self) -> List[_Piece]:
+        """Render the general options."""
+        pieces = []
         
         # Process general toggles
         for flag, enabled in self.general_toggles.items():
             if enabled:
-                command_parts.append(flag)
+                pieces.append(_Piece(("general_toggle", flag), ARG_PART, flag))
         
         # Process general inputs
         for flag, value in self.general_inputs.items():
-            if value:
-                command_parts.append(f"{flag} {value}")
+            if value and flag != "custom_options":
+                pieces.append(_Piece(("general_input", flag), ARG_PART,
+                                     f"{flag} {shlex.quote(value)}"))
         
         # Process general dropdowns
         for flag, value in self.general_dropdowns.items():
             if value:
-                command_parts.append(f"{flag} {value}")
+                pieces.append(_Piece(("general_dropdown", flag), ARG_PART,
+                                     f"{flag} {shlex.quote(value)}"))
         
-        # Process tab-specific options
-        for tab_name, enabled in self.tab_enabled.items():
-            if not enabled:
-                continue
-                
-            config = tab_configs.get(tab_name, {})
-            
-            # Command prefix
-            if "command_prefix" in config:
-                command_parts.insert(0, config["command_prefix"])
-            
-            # Toggles
-            for option, toggle_enabled in self.tab_toggles.get(tab_name, {}).items():
-                if toggle_enabled:
-                    if option.startswith('-'):
-                        command_parts.append(option)
-                    else:
-                        env_vars.append(f"{option}=1")
-            
-            # Inputs
-            for option, value in self.tab_inputs.get(tab_name, {}).items():
-                if value:
-                    env_vars.append(f"{option}={value}")
-            
-            # Dropdowns
-            for key, value in self.tab_dropdowns.get(tab_name, {}).items():
-                if value:
-                    env_vars.append(f"{key}={value}")
-            
-            # Sliders
-            for option, value in self.tab_sliders.get(tab_name, {}).items():
-                if value != 0:
-                    env_vars.append(f"{option}={value:.2f}")
-            
-            # Command suffix
-            if "command_suffix" in config:
-                command_parts.append(config["command_suffix"])
+        # Custom options are appended as written
+        custom_options = self.general_inputs.get("custom_options", "").strip()
+        if custom_options:
+            pieces.append(_Piece(("custom_options",), TAIL_PART, custom_options))
         
-        # Build final command
-        command = ""
-        if env_vars:
-            command += " ".join(env_vars) + " "
-        command += " ".join(command_parts)
-        if command:
-            command += " %command%"
+        return pieces
+    
+    def _render_tab(self, tab_name: str, catalog) -> List[_Piece]:
+        """Render the options of an enabled tab."""
+        tab = catalog.tabs.get(tab_name)
+        pieces = []
         
-        return command.strip()
+        # Command prefix
+        if tab and tab.command_prefix:
+            pieces.append(_Piece(("prefix", tab_name), PREFIX_PART, tab.command_prefix))
+        
+        # Toggles
+        for option, toggle_enabled in self.tab_toggles.get(tab_name, {}).items():
+            if toggle_enabled:
+                key = ("toggle", tab_name, option)
+                if option in catalog.flag_toggles or option.startswith('-'):
+                    pieces.append(_Piece(key, ARG_PART, option))
+                else:
+                    pieces.append(_Piece(key, ENV_PART, f"{option}=1"))
+        
+        # Inputs
+        for option, value in self.tab_inputs.get(tab_name, {}).items():
+            if value:
+                key = ("input", tab_name, option)
+                if option.startswith('-'):
+                    pieces.append(_Piece(key, ARG_PART, f"{option} {shlex.quote(value)}"))
+                else:
+                    pieces.append(_Piece(key, ENV_PART, f"{option}={shlex.quote(value)}"))
+        
+        # Dropdowns
+        for key, value in self.tab_dropdowns.get(tab_name, {}).items():
+            if value:
+                pieces.append(_Piece(("dropdown", tab_name, key), ENV_PART,
+                                     f"{key}={shlex.quote(value)}"))
+        
+        # Sliders
+        for option, value in self.tab_sliders.get(tab_name, {}).items():
+            if value != 0:
+                pieces.append(_Piece(("slider", tab_name, option), ENV_PART,
+                                     f"{option}={value:.2f}"))
+        
+        # Command suffix
+        if tab and tab.command_suffix:
+            pieces.append(_Piece(("suffix", tab_name), ARG_PART, tab.command_suffix))
+        
+        return pieces
     
     def parse_command(self, command: str, tab_configs: Dict[str, Any]) -> None:
         """
@@ -126,97 +478,216 @@ class LaunchOptions:
         Args:
             command: The command string to parse
             tab_configs: Dictionary of tab configurations
+            
+        Raises:
+            ValueError: If the command contains an unterminated quote
         """
         if not command:
             return
         
+        catalog = get_option_catalog(tab_configs)
+        
+        try:
+            tree = CommandTree(command, catalog.prefixes, catalog.suffixes)
+            if tree.error is not None:
+                raise ValueError(tree.error)
+            self._parse_words(tree.nodes, catalog)
+        except Exception as e:
+            logger.error(f"Error parsing command: {e}")
+            raise
+    
+    def parse_tree(self, tree: CommandTree, tab_configs: Dict[str, Any]) -> None:
+        """
+        Update the model from an already parsed launch string.
+        
+        Words that don't map to a known option are kept: unknown environment
+        assignments in extra_env, other words before %command% as the custom
+        options input and words after it in game_args.
+        
+        Args:
+            tree: The parsed launch string
+            tab_configs: Dictionary of tab configurations
+        """
+        self._parse_words(tree.nodes, get_option_catalog(tab_configs))
+    
+    @property
+    def source(self) -> Optional[_Source]:
+        """
+        The words of the command the options were parsed from, or None.
+        
+        The value is immutable; pass it to from_dict together with to_dict()
+        to restore a model that keeps the parsed command.
+        """
+        return self._source
+    
+    def _parse_words(self, nodes, catalog) -> None:
+        """Reset the model and fill it from classified words."""
         # Reset current settings
-        self.reset()
+        self._clear()
         
-        # Build mappings for quick lookup
-        tab_toggle_mappings = self._build_tab_toggle_mappings(tab_configs)
-        tab_input_mappings = self._build_tab_input_mappings(tab_configs)
-        tab_dropdown_mappings = self._build_tab_dropdown_mappings(tab_configs)
-        tab_slider_mappings = self._build_tab_slider_mappings(tab_configs)
+        custom_options = []
+        source = []
+        wrappers = []
+        i = 0
         
-        try:
-            # Split command, preserving quoted strings
-            parts = shlex.split(command.replace('%command%', ''))
-            env_vars = {}
-            flags = []
-            
-            for part in parts:
-                if '=' in part and not part.startswith('-'):
-                    # Handle environment variables
-                    key, value = part.split('=', 1)
-                    env_vars[key] = value
-                elif part in self._get_command_suffixes(tab_configs):
-                    continue
-                else:
-                    # Handle flags and command prefixes
-                    flags.append(part)
+        while i < len(nodes):
+            node = nodes[i]
+            i += 1
+            kind, key, value = node.kind, node.name, node.value
+            text = node.space + node.text
+            part = GAME_PART if kind == GAME_ARG else ARG_PART
             
             # Process environment variables
-            for key, value in env_vars.items():
-                if key in tab_toggle_mappings:
-                    tab_name, option = tab_toggle_mappings[key]
-                    if value == "1":
-                        self._ensure_tab_toggles(tab_name)[option] = True
-                        self.tab_enabled[tab_name] = True
-                elif key in tab_input_mappings:
-                    tab_name, option = tab_input_mappings[key]
-                    self._ensure_tab_inputs(tab_name)[option] = value
-                    self.tab_enabled[tab_name] = True
-                elif key in tab_dropdown_mappings:
-                    tab_name, key_name = tab_dropdown_mappings[key]
-                    self._ensure_tab_dropdowns(tab_name)[key_name] = value
-                    self.tab_enabled[tab_name] = True
-                elif key in tab_slider_mappings:
-                    tab_name, option = tab_slider_mappings[key]
+            if kind == ENV:
+                spec = catalog.env_toggles.get(key)
+                option = None
+                if spec and value == "1":
+                    self._ensure_tab_toggles(spec.tab)[key] = True
+                    option = ("toggle", spec.tab, key)
+                elif key in catalog.inputs:
+                    spec = catalog.inputs[key]
+                    self._ensure_tab_inputs(spec.tab)[key] = value
+                    option = ("input", spec.tab, key)
+                elif key in catalog.dropdowns:
+                    spec = catalog.dropdowns[key]
+                    self._ensure_tab_dropdowns(spec.tab)[key] = value
+                    option = ("dropdown", spec.tab, key)
+                elif key in catalog.sliders:
+                    spec = catalog.sliders[key]
                     try:
-                        self._ensure_tab_sliders(tab_name)[option] = float(value)
-                        self.tab_enabled[tab_name] = True
+                        self._ensure_tab_sliders(spec.tab)[key] = float(value)
+                        option = ("slider", spec.tab, key)
                     except ValueError:
                         logger.warning(f"Invalid slider value: {value}")
-            
-            # Process flags
-            for i, flag in enumerate(flags):
-                # Check for general toggles
-                if flag in self._get_general_toggles(tab_configs):
-                    self.general_toggles[flag] = True
-                    continue
-                
-                # Check for general inputs
-                if flag in self._get_general_inputs(tab_configs):
-                    if i + 1 < len(flags):
-                        next_part = flags[i + 1]
-                        # Skip if next part is another flag
-                        if not next_part.startswith('-') and not next_part.startswith('+'):
-                            self.general_inputs[flag] = next_part
-                    continue
                 
-                # Check for special cases like -dxlevel
-                if flag == "-dxlevel" and i + 1 < len(flags):
-                    self.general_dropdowns[flag] = flags[i + 1]
-                    continue
-                
-                # Check for command prefixes
-                for tab_name, config in tab_configs.items():
-                    if "command_prefix" in config and flag == config["command_prefix"]:
-                        self.tab_enabled[tab_name] = True
-                        break
-                
-                # Check for tab-specific toggles
-                for tab_name, config in tab_configs.items():
-                    for toggle_option, _ in config.get("toggles", []):
-                        if toggle_option == flag:
-                            self._ensure_tab_toggles(tab_name)[toggle_option] = True
-                            self.tab_enabled[tab_name] = True
-                            break
+                if option is None:
+                    self.extra_env.append(node.text)
+                    option = ("extra_env",)
+                else:
+                    self.tab_enabled[spec.tab] = True
+                source.append(_Piece(option, ENV_PART, text))
+                continue
+            
+            # %command% is implied, separators are re-emitted with their tab
+            if kind == COMMAND:
+                source.append(_Piece(None, COMMAND_PART, text))
+                continue
+            if kind == SEPARATOR:
+                tab_name = self._separator_tab(value, wrappers, catalog)
+                source.append(_Piece(("suffix", tab_name) if tab_name else None, ARG_PART, text))
+                continue
+            
+            # Check for command prefixes
+            if kind == WRAPPER:
+                tab_name = catalog.prefixes[value]
+                self.tab_enabled[tab_name] = True
+                wrappers.append(tab_name)
+                source.append(_Piece(("prefix", tab_name), PREFIX_PART, text))
+                continue
+            
+            # Check for general toggles
+            if value in catalog.general_toggles:
+                self.general_toggles[value] = True
+                source.append(_Piece(("general_toggle", value), part, text))
+                continue
+            
+            # Check for flags taking a value, general inputs first
+            spec = catalog.general_inputs.get(value)
+            if spec is None and value.startswith('-'):
+                spec = catalog.inputs.get(value)
+            if spec:
+                option = None
+                if i < len(nodes) and nodes[i].kind in (ARG, GAME_ARG):
+                    next_part = nodes[i].value
+                    # Skip if next part is another flag
+                    if not next_part.startswith('-') and not next_part.startswith('+'):
+                        if spec.tab is None:
+                            self.general_inputs[value] = next_part
+                            option = ("general_input", value)
+                        else:
+                            self._ensure_tab_inputs(spec.tab)[value] = next_part
+                            self.tab_enabled[spec.tab] = True
+                            option = ("input", spec.tab, value)
+                        text += nodes[i].space + nodes[i].text
+                        i += 1
+                source.append(_Piece(option, part, text))
+                continue
+            
+            # Check for tab-specific toggles
+            spec = catalog.flag_toggles.get(value)
+            if spec:
+                self._ensure_tab_toggles(spec.tab)[value] = True
+                self.tab_enabled[spec.tab] = True
+                source.append(_Piece(("toggle", spec.tab, value), part, text))
+                continue
+            
+            # Keep unknown words as written
+            if kind == GAME_ARG:
+                self.game_args.append(node.text)
+                source.append(_Piece(("game_args",), part, text))
+            else:
+                custom_options.append(node.text)
+                source.append(_Piece(("custom_options",), part, text))
         
-        except Exception as e:
-            logger.error(f"Error parsing command: {e}")
-            raise
+        if custom_options:
+            self.general_inputs["custom_options"] = " ".join(custom_options)
+        
+        # Keep the order of the wrappers: the last enabled tab is outermost
+        for tab_name in reversed(wrappers):
+            self.tab_enabled[tab_name] = self.tab_enabled.pop(tab_name)
+        
+        self.invalidate()
+        
+        # Options are compared to their rendering at parse time to find
+        # the words that are still current
+        if catalog is not self._fragments_catalog:
+            self._fragments.clear()
+            self._fragments_catalog = catalog
+        rendered = {}
+        for piece in self._render(catalog):
+            rendered.setdefault(piece.key, piece.text)
+        self._attach_source(_Source(tuple(source), tuple(rendered.items())))
+    
+    @staticmethod
+    def _separator_tab(value: str, wrappers: List[str], catalog) -> Optional[str]:
+        """Find the tab a wrapper argument terminator belongs to."""
+        tabs = [name for name, tab in catalog.tabs.items() if tab.command_suffix == value]
+        return next((name for name in reversed(wrappers) if name in tabs),
+                    tabs[0] if tabs else None)
+    
+    def _attach_source(self, source: Optional[_Source]) -> None:
+        """Keep the words of a parsed command for generate_command."""
+        self._source = source
+        self._source_rendered = dict(source.rendered) if source is not None else {}
+        self._command = None
+    
+    def snapshot(self) -> CompactOptions:
+        """
+        Get an immutable, compact snapshot of the current options.
+        
+        The snapshot is encoded on first use and shared by later calls
+        until an option changes, so taking snapshots of an unchanged model
+        is free. Snapshots hash and compare cheaply and serialize to a
+        canonical byte string.
+        
+        Returns:
+            CompactOptions: The snapshot
+        """
+        if self._snapshot is None:
+            self._snapshot = CompactOptions.from_launch_options(self)
+        return self._snapshot
+    
+    def copy(self) -> 'LaunchOptions':
+        """
+        Get an independent copy of the model, without its listeners.
+        
+        Returns:
+            LaunchOptions: The copy
+        """
+        launch_options = LaunchOptions()
+        launch_options.from_dict(copy.deepcopy(self.to_dict()), self._source)
+        launch_options._snapshot = self._snapshot
+        return launch_options
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -234,14 +705,18 @@ class LaunchOptions:
             "tab_inputs": self.tab_inputs,
             "tab_dropdowns": self.tab_dropdowns,
             "tab_sliders": self.tab_sliders,
+            "extra_env": self.extra_env,
+            "game_args": self.game_args,
         }
     
-    def from_dict(self, data: Dict[str, Any]) -> None:
+    def from_dict(self, data: Dict[str, Any], source: Optional[_Source] = None) -> None:
         """
         Load the model from a dictionary.
         
         Args:
             data: Dictionary with model data
+            source: The source property of the model the data was taken
+                from, to keep generating the command it was parsed from
         """
         self.general_toggles = data.get("general_toggles", {})
         self.general_inputs = data.get("general_inputs", {})
@@ -251,6 +726,10 @@ class LaunchOptions:
         self.tab_inputs = data.get("tab_inputs", {})
         self.tab_dropdowns = data.get("tab_dropdowns", {})
         self.tab_sliders = data.get("tab_sliders", {})
+        self.extra_env = data.get("extra_env", [])
+        self.game_args = data.get("game_args", [])
+        self._attach_source(source)
+        self.invalidate()
     
     # Helper methods to ensure dictionaries exist
     def _ensure_tab_toggles(self, tab_name: str) -> Dict[str, bool]:
@@ -277,54 +756,76 @@ class LaunchOptions:
             self.tab_sliders[tab_name] = {}
         return self.tab_sliders[tab_name]
     
-    # Helper methods for parsing
-    def _build_tab_toggle_mappings(self, tab_configs: Dict[str, Any]) -> Dict[str, Tuple[str, str]]:
-        """Build mappings for tab toggles."""
-        mappings = {}
-        for tab_name, config in tab_configs.items():
-            for toggle_option, _ in config.get("toggles", []):
-                if not toggle_option.startswith('-'):
-                    mappings[toggle_option] = (tab_name, toggle_option)
-        return mappings
-    
-    def _build_tab_input_mappings(self, tab_configs: Dict[str, Any]) -> Dict[str, Tuple[str, str]]:
-        """Build mappings for tab inputs."""
-        mappings = {}
-        for tab_name, config in tab_configs.items():
-            for input_option, _, _ in config.get("inputs", []):
-                mappings[input_option] = (tab_name, input_option)
-        return mappings
-    
-    def _build_tab_dropdown_mappings(self, tab_configs: Dict[str, Any]) -> Dict[str, Tuple[str, str]]:
-        """Build mappings for tab dropdowns."""
-        mappings = {}
-        for tab_name, config in tab_configs.items():
-            for key in config.get("dropdowns", {}):
-                mappings[key] = (tab_name, key)
-        return mappings
-    
-    def _build_tab_slider_mappings(self, tab_configs: Dict[str, Any]) -> Dict[str, Tuple[str, str]]:
-        """Build mappings for tab sliders."""
-        mappings = {}
-        for tab_name, config in tab_configs.items():
-            for slider_option, _, _, _ in config.get("sliders", []):
-                mappings[slider_option] = (tab_name, slider_option)
-        return mappings
-    
-    def _get_command_suffixes(self, tab_configs: Dict[str, Any]) -> Set[str]:
-        """Get all command suffixes."""
-        suffixes = set()
-        for config in tab_configs.values():
-            if "command_suffix" in config:
-                suffixes.add(config["command_suffix"])
-        return suffixes
-    
-    def _get_general_toggles(self, tab_configs: Dict[str, Any]) -> Set[str]:
-        """Get all general toggles."""
-        from steamlaunchergui.config.constants import GENERAL_OPTIONS
-        return {option for option, _ in GENERAL_OPTIONS}
-    
-    def _get_general_inputs(self, tab_configs: Dict[str, Any]) -> Set[str]:
-        """Get all general inputs."""
-        from steamlaunchergui.config.constants import GENERAL_INPUTS
-        return {option for option, _, _ in GENERAL_INPUTS} 
\ No newline at end of file
+    def active_options(self) -> Dict[str, Any]:
+        """
+        Get the general options that currently contribute to the command.
+        
+        Returns:
+            Dict: Mapping of flag to True (toggles) or its value (inputs)
+        """
+        catalog = get_option_catalog()
+        options = {}
+        
+        for flag, enabled in self.general_toggles.items():
+            if enabled and flag in catalog.general_toggles:
+                options[flag] = True
+        
+        for flag, value in self.general_inputs.items():
+            if value:
+                options[flag] = value
+        
+        return options
+    
+    def effective_options(self) -> Dict[str, Any]:
+        """
+        Get every option that currently contributes to the command.
+        
+        General options and environment variables are keyed as they appear
+        in the command, wrapper commands by their command name and flags
+        of a tab as "Tab:flag", matching the names used by conflict rules.
+        
+        Returns:
+            Dict: Mapping of option name to True (toggles) or its value
+        """
+        catalog = get_option_catalog()
+        options = self.active_options()
+        options.pop("custom_options", None)
+        
+        for flag, value in self.general_dropdowns.items():
+            if value:
+                options[flag] = value
+        
+        for assignment in self.extra_env:
+            name, _, value = assignment.partition("=")
+            # A toggle variable set to 0 or nothing is off; only =1 parses
+            # as the toggle itself
+            if name in catalog.env_toggles and value in ("", "0"):
+                continue
+            options[name] = value
+        
+        for tab_name, enabled in self.tab_enabled.items():
+            if not enabled:
+                continue
+            tab = catalog.tabs.get(tab_name)
+            if tab and tab.command_prefix:
+                options[tab.command_prefix] = True
+            
+            for option, toggle_enabled in self.tab_toggles.get(tab_name, {}).items():
+                if toggle_enabled:
+                    key = f"{tab_name}:{option}" if option.startswith('-') else option
+                    options.setdefault(key, True)
+            
+            for option, value in self.tab_inputs.get(tab_name, {}).items():
+                if value:
+                    key = f"{tab_name}:{option}" if option.startswith('-') else option
+                    options[key] = value
+            
+            for key, value in self.tab_dropdowns.get(tab_name, {}).items():
+                if value:
+                    options[key] = value
+            
+            for option, value in self.tab_sliders.get(tab_name, {}).items():
+                if value != 0:
+                    options[option] = value
+        
+        return options
@@ -0,0 +1,161 @@
+"""
+Content-addressed storage of option sets.
+
+An option set is stored once under the hash of its canonical form, and
+profiles and games refer to it by that hash. Identical option sets share
+one blob, and two option sets are equal exactly when their hashes are.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from steamlaunchergui.models.game_cache import copy_options
+
+logger = logging.getLogger(__name__)
+
+# Decoded option sets kept in memory
+OPTION_STORE_CACHE_SIZE = 1024
+
+# Hashes of option snapshots kept in memory
+DIGEST_CACHE_SIZE = 4096
+
+def canonical_options(launch_options) -> Tuple[str, bytes]:
+    """
+    Get the canonical form of launch options and its hash.
+    
+    The options are normalized through their compact encoding, so options
+    that differ only in unset entries have the same form, and serialized
+    as JSON with sorted keys. Options kept in disabled tabs are part of
+    the form, see CompactOptions.
+    
+    Args:
+        launch_options: LaunchOptions to serialize
+        
+    Returns:
+        Tuple[str, bytes]: Hex digest and the canonical JSON
+    """
+    return _canonical_snapshot(launch_options.snapshot())
+
+def options_digest(launch_options) -> str:
+    """
+    Get the hash of the canonical form of launch options.
+    
+    Args:
+        launch_options: LaunchOptions or CompactOptions to hash
+        
+    Returns:
+        str: Hex digest
+    """
+    snapshot = getattr(launch_options, "snapshot", None)
+    if snapshot is not None:
+        launch_options = snapshot()
+    return _canonical_snapshot(launch_options)[0]
+
+@lru_cache(maxsize=DIGEST_CACHE_SIZE)
+def _canonical_snapshot(snapshot) -> Tuple[str, bytes]:
+    """Serialize and hash an option snapshot; snapshots are immutable."""
+    normalized = snapshot.to_launch_options().to_dict()
+    data = json.dumps(normalized, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest(), data
+
+class OptionStore:
+    """
+    Directory of option sets named by their hash.
+    
+    Blobs are spread over subdirectories named by the first two hex digits
+    of their hash.
+    """
+    
+    def __init__(self, directory: Path, cache_size: int = OPTION_STORE_CACHE_SIZE):
+        """
+        Initialize the store.
+        
+        Args:
+            directory: Directory holding the blobs
+            cache_size: Number of decoded option sets kept in memory
+        """
+        self.directory = Path(directory)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    
+    def _path(self, digest: str) -> Path:
+        """Get the path of a blob."""
+        return self.directory / digest[:2] / f"{digest}.json"
+    
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._cache or self._path(digest).exists()
+    
+    def put(self, launch_options) -> str:
+        """
+        Store launch options unless an identical set is stored already.
+        
+        Args:
+            launch_options: LaunchOptions to store
+            
+        Returns:
+            str: Hash of the stored option set
+            
+        Raises:
+            OSError: If the blob cannot be written
+        """
+        digest, data = canonical_options(launch_options)
+        path = self._path(digest)
+        if digest in self._cache or path.exists():
+            return digest
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return digest
+    
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored option set.
+        
+        Args:
+            digest: Hash of the option set
+            
+        Returns:
+            Dict or None: LaunchOptions.to_dict() data the caller may modify,
+                or None if the blob is missing or unreadable
+        """
+        data = self._cache.get(digest)
+        if data is None:
+            path = self._path(digest)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"Error reading option set {path}: {e}")
+                return None
+            
+            self._cache[digest] = data
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(digest)
+        
+        return copy_options(data)
+    
+    def discard(self, digest: str) -> None:
+        """
+        Remove a blob that is no longer referenced.
+        
+        Args:
+            digest: Hash of the option set
+        """
+        self._cache.pop(digest, None)
+        try:
+            os.remove(self._path(digest))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error removing option set {digest}: {e}")
@@ -0,0 +1,298 @@
+"""
+Profile bundles: many profiles in one compressed archive.
+
+A bundle is a tar archive compressed with gzip or xz. Its first member is
+a manifest listing the profiles with the hash of their launch options;
+each profile follows as a JSON member in the format of export_profile.
+Bundles are written and read as streams, one profile at a time, so their
+size is not limited by memory. Conflicts with existing profiles are
+resolved for the whole bundle from the manifest before any profile is
+read, and the profiles are stored in one batch.
+"""
+
+import gzip
+import io
+import json
+import logging
+import lzma
+import os
+import tarfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.models.profiles import Profile, ProfileManager
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the bundle layout changes
+BUNDLE_VERSION = 1
+
+# Name of the manifest member, stored first
+BUNDLE_MANIFEST_NAME = "manifest.json"
+
+# Compression levels; profiles are small and repetitive, so higher levels
+# cost time without shrinking bundles much
+GZIP_LEVEL = 6
+XZ_PRESET = 6
+
+# Largest profile member read from a bundle
+BUNDLE_MEMBER_LIMIT = 1024 * 1024
+
+# File name patterns of bundles, for file choosers
+BUNDLE_PATTERNS = ("*.tar.gz", "*.tgz", "*.tar.xz", "*.txz")
+
+# How a bundled profile whose name is taken is imported
+CONFLICT_RENAME = "rename"    # Import it under a new name
+CONFLICT_REPLACE = "replace"  # Overwrite the existing profile
+CONFLICT_SKIP = "skip"        # Keep the existing profile
+
+class BundleImportResult(NamedTuple):
+    """Outcome of a bundle import."""
+    imported: int   # Profiles stored, including renamed and replaced ones
+    renamed: int    # Profiles stored under a new name
+    replaced: int   # Existing profiles overwritten
+    skipped: int    # Profiles left out: conflicting, identical or unreadable
+
+def is_bundle(filepath: Path) -> bool:
+    """
+    Check whether a file name is that of a bundle.
+    
+    Args:
+        filepath: Path to check
+        
+    Returns:
+        bool: True if the name matches BUNDLE_PATTERNS
+    """
+    name = Path(filepath).name.lower()
+    return any(name.endswith(pattern[1:]) for pattern in BUNDLE_PATTERNS)
+
+def _compressor(fileobj, filepath: Path):
+    """Wrap a file in the compressor chosen by its name, xz or gzip."""
+    if Path(filepath).name.lower().endswith((".xz", ".txz")):
+        return lzma.LZMAFile(fileobj, "wb", preset=XZ_PRESET)
+    return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=GZIP_LEVEL, mtime=0)
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes, mtime: float) -> None:
+    """Append one in-memory member to a tar stream."""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(mtime)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+def export_bundle(profile_manager: ProfileManager, filepath: Path,
+                  names: Optional[Iterable[str]] = None) -> int:
+    """
+    Export profiles to a bundle.
+    
+    The bundle is compressed with xz if its name ends in .xz or .txz and
+    with gzip otherwise. It is written next to its destination and moved
+    there once complete.
+    
+    Args:
+        profile_manager: Manager holding the profiles
+        filepath: Path to save the bundle to
+        names: Names of the profiles to export, or None for all profiles
+        
+    Returns:
+        int: Number of profiles exported, or -1 if the bundle could not be
+            written
+    """
+    filepath = Path(filepath)
+    if names is None:
+        profiles = profile_manager.get_profiles()
+    else:
+        names = list(names)
+        profiles = [profile_manager.get_profile(name) for name in names]
+        for name, profile in zip(names, profiles):
+            if profile is None:
+                logger.warning(f"Profile not found: {name}")
+        profiles = [profile for profile in profiles if profile is not None]
+    profiles.sort(key=lambda profile: profile.name)
+    
+    # The manifest only needs what is known without loading any options
+    members = [f"profiles/{number:05d}.json" for number in range(len(profiles))]
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "created_at": time.time(),
+        "profiles": [
+            {
+                "member": member,
+                "name": profile.name,
+                "description": profile.description,
+                "updated_at": profile.updated_at,
+                "digest": profile.options_hash
+            }
+            for member, profile in zip(members, profiles)
+        ]
+    }
+    
+    temp_path = filepath.with_name(filepath.name + ".tmp")
+    try:
+        with open(temp_path, 'wb') as f, _compressor(f, filepath) as compressed, \
+                tarfile.open(fileobj=compressed, mode="w|") as tar:
+            _add_member(tar, BUNDLE_MANIFEST_NAME,
+                        json.dumps(manifest, indent=2).encode("utf-8"), manifest["created_at"])
+            for member, profile in zip(members, profiles):
+                data = json.dumps(profile.to_dict(), indent=2).encode("utf-8")
+                _add_member(tar, member, data, profile.updated_at)
+        os.replace(temp_path, filepath)
+    except Exception as e:
+        logger.error(f"Error exporting profile bundle to {filepath}: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return -1
+    
+    logger.info(f"Exported {len(profiles)} profiles to {filepath}")
+    return len(profiles)
+
+def _plan_import(entries: List[Dict[str, Any]], profiles: Dict[str, Profile],
+                 conflict: str) -> Tuple[Dict[str, str], int, int, int]:
+    """
+    Decide the name every bundled profile is imported under.
+    
+    Args:
+        entries: Profile entries of the bundle manifest
+        profiles: Existing profiles by name
+        conflict: CONFLICT_RENAME, CONFLICT_REPLACE or CONFLICT_SKIP
+        
+    Returns:
+        Tuple[Dict[str, str], int, int, int]: Target names by member for
+            the profiles to import, and the numbers of renamed, replaced
+            and skipped profiles
+    """
+    taken = set(profiles)
+    claimed = set()
+    targets = {}
+    renamed = replaced = skipped = 0
+    stamp = int(time.time())
+    
+    for entry in entries:
+        # The manifest comes from the archive, so check its fields before use
+        name = entry.get("name") if isinstance(entry, dict) else None
+        member = entry.get("member") if isinstance(entry, dict) else None
+        if not isinstance(name, str) or not name or not isinstance(member, str) or not member:
+            logger.warning(f"Skipping invalid bundle manifest entry: {entry!r}")
+            skipped += 1
+            continue
+        
+        existing = profiles.get(name)
+        if name not in taken:
+            target = name
+        elif existing is not None and existing.options_hash == entry.get("digest") \
+                and existing.description == entry.get("description", ""):
+            # The same profile is there already
+            skipped += 1
+            continue
+        elif conflict == CONFLICT_REPLACE and existing is not None and name not in claimed:
+            target = name
+            replaced += 1
+        elif conflict == CONFLICT_SKIP:
+            skipped += 1
+            continue
+        else:
+            target = f"{name} (Imported {stamp})"
+            suffix = 2
+            while target in taken:
+                target = f"{name} (Imported {stamp}-{suffix})"
+                suffix += 1
+            renamed += 1
+        
+        taken.add(target)
+        claimed.add(target)
+        targets[member] = target
+    
+    return targets, renamed, replaced, skipped
+
+def import_bundle(profile_manager: ProfileManager, filepath: Path,
+                  conflict: str = CONFLICT_RENAME) -> Optional[BundleImportResult]:
+    """
+    Import the profiles of a bundle.
+    
+    Bundled profiles identical to an existing profile of the same name are
+    skipped; other name clashes are resolved by the conflict policy. The
+    profiles are stored with ProfileManager.import_profiles, so the profile
+    manifest or database is updated once for the whole bundle. If the
+    archive turns out to be damaged part way, the profiles read until then
+    are kept.
+    
+    Args:
+        profile_manager: Manager to import the profiles into
+        filepath: Path to the bundle
+        conflict: CONFLICT_RENAME, CONFLICT_REPLACE or CONFLICT_SKIP
+        
+    Returns:
+        BundleImportResult or None: The outcome, or None if the bundle
+            cannot be read
+    """
+    if conflict not in (CONFLICT_RENAME, CONFLICT_REPLACE, CONFLICT_SKIP):
+        raise ValueError(f"Unknown conflict policy: {conflict}")
+    
+    try:
+        with open(filepath, 'rb') as f, tarfile.open(fileobj=f, mode="r|*") as tar:
+            member = tar.next()
+            if member is None or member.name != BUNDLE_MANIFEST_NAME:
+                logger.error(f"Profile bundle {filepath} does not start with a manifest")
+                return None
+            manifest = json.load(tar.extractfile(member))
+            if manifest.get("version") != BUNDLE_VERSION:
+                logger.error(f"Profile bundle {filepath} has unsupported version "
+                             f"{manifest.get('version')}")
+                return None
+            
+            existing = {profile.name: profile for profile in profile_manager.get_profiles()}
+            targets, renamed, replaced, skipped = _plan_import(
+                manifest.get("profiles", []), existing, conflict
+            )
+            imported = profile_manager.import_profiles(_read_profiles(tar, targets, filepath))
+    except Exception as e:
+        logger.error(f"Error importing profile bundle from {filepath}: {e}")
+        return None
+    
+    # Planned profiles that were never stored are skipped after all
+    skipped += len(targets) - imported
+    logger.info(f"Imported {imported} profiles from {filepath} "
+                f"({renamed} renamed, {replaced} replaced, {skipped} skipped)")
+    return BundleImportResult(imported, renamed, replaced, skipped)
+
+def _read_profiles(tar: tarfile.TarFile, targets: Dict[str, str],
+                   filepath: Path) -> Iterator[Profile]:
+    """
+    Read the planned profiles of a bundle one at a time.
+    
+    Args:
+        tar: Bundle opened as a stream, positioned after the manifest
+        targets: Target names by member
+        filepath: Path to the bundle, for messages
+        
+    Yields:
+        Profile: The next profile, named as planned
+    """
+    try:
+        while True:
+            member = tar.next()
+            if member is None:
+                return
+            target = targets.get(member.name)
+            if target is None or not member.isfile():
+                continue
+            if member.size > BUNDLE_MEMBER_LIMIT:
+                logger.error(f"Skipping oversized profile {member.name} in {filepath}")
+                continue
+            
+            try:
+                profile = Profile.from_dict(json.load(tar.extractfile(member)))
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.error(f"Skipping invalid profile {member.name} in {filepath}: {e}")
+                continue
+            
+            if profile.name != target:
+                logger.info(f"Renamed imported profile from '{profile.name}' to '{target}'")
+                profile.name = target
+            yield profile
+    except (tarfile.TarError, EOFError, OSError, lzma.LZMAError, zlib.error) as e:
+        logger.error(f"Profile bundle {filepath} is damaged, stopping the import: {e}")
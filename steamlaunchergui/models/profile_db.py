@@ -0,0 +1,631 @@
+"""
+SQLite storage for profiles and per-game launch options.
+
+An alternative to the directory of JSON files: a single database in WAL
+mode holding the profiles, the options each profile sets (indexed, so
+"which profiles set DXVK_ASYNC" is one lookup), a bounded revision history
+per profile, and the launch options last saved for each game.
+
+Option sets are stored once in the option_sets table under the hash of
+their canonical form; profiles, revisions and games refer to them by hash.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.models.launch_options import LaunchOptions
+from steamlaunchergui.models.option_store import canonical_options, options_digest
+from steamlaunchergui.models.profile_manifest import encode_options
+from steamlaunchergui.models.profiles import (
+    PROFILE_ADDED, PROFILE_REMOVED, PROFILE_UPDATED, PROFILES_RELOADED, Profile, ProfileManager
+)
+
+logger = logging.getLogger(__name__)
+
+# Default database location
+PROFILE_DATABASE = Path.home() / ".config" / "steamlaunchergui" / "profiles.db"
+
+# Revisions kept per profile, including the current one
+PROFILE_REVISION_LIMIT = 20
+
+# Bumped whenever the schema changes
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS option_sets (
+    digest TEXT PRIMARY KEY,
+    options TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    revision INTEGER NOT NULL DEFAULT 1,
+    digest TEXT NOT NULL REFERENCES option_sets(digest),
+    snapshot TEXT
+);
+CREATE INDEX IF NOT EXISTS profiles_by_digest ON profiles(digest);
+CREATE TABLE IF NOT EXISTS profile_options (
+    option TEXT NOT NULL,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    value TEXT NOT NULL,
+    PRIMARY KEY (option, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS profile_options_by_profile ON profile_options(profile_id);
+CREATE TABLE IF NOT EXISTS profile_revisions (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    revision INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    digest TEXT NOT NULL REFERENCES option_sets(digest),
+    PRIMARY KEY (profile_id, revision)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS profile_revisions_by_digest ON profile_revisions(digest);
+CREATE TABLE IF NOT EXISTS game_options (
+    app_id TEXT PRIMARY KEY,
+    launch_options TEXT NOT NULL,
+    profile_name TEXT,
+    updated_at REAL NOT NULL,
+    digest TEXT REFERENCES option_sets(digest)
+);
+CREATE INDEX IF NOT EXISTS game_options_by_profile ON game_options(profile_name);
+CREATE INDEX IF NOT EXISTS game_options_by_digest ON game_options(digest);
+"""
+
+class ProfileRevision(NamedTuple):
+    """A stored revision of a profile."""
+    revision: int
+    updated_at: float
+
+class GameOptions(NamedTuple):
+    """Launch options saved for a game."""
+    app_id: str
+    launch_options: str
+    profile_name: Optional[str]  # Profile the options were based on, if any
+    updated_at: float
+    digest: Optional[str]        # Stored option set of the game, if recorded
+
+def _option_rows(launch_options: LaunchOptions) -> List[Tuple[str, str]]:
+    """Get the (option, value) rows indexed for a profile."""
+    rows = []
+    for option, value in launch_options.effective_options().items():
+        rows.append((option, "1" if value is True else str(value)))
+    return rows
+
+class SqliteProfileManager(ProfileManager):
+    """
+    Profile manager storing profiles in an SQLite database.
+    """
+    
+    def __init__(self, database: Optional[Path] = None):
+        """
+        Open the database and list the stored profiles.
+        
+        Args:
+            database: Path to the database file, or None for the default
+        """
+        self.database = Path(database) if database is not None else PROFILE_DATABASE
+        self.profiles = {}
+        self._index = None
+        
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        # A ProfileWriter uses the connection from its worker thread; the
+        # lock keeps other threads out of its transactions
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._connection = sqlite3.connect(str(self.database), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._create_schema()
+        
+        self.load_profiles()
+    
+    def _create_schema(self) -> None:
+        """Create the tables of a new database."""
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(
+                f"Profile database {self.database} has schema version {version}, "
+                f"newer than the supported version {SCHEMA_VERSION}"
+            )
+        
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+    
+    def _query(self, sql: str, parameters: Tuple = ()) -> List[Tuple]:
+        """Run a query and fetch all rows."""
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+    
+    def _query_one(self, sql: str, parameters: Tuple = ()) -> Optional[Tuple]:
+        """Run a query and fetch the first row."""
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()
+    
+    def load_profiles(self) -> None:
+        """
+        List all stored profiles.
+        
+        Only names, descriptions and dates are read; launch options are
+        loaded when first accessed.
+        """
+        self.profiles.clear()
+        self._index = None
+        
+        try:
+            rows = self._query(
+                "SELECT name, description, created_at, updated_at, snapshot, digest FROM profiles"
+            )
+            for name, description, created_at, updated_at, snapshot, digest in rows:
+                self.profiles[name] = Profile.lazy(
+                    name, description, created_at, updated_at,
+                    partial(self._load_launch_options, name), snapshot, digest
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error loading profiles from {self.database}: {e}")
+        self._notify(PROFILES_RELOADED, None)
+    
+    def _load_launch_options(self, name: str) -> LaunchOptions:
+        """Read the launch options of a stored profile."""
+        launch_options = LaunchOptions()
+        try:
+            row = self._query_one(
+                "SELECT s.options FROM profiles p JOIN option_sets s ON s.digest = p.digest "
+                "WHERE p.name = ?",
+                (name,)
+            )
+            if row is not None:
+                launch_options.from_dict(json.loads(row[0]))
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Error loading profile {name} from {self.database}: {e}")
+        return launch_options
+    
+    def save_profile(self, profile: Profile) -> bool:
+        """
+        Save a profile as a new revision.
+        
+        Args:
+            profile: Profile to save
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._lock, self._connection:
+                self._store_profile(profile)
+        except sqlite3.Error as e:
+            logger.error(f"Error saving profile {profile.name} to {self.database}: {e}")
+            return False
+        
+        with self._lock:
+            existed = profile.name in self.profiles
+            self.profiles[profile.name] = profile
+            self._index = None
+        self._notify(PROFILE_UPDATED if existed else PROFILE_ADDED, profile)
+        return True
+    
+    def _store_profile(self, profile: Profile) -> None:
+        """
+        Write a profile, its option index and a revision in the open transaction.
+        
+        A profile stored already with the same options, description and
+        modification time is left alone, so re-saving it adds no revision.
+        """
+        launch_options = profile.launch_options
+        digest = self._store_options(launch_options)
+        cursor = self._connection.cursor()
+        
+        row = cursor.execute(
+            "SELECT id, digest, description, updated_at FROM profiles WHERE name = ?",
+            (profile.name,)
+        ).fetchone()
+        if row is not None and row[1:] == (digest, profile.description, profile.updated_at):
+            return
+        
+        snapshot = encode_options(launch_options)
+        if row is None:
+            cursor.execute(
+                "INSERT INTO profiles (name, description, created_at, updated_at, digest, snapshot) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (profile.name, profile.description, profile.created_at, profile.updated_at,
+                 digest, snapshot)
+            )
+            profile_id, previous = cursor.lastrowid, None
+        else:
+            profile_id, previous = row[:2]
+            cursor.execute(
+                "UPDATE profiles SET description = ?, created_at = ?, updated_at = ?, "
+                "revision = revision + 1, digest = ?, snapshot = ? WHERE id = ?",
+                (profile.description, profile.created_at, profile.updated_at, digest, snapshot,
+                 profile_id)
+            )
+        
+        revision = cursor.execute(
+            "SELECT revision FROM profiles WHERE id = ?", (profile_id,)
+        ).fetchone()[0]
+        
+        # Equal hashes mean equal options, so the option index is current
+        if digest != previous:
+            cursor.execute("DELETE FROM profile_options WHERE profile_id = ?", (profile_id,))
+            cursor.executemany(
+                "INSERT INTO profile_options (option, profile_id, value) VALUES (?, ?, ?)",
+                [(option, profile_id, value) for option, value in _option_rows(launch_options)]
+            )
+        
+        cursor.execute(
+            "INSERT OR REPLACE INTO profile_revisions (profile_id, revision, updated_at, digest) "
+            "VALUES (?, ?, ?, ?)",
+            (profile_id, revision, profile.updated_at, digest)
+        )
+        pruned = [row[0] for row in cursor.execute(
+            "SELECT digest FROM profile_revisions WHERE profile_id = ? AND revision <= ?",
+            (profile_id, revision - PROFILE_REVISION_LIMIT)
+        )]
+        cursor.execute(
+            "DELETE FROM profile_revisions WHERE profile_id = ? AND revision <= ?",
+            (profile_id, revision - PROFILE_REVISION_LIMIT)
+        )
+        self._release_options(pruned + [previous])
+    
+    def _store_options(self, launch_options: LaunchOptions) -> str:
+        """Store an option set unless stored already and return its hash."""
+        digest, data = canonical_options(launch_options)
+        self._connection.execute(
+            "INSERT OR IGNORE INTO option_sets (digest, options) VALUES (?, ?)",
+            (digest, data.decode("utf-8"))
+        )
+        return digest
+    
+    def _release_options(self, digests: Iterable[Optional[str]]) -> None:
+        """Remove the given option sets if nothing refers to them any more."""
+        self._connection.executemany(
+            "DELETE FROM option_sets WHERE digest = ?1 "
+            "AND NOT EXISTS (SELECT 1 FROM profiles WHERE digest = ?1) "
+            "AND NOT EXISTS (SELECT 1 FROM profile_revisions WHERE digest = ?1) "
+            "AND NOT EXISTS (SELECT 1 FROM game_options WHERE digest = ?1)",
+            [(digest,) for digest in set(digests) if digest is not None]
+        )
+    
+    def delete_profile(self, name: str) -> bool:
+        """
+        Delete a profile and its history.
+        
+        Args:
+            name: Name of the profile to delete
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if name not in self.profiles:
+            logger.warning(f"Profile not found: {name}")
+            return False
+        
+        try:
+            with self._lock, self._connection:
+                digests = [row[0] for row in self._connection.execute(
+                    "SELECT digest FROM profiles WHERE name = ? UNION "
+                    "SELECT r.digest FROM profile_revisions r "
+                    "JOIN profiles p ON p.id = r.profile_id WHERE p.name = ?",
+                    (name, name)
+                )]
+                self._connection.execute("DELETE FROM profiles WHERE name = ?", (name,))
+                self._release_options(digests)
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting profile {name}: {e}")
+            return False
+        
+        with self._lock:
+            profile = self.profiles.pop(name, None)
+            self._index = None
+        if profile is not None:
+            self._notify(PROFILE_REMOVED, profile)
+        return True
+    
+    def get_profile(self, name: str) -> Optional[Profile]:
+        """
+        Get a profile by name.
+        
+        Args:
+            name: Profile name
+            
+        Returns:
+            Profile or None: The profile if found, None otherwise
+        """
+        return self.profiles.get(name)
+    
+    def find_profiles(self, option: str, value: Optional[str] = None) -> List[Profile]:
+        """
+        Find the profiles that set an option.
+        
+        Options are named as in LaunchOptions.effective_options(), e.g.
+        "DXVK_ASYNC", "gamemoderun" or "Gamescope:-f".
+        
+        Args:
+            option: Option name
+            value: Value the option must have, or None for any value; enabled
+                toggles have the value "1"
+            
+        Returns:
+            List[Profile]: Matching profiles, sorted by name
+        """
+        query = ("SELECT p.name FROM profile_options o JOIN profiles p ON p.id = o.profile_id "
+                 "WHERE o.option = ?")
+        parameters: Tuple = (option,)
+        if value is not None:
+            query += " AND o.value = ?"
+            parameters += (value,)
+        
+        try:
+            names = [row[0] for row in self._query(query + " ORDER BY p.name", parameters)]
+        except sqlite3.Error as e:
+            logger.error(f"Error searching profiles for {option}: {e}")
+            return []
+        return [self.profiles[name] for name in names if name in self.profiles]
+    
+    def find_identical_profiles(self, launch_options: LaunchOptions) -> List[Profile]:
+        """
+        Find the profiles whose launch options equal the given ones.
+        
+        Args:
+            launch_options: Options to compare
+            
+        Returns:
+            List[Profile]: Profiles with the same options, sorted by name
+        """
+        try:
+            rows = self._query(
+                "SELECT name FROM profiles WHERE digest = ? ORDER BY name",
+                (options_digest(launch_options),)
+            )
+            names = [row[0] for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Error searching profiles with identical options: {e}")
+            return []
+        return [self.profiles[name] for name in names if name in self.profiles]
+    
+    def get_revisions(self, name: str) -> List[ProfileRevision]:
+        """
+        List the stored revisions of a profile.
+        
+        Args:
+            name: Profile name
+            
+        Returns:
+            List[ProfileRevision]: Revisions, newest first
+        """
+        try:
+            rows = self._query(
+                "SELECT r.revision, r.updated_at FROM profile_revisions r "
+                "JOIN profiles p ON p.id = r.profile_id WHERE p.name = ? "
+                "ORDER BY r.revision DESC",
+                (name,)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error listing revisions of profile {name}: {e}")
+            return []
+        return [ProfileRevision(*row) for row in rows]
+    
+    def get_revision(self, name: str, revision: int) -> Optional[LaunchOptions]:
+        """
+        Get the launch options of a profile revision.
+        
+        Args:
+            name: Profile name
+            revision: Revision number
+            
+        Returns:
+            LaunchOptions or None: The options, or None if not stored
+        """
+        try:
+            row = self._query_one(
+                "SELECT r.digest FROM profile_revisions r "
+                "JOIN profiles p ON p.id = r.profile_id WHERE p.name = ? AND r.revision = ?",
+                (name, revision)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error loading revision {revision} of profile {name}: {e}")
+            return None
+        
+        if row is None:
+            return None
+        return self.get_option_set(row[0])
+    
+    def get_option_set(self, digest: str) -> Optional[LaunchOptions]:
+        """
+        Get a stored option set by its hash.
+        
+        Args:
+            digest: Hash of the option set
+            
+        Returns:
+            LaunchOptions or None: The options, or None if not stored
+        """
+        try:
+            row = self._query_one(
+                "SELECT options FROM option_sets WHERE digest = ?", (digest,)
+            )
+            if row is None:
+                return None
+            launch_options = LaunchOptions()
+            launch_options.from_dict(json.loads(row[0]))
+            return launch_options
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Error loading option set {digest}: {e}")
+            return None
+    
+    def set_game_options(self, app_id: str, launch_options: str,
+                         profile_name: Optional[str] = None,
+                         options: Optional[LaunchOptions] = None) -> bool:
+        """
+        Record the launch options saved for a game.
+        
+        Args:
+            app_id: Steam App ID
+            launch_options: The launch string
+            profile_name: Profile the options are based on, if any
+            options: Option set the launch string was built from, stored
+                by hash, or None
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._lock, self._connection:
+                row = self._connection.execute(
+                    "SELECT digest FROM game_options WHERE app_id = ?", (app_id,)
+                ).fetchone()
+                digest = self._store_options(options) if options is not None else None
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO game_options "
+                    "(app_id, launch_options, profile_name, updated_at, digest) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (app_id, launch_options, profile_name, time.time(), digest)
+                )
+                if row is not None and row[0] != digest:
+                    self._release_options([row[0]])
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error saving options of game {app_id}: {e}")
+            return False
+    
+    def get_game_options(self, app_id: str) -> Optional[GameOptions]:
+        """
+        Get the launch options recorded for a game.
+        
+        Args:
+            app_id: Steam App ID
+            
+        Returns:
+            GameOptions or None: The recorded options, or None if none
+        """
+        try:
+            row = self._query_one(
+                "SELECT app_id, launch_options, profile_name, updated_at, digest FROM game_options "
+                "WHERE app_id = ?",
+                (app_id,)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error loading options of game {app_id}: {e}")
+            return None
+        return GameOptions(*row) if row else None
+    
+    def games_using_profile(self, profile_name: str) -> List[str]:
+        """
+        List the games whose options were based on a profile.
+        
+        Args:
+            profile_name: Profile name
+            
+        Returns:
+            List[str]: App IDs
+        """
+        try:
+            rows = self._query(
+                "SELECT app_id FROM game_options WHERE profile_name = ? ORDER BY app_id",
+                (profile_name,)
+            )
+            return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Error listing games of profile {profile_name}: {e}")
+            return []
+    
+    def import_profiles(self, profiles: Iterable[Profile]) -> int:
+        """
+        Store many profiles in one transaction.
+        
+        Profiles with the name of a stored profile replace it as a new
+        revision.
+        
+        Args:
+            profiles: Profiles to store
+            
+        Returns:
+            int: Number of profiles stored
+        """
+        profiles = list(profiles)
+        try:
+            with self._lock, self._connection:
+                for profile in profiles:
+                    self._store_profile(profile)
+        except sqlite3.Error as e:
+            logger.error(f"Error importing profiles into {self.database}: {e}")
+            return 0
+        
+        events = []
+        with self._lock:
+            for profile in profiles:
+                events.append(PROFILE_UPDATED if profile.name in self.profiles else PROFILE_ADDED)
+                self.profiles[profile.name] = profile
+            self._index = None
+        for event, profile in zip(events, profiles):
+            self._notify(event, profile)
+        return len(profiles)
+
+def migrate_profiles(profiles_dir: Optional[Path] = None,
+                     database: Optional[Path] = None) -> SqliteProfileManager:
+    """
+    Copy the profiles of a JSON profile directory into a database.
+    
+    The directory is left untouched, so switching back keeps working.
+    Migrating again only copies profiles added or changed since.
+    
+    Args:
+        profiles_dir: Profile directory, or None for the default
+        database: Database path, or None for the default
+        
+    Returns:
+        SqliteProfileManager: Manager of the database
+    """
+    source = ProfileManager(profiles_dir)
+    target = SqliteProfileManager(database)
+    
+    # Profiles migrated before and unchanged since are skipped, without
+    # loading their options
+    def details(profile):
+        return profile.options_hash, profile.description, profile.updated_at
+    
+    stored = {profile.name: details(profile) for profile in target.get_profiles()}
+    count = target.import_profiles(
+        profile for profile in source.get_profiles()
+        if stored.get(profile.name) != details(profile)
+    )
+    logger.info(f"Migrated {count} profiles from {source.profiles_dir} to {target.database}")
+    return target
+
+def open_profile_manager(storage: str = "json") -> ProfileManager:
+    """
+    Open the profile manager of a storage backend.
+    
+    The first time the database backend is used, the JSON profiles are
+    migrated into it.
+    
+    Args:
+        storage: "json" for a directory of JSON files, "sqlite" for a database
+        
+    Returns:
+        ProfileManager: The manager
+    """
+    if storage == "sqlite":
+        try:
+            if PROFILE_DATABASE.exists():
+                return SqliteProfileManager()
+            return migrate_profiles()
+        except (sqlite3.Error, RuntimeError) as e:
+            logger.error(f"Error opening profile database, using JSON profiles: {e}")
+    elif storage != "json":
+        logger.warning(f"Unknown profile storage {storage}, using JSON profiles")
+    return ProfileManager()
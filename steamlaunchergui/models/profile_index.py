@@ -0,0 +1,265 @@
+"""
+Similarity index over saved profiles.
+
+Profiles are reduced to their compact encoding: a bitset of enabled
+toggles and tabs plus a mapping of valued options. Similarity is the
+Jaccard index over both, where a valued option counts as shared only if
+both sides hold the same value.
+"""
+
+import logging
+import heapq
+from collections import Counter
+from typing import Dict, FrozenSet, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.models.compact_options import CompactOptions
+
+logger = logging.getLogger(__name__)
+
+class ProfileMatch(NamedTuple):
+    """A profile and its similarity to a set of options."""
+    profile: object  # Profile
+    score: float     # 0.0 (nothing shared) to 1.0 (identical)
+
+class _Features(NamedTuple):
+    """Precomputed comparison features of one option set."""
+    bits: int              # Toggles, with enabled tabs above them
+    pairs: FrozenSet[int]  # Hashes of (key, value) of valued and unknown options
+    keys: FrozenSet[int]   # Hashes of their keys
+    size: int              # Number of set bits plus number of keys
+    values: Dict[Hashable, object]
+
+def _features(options: CompactOptions) -> _Features:
+    """Reduce compact options to comparison features."""
+    bits = options.toggles | options.tabs << len(options.catalog.options)
+    
+    values: Dict[Hashable, object] = {}
+    values.update(options.inputs)
+    values.update(options.dropdowns)
+    values.update(options.sliders)
+    for field, section, option, value in options.extra:
+        values[(field, section, option)] = value
+    for assignment in options.extra_env:
+        name, _, value = assignment.partition("=")
+        values[("env", name)] = value
+    if options.game_args:
+        values["game_args"] = options.game_args
+    
+    # Hashed once here, so set intersections compare plain integers
+    return _Features(bits, frozenset(map(hash, values.items())), frozenset(map(hash, values)),
+                     bin(bits).count("1") + len(values), values)
+
+def similarity(a: CompactOptions, b: CompactOptions) -> float:
+    """
+    Get the similarity of two option sets.
+    
+    Args:
+        a: First option set
+        b: Second option set
+        
+    Returns:
+        float: Jaccard similarity from 0.0 to 1.0
+    """
+    return _score(_features(a), _features(b))
+
+def _score(a: _Features, b: _Features) -> float:
+    """Jaccard similarity of two feature sets."""
+    shared_bits = bin(a.bits & b.bits).count("1")
+    union = a.size + b.size - shared_bits - len(a.keys & b.keys)
+    if not union:
+        return 1.0
+    return (shared_bits + len(a.pairs & b.pairs)) / union
+
+class ProfileIndex:
+    """
+    Finds the saved profiles closest to a set of launch options.
+    
+    Every feature (toggle or tab bit, valued option, option key) has a
+    posting list of the profiles holding it. A query only visits the
+    profiles sharing a feature with it, and counts what they share from
+    the posting lists of its own features.
+    """
+    
+    def __init__(self, profiles: Iterable = ()):
+        """
+        Build the index.
+        
+        Args:
+            profiles: Profiles to index
+        """
+        self._entries: List[Tuple[object, CompactOptions, _Features]] = []
+        self._bit_postings: Dict[int, List[int]] = {}
+        self._pair_postings: Dict[int, List[int]] = {}
+        self._key_postings: Dict[int, List[int]] = {}
+        self._empty: List[int] = []
+        self.rebuild(profiles)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def rebuild(self, profiles: Iterable) -> None:
+        """
+        Replace the indexed profiles.
+        
+        Args:
+            profiles: Profiles to index
+        """
+        entries = []
+        bit_postings: Dict[int, List[int]] = {}
+        pair_postings: Dict[int, List[int]] = {}
+        key_postings: Dict[int, List[int]] = {}
+        empty = []
+        for position, profile in enumerate(profiles):
+            options = profile.snapshot()
+            features = _features(options)
+            entries.append((profile, options, features))
+            
+            bits = features.bits
+            while bits:
+                bit = bits & -bits
+                bit_postings.setdefault(bit.bit_length() - 1, []).append(position)
+                bits ^= bit
+            for pair in features.pairs:
+                pair_postings.setdefault(pair, []).append(position)
+            for key in features.keys:
+                key_postings.setdefault(key, []).append(position)
+            if not features.size:
+                empty.append(position)
+        
+        self._entries = entries
+        self._bit_postings = bit_postings
+        self._pair_postings = pair_postings
+        self._key_postings = key_postings
+        self._empty = empty
+    
+    def match(self, options, k: int = 3, min_score: float = 0.0) -> List[ProfileMatch]:
+        """
+        Get the profiles most similar to a set of options.
+        
+        Args:
+            options: LaunchOptions or CompactOptions to match
+            k: Maximum number of matches
+            min_score: Minimum similarity of a match
+            
+        Returns:
+            List[ProfileMatch]: Matches, best first
+        """
+        if not isinstance(options, CompactOptions):
+            options = options.snapshot()
+        features = _features(options)
+        
+        # Per profile, the features shared with the query (the score's
+        # numerator) and the bits and keys held by both (subtracted from
+        # the sum of sizes to get the union)
+        shared = Counter()
+        overlap = Counter()
+        bits = features.bits
+        while bits:
+            bit = bits & -bits
+            posting = self._bit_postings.get(bit.bit_length() - 1)
+            if posting:
+                shared.update(posting)
+                overlap.update(posting)
+            bits ^= bit
+        for pair in features.pairs:
+            posting = self._pair_postings.get(pair)
+            if posting:
+                shared.update(posting)
+        for key in features.keys:
+            posting = self._key_postings.get(key)
+            if posting:
+                overlap.update(posting)
+        
+        # Every profile with a positive score shares a feature, except
+        # that an empty query is identical to the empty profiles
+        if features.size:
+            size = features.size
+            entries = self._entries
+            scored = []
+            for position, common in overlap.items():
+                count = shared[position]
+                if count:
+                    score = count / (size + entries[position][2].size - common)
+                    if score >= min_score:
+                        scored.append((score, -position))
+        else:
+            scored = [(1.0, -position) for position in self._empty]
+        best = heapq.nlargest(k, scored)
+        
+        # The remaining profiles all score zero, and rank by position
+        if len(best) < k and min_score <= 0.0:
+            taken = {-position for _, position in best}
+            for position in range(len(self._entries)):
+                if position not in taken:
+                    best.append((0.0, -position))
+                    if len(best) == k:
+                        break
+        
+        return [ProfileMatch(self._entries[-position][0], score) for score, position in best]
+    
+    def best_match(self, options, min_score: float = 0.0) -> Optional[ProfileMatch]:
+        """
+        Get the profile most similar to a set of options.
+        
+        Args:
+            options: LaunchOptions or CompactOptions to match
+            min_score: Minimum similarity of the match
+            
+        Returns:
+            ProfileMatch or None: The best match, or None if no profile
+                reaches min_score
+        """
+        matches = self.match(options, 1, min_score)
+        return matches[0] if matches else None
+
+def describe_differences(options: CompactOptions, reference: CompactOptions) -> List[str]:
+    """
+    List how an option set differs from a reference set.
+    
+    Args:
+        options: The option set, e.g. a game's launch options
+        reference: The reference set, e.g. a profile
+        
+    Returns:
+        List[str]: One entry per differing option, "+name" for options only
+            set in options, "-name" for options only set in the reference and
+            "~name" for options set to a different value
+    """
+    catalog = options.catalog
+    option_count = len(catalog.options)
+    tab_names = list(catalog.tabs)
+    
+    def bit_name(bit):
+        if bit < option_count:
+            spec = catalog.options[bit]
+            return f"{spec.tab}:{spec.name}" if spec.tab else spec.name
+        return f"tab {tab_names[bit - option_count]}"
+    
+    def value_name(key):
+        if isinstance(key, int):
+            spec = catalog.options[key]
+            return f"{spec.tab}:{spec.name}" if spec.tab else spec.name
+        if key == "game_args":
+            return "game arguments"
+        return ":".join(part for part in key[1:] if part)
+    
+    differences = []
+    a, b = _features(options), _features(reference)
+    
+    for prefix, bits in (("+", a.bits & ~b.bits), ("-", b.bits & ~a.bits)):
+        while bits:
+            bit = bits & -bits
+            differences.append(prefix + bit_name(bit.bit_length() - 1))
+            bits ^= bit
+    
+    a_values, b_values = a.values, b.values
+    for key, value in a_values.items():
+        if key not in b_values:
+            differences.append("+" + value_name(key))
+        elif b_values[key] != value:
+            differences.append("~" + value_name(key))
+    for key in b_values:
+        if key not in a_values:
+            differences.append("-" + value_name(key))
+    
+    return differences
@@ -0,0 +1,169 @@
+"""
+Manifest of the profiles directory.
+
+The manifest records the metadata of every profile file together with
+the file's modification time and size, plus the profile's launch options
+in their compact encoding and the hash of the option blob the file refers
+to. Profiles whose file is unchanged are listed
+from the manifest alone; their JSON body is only read when it is needed.
+"""
+
+import base64
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from steamlaunchergui.models.compact_options import CompactOptions
+
+logger = logging.getLogger(__name__)
+
+# File name of the manifest inside the profiles directory; profile file
+# names never start with a dot, so it cannot clash with a profile
+MANIFEST_NAME = ".index.json"
+
+# Bumped when the manifest layout changes; other versions are rebuilt
+MANIFEST_VERSION = 2
+
+# Serialized entries kept between manifest writes
+MANIFEST_CACHE_SIZE = 16384
+
+class ManifestEntry(NamedTuple):
+    """Metadata of one profile file."""
+    name: str
+    description: str
+    created_at: float
+    updated_at: float
+    mtime_ns: int           # Modification time of the file when recorded
+    size: int               # Size of the file when recorded
+    options: Optional[str]  # Base64 of CompactOptions.to_bytes(), if encodable
+    digest: Optional[str] = None  # Option blob the file refers to, if any
+    
+    def matches(self, stat: os.stat_result) -> bool:
+        """
+        Check whether a file is unchanged since the entry was recorded.
+        
+        Args:
+            stat: Current stat result of the file
+            
+        Returns:
+            bool: True if modification time and size are the same
+        """
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+def encode_options(launch_options) -> Optional[str]:
+    """
+    Encode launch options for the manifest.
+    
+    Args:
+        launch_options: LaunchOptions to encode
+        
+    Returns:
+        str or None: The encoded options, or None if they cannot be encoded
+    """
+    try:
+        return base64.b64encode(launch_options.snapshot().to_bytes()).decode("ascii")
+    except Exception as e:
+        logger.error(f"Error encoding launch options for the profile manifest: {e}")
+        return None
+
+def decode_options(data: Optional[str]) -> Optional[CompactOptions]:
+    """
+    Decode launch options stored by encode_options.
+    
+    Args:
+        data: The encoded options, or None
+        
+    Returns:
+        CompactOptions or None: The options, or None if missing, corrupt or
+            written with a different option catalog
+    """
+    if not data:
+        return None
+    try:
+        return CompactOptions.from_bytes(base64.b64decode(data))
+    except ValueError as e:
+        logger.debug("Ignoring stored profile options: %s", e)
+        return None
+
+def entry_for(profile, stat: os.stat_result, digest: Optional[str] = None) -> ManifestEntry:
+    """
+    Create the manifest entry of a profile.
+    
+    Args:
+        profile: The Profile
+        stat: Stat result of the profile file
+        digest: Hash of the option blob the file refers to, or None if the
+            file holds its launch options inline
+        
+    Returns:
+        ManifestEntry: The entry
+    """
+    return ManifestEntry(
+        profile.name, profile.description, profile.created_at, profile.updated_at,
+        stat.st_mtime_ns, stat.st_size, encode_options(profile.launch_options), digest
+    )
+
+def read_manifest(path: Path) -> Dict[str, ManifestEntry]:
+    """
+    Read a manifest.
+    
+    Args:
+        path: Path to the manifest file
+        
+    Returns:
+        Dict[str, ManifestEntry]: Entries keyed by profile file name, empty
+            if the manifest is missing, unreadable or of another version
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error(f"Error reading profile manifest {path}: {e}")
+        return {}
+    
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        logger.info(f"Ignoring profile manifest {path} of another version")
+        return {}
+    
+    entries = {}
+    for filename, fields in data.get("profiles", {}).items():
+        try:
+            entries[filename] = ManifestEntry(**fields)
+        except TypeError as e:
+            logger.error(f"Ignoring invalid manifest entry for {filename}: {e}")
+    return entries
+
+def write_manifest(path: Path, entries: Dict[str, ManifestEntry]) -> bool:
+    """
+    Write a manifest atomically.
+    
+    Args:
+        path: Path to the manifest file
+        entries: Entries keyed by profile file name
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    # Unchanged entries reuse their serialization from the previous write,
+    # so saving one profile does not re-encode all of them
+    profiles = ",".join(_serialize_entry(filename, entry) for filename, entry in entries.items())
+    temp_path = path.with_name(path.name + ".tmp")
+    
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(f'{{"version":{MANIFEST_VERSION},"profiles":{{{profiles}}}}}')
+        os.replace(temp_path, path)
+        return True
+    except Exception as e:
+        logger.error(f"Error writing profile manifest {path}: {e}")
+        return False
+
+@lru_cache(maxsize=MANIFEST_CACHE_SIZE)
+def _serialize_entry(filename: str, entry: ManifestEntry) -> str:
+    """Serialize one manifest entry as a JSON object member."""
+    return f"{json.dumps(filename)}:{json.dumps(entry._asdict(), separators=(',', ':'))}"
@@ -0,0 +1,351 @@
+"""
+Background persistence of profiles.
+
+Saving, deleting, importing and exporting profiles and bundles touch the
+disk, so dialogs queue them on a ProfileWriter instead of running them on
+the GTK thread. A repeated operation on a profile is coalesced with the
+queued one when nothing queued after it touches that profile: only the
+last one runs, and every caller waiting on it is told its result.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.models.launch_options import LaunchOptions
+from steamlaunchergui.models.profile_bundle import CONFLICT_RENAME, export_bundle, import_bundle
+from steamlaunchergui.models.profiles import Profile, ProfileManager
+
+logger = logging.getLogger(__name__)
+
+# Callback receiving the result of a queued operation
+Callback = Callable[[Any], None]
+
+class _Operation(NamedTuple):
+    """A queued profile operation."""
+    key: Tuple                    # Operations with equal keys may be coalesced
+    names: Optional[Tuple]        # Profiles it touches, None for any profile
+    function: Callable
+    args: Tuple
+    callbacks: List[Callback]     # Callers waiting for the result
+
+class ProfileWriter:
+    """
+    Worker thread running profile operations in the order they were queued.
+    
+    close() must be called before exiting, or queued operations are lost.
+    Results are handed to the callbacks through a dispatch function, e.g.
+    GLib.idle_add to run them on the GTK thread. Without one, callbacks run
+    on the worker thread.
+    """
+    
+    def __init__(self, profile_manager: ProfileManager,
+                 dispatch: Optional[Callable[..., Any]] = None):
+        """
+        Initialize the writer.
+        
+        Args:
+            profile_manager: Manager the operations are run on
+            dispatch: Called with a function and its arguments to run a
+                callback, or None to call it directly
+        """
+        self.profile_manager = profile_manager
+        self.dispatch = dispatch
+        
+        # Queued operations by sequence number, in the order they run
+        self._queue: "OrderedDict[int, _Operation]" = OrderedDict()
+        self._sequence = 0
+        # Sequence numbers of the last queued operation per key and per
+        # profile name, and of the last one that may touch any profile
+        self._last_key: Dict[Tuple, int] = {}
+        self._last_name: Dict[str, int] = {}
+        self._barrier = -1
+        self._condition = threading.Condition()
+        self._running = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.coalesced = 0
+    
+    def save(self, profile: Profile, callback: Optional[Callback] = None) -> None:
+        """
+        Queue saving a profile.
+        
+        The profile is written as it is when the worker gets to it, so
+        saving it again before then adds no write.
+        
+        Args:
+            profile: Profile to save
+            callback: Called with True if the profile was saved
+        """
+        self._submit(("profile", profile.name), (profile.name,),
+                     self.profile_manager.save_profile, (profile,), callback)
+    
+    def delete(self, name: str, callback: Optional[Callback] = None) -> None:
+        """
+        Queue deleting a profile, replacing a queued save of it.
+        
+        Args:
+            name: Name of the profile
+            callback: Called with True if the profile was deleted
+        """
+        self._submit(("profile", name), (name,), self.profile_manager.delete_profile,
+                     (name,), callback)
+    
+    def update_options(self, name: str, launch_options: LaunchOptions,
+                       callback: Optional[Callback] = None) -> None:
+        """
+        Queue replacing the launch options of a profile.
+        
+        The profile is looked up and updated on the worker. The writer keeps
+        a copy of the options, so the caller may go on editing them.
+        
+        Args:
+            name: Name of the profile
+            launch_options: New launch options
+            callback: Called with True if the profile was saved
+        """
+        self._submit(("options", name), (name,), self._update_options,
+                     (name, launch_options.copy()), callback)
+    
+    def _update_options(self, name: str, launch_options: LaunchOptions) -> bool:
+        """Replace the launch options of a profile, on the worker."""
+        profile = self.profile_manager.get_profile(name)
+        if profile is None:
+            logger.error(f"Profile not found: {name}")
+            return False
+        
+        profile.update(launch_options)
+        return self.profile_manager.save_profile(profile)
+    
+    def update_details(self, name: str, new_name: str, description: str,
+                       callback: Optional[Callback] = None) -> None:
+        """
+        Queue renaming a profile and changing its description.
+        
+        The profile is looked up and its options are loaded on the worker.
+        A renamed profile is saved under its new name first; the old name
+        is only deleted once that save succeeded.
+        
+        Args:
+            name: Current name of the profile
+            new_name: Name to store the profile under, may equal name
+            description: New description
+            callback: Called with True if the profile was updated
+        """
+        # Touching both names keeps it ordered against operations on either
+        self._submit(("details", name, new_name), (name, new_name), self._update_details,
+                     (name, new_name, description), callback)
+    
+    def _update_details(self, name: str, new_name: str, description: str) -> bool:
+        """Rename a profile and set its description, on the worker."""
+        profile = self.profile_manager.get_profile(name)
+        if profile is None:
+            logger.error(f"Profile not found: {name}")
+            return False
+        
+        if new_name == name:
+            profile.description = description
+            profile.updated_at = time.time()
+            return self.profile_manager.save_profile(profile)
+        
+        # The name is the key, so the profile is stored anew
+        renamed = Profile(new_name, description, profile.launch_options)
+        renamed.created_at = profile.created_at
+        renamed.updated_at = time.time()
+        if not self.profile_manager.save_profile(renamed):
+            return False
+        return self.profile_manager.delete_profile(name)
+    
+    def import_file(self, filepath: Path, callback: Optional[Callback] = None) -> None:
+        """
+        Queue importing a profile file.
+        
+        Args:
+            filepath: Path to the profile file
+            callback: Called with the imported Profile, or None on failure
+        """
+        self._submit(("import", str(filepath)), None, self.profile_manager.import_profile,
+                     (filepath,), callback)
+    
+    def export(self, name: str, filepath: Path, callback: Optional[Callback] = None) -> None:
+        """
+        Queue exporting a profile to a file.
+        
+        Args:
+            name: Name of the profile
+            filepath: Path to write
+            callback: Called with True if the profile was exported
+        """
+        self._submit(("export", str(filepath)), (name,), self.profile_manager.export_profile,
+                     (name, filepath), callback)
+    
+    def import_bundle(self, filepath: Path, conflict: str = CONFLICT_RENAME,
+                      callback: Optional[Callback] = None) -> None:
+        """
+        Queue importing a profile bundle.
+        
+        Args:
+            filepath: Path to the bundle
+            conflict: Policy for profiles whose name is taken, see import_bundle
+            callback: Called with the BundleImportResult, or None on failure
+        """
+        self._submit(("import", str(filepath)), None, import_bundle,
+                     (self.profile_manager, filepath, conflict), callback)
+    
+    def export_bundle(self, filepath: Path, names: Optional[Iterable[str]] = None,
+                      callback: Optional[Callback] = None) -> None:
+        """
+        Queue exporting profiles to a bundle.
+        
+        Args:
+            filepath: Path to write
+            names: Names of the profiles to export, or None for all profiles
+            callback: Called with the number of profiles exported, or -1 on
+                failure
+        """
+        if names is not None:
+            names = list(names)
+        self._submit(("export", str(filepath)), None if names is None else tuple(names),
+                     export_bundle, (self.profile_manager, filepath, names), callback)
+    
+    def _submit(self, key: Tuple, names: Optional[Tuple], function: Callable, args: Tuple,
+                callback: Optional[Callback]) -> None:
+        """
+        Queue an operation.
+        
+        It replaces a queued operation with the same key if that is still
+        the last queued operation touching its profiles, so the order of
+        operations on each profile is kept.
+        
+        Args:
+            key: Operations with equal keys do the same thing to the same
+                profiles and may be coalesced
+            names: Names of the profiles the operation touches, or None if
+                it may touch any profile
+            function: Function to run on the worker
+            args: Arguments of the function
+            callback: Called with the result of the function
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Profile writer is closed")
+            
+            sequence = self._last_key.get(key)
+            if sequence is not None and self._is_last(sequence, names):
+                queued = self._queue[sequence]
+                self._queue[sequence] = queued._replace(function=function, args=args)
+                if callback is not None:
+                    queued.callbacks.append(callback)
+                self.coalesced += 1
+                return
+            
+            sequence = self._sequence
+            self._sequence += 1
+            self._queue[sequence] = _Operation(
+                key, names, function, args, [] if callback is None else [callback]
+            )
+            self._last_key[key] = sequence
+            if names is None:
+                self._barrier = sequence
+            else:
+                for name in names:
+                    self._last_name[name] = sequence
+            self._ensure_worker()
+            self._condition.notify()
+    
+    def _is_last(self, sequence: int, names: Optional[Tuple]) -> bool:
+        """Whether no operation queued after the given one touches its profiles."""
+        if names is None:
+            return sequence == self._sequence - 1
+        return sequence > self._barrier and all(
+            self._last_name.get(name) == sequence for name in names
+        )
+    
+    def _forget(self, sequence: int, operation: _Operation) -> None:
+        """Drop the bookkeeping of an operation taken off the queue."""
+        if self._last_key.get(operation.key) == sequence:
+            del self._last_key[operation.key]
+        for name in operation.names or ():
+            if self._last_name.get(name) == sequence:
+                del self._last_name[name]
+    
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._worker, name="profile-writer", daemon=True
+            )
+            self._thread.start()
+    
+    def _worker(self) -> None:
+        """Run queued operations until the writer is closed."""
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                sequence, operation = self._queue.popitem(last=False)
+                self._forget(sequence, operation)
+                self._running = True
+            
+            try:
+                result = operation.function(*operation.args)
+            except Exception as e:
+                logger.error(f"Error in profile operation {operation.function.__name__}: {e}")
+                result = None
+            
+            for callback in operation.callbacks:
+                self._report(callback, result)
+            
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+    
+    def _report(self, callback: Callback, result: Any) -> None:
+        """Hand a result to a callback through the dispatch function."""
+        if self.dispatch is None:
+            self._call(callback, result)
+        else:
+            self.dispatch(self._call, callback, result)
+    
+    @staticmethod
+    def _call(callback: Callback, result: Any) -> bool:
+        """Run a callback; returns False so idle sources run once."""
+        try:
+            callback(result)
+        except Exception as e:
+            logger.error(f"Error in profile operation callback: {e}")
+        return False
+    
+    @property
+    def pending(self) -> int:
+        """Number of operations queued or running."""
+        with self._condition:
+            return len(self._queue) + self._running
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued operations have run.
+        
+        Args:
+            timeout: Seconds to wait at most, or None to wait until done
+            
+        Returns:
+            bool: True if the queue was emptied in time
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._running, timeout
+            )
+    
+    def close(self) -> None:
+        """Run the queued operations and stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
@@ -5,14 +5,54 @@ Profiles management for SteamLauncherGUI.
 import os
 import json
 import logging
+import threading
 import time
+from collections import Counter
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from steamlaunchergui.models.compact_options import CompactOptions
 from steamlaunchergui.models.launch_options import LaunchOptions
+from steamlaunchergui.models.option_store import OptionStore, options_digest
+from steamlaunchergui.models.profile_index import ProfileIndex, ProfileMatch
+from steamlaunchergui.models.profile_manifest import (
+    MANIFEST_NAME, ManifestEntry, decode_options, entry_for, read_manifest, write_manifest
+)
 
 logger = logging.getLogger(__name__)
 
+# Directory of option blobs inside the profiles directory
+OPTION_STORE_NAME = ".options"
+
+# Serializes loading the launch options of lazy profiles across threads
+_load_lock = threading.Lock()
+
+# Events reported to ProfileManager listeners
+PROFILE_ADDED = "added"
+PROFILE_UPDATED = "updated"
+PROFILE_REMOVED = "removed"
+PROFILES_RELOADED = "reloaded"
+
+# Listener receiving an event and the profile concerned, or None on reload
+ProfileListener = Callable[[str, Optional['Profile']], None]
+
+def write_json(filepath: Path, data: Any) -> None:
+    """
+    Write JSON data to a file atomically.
+    
+    Args:
+        filepath: Path to write
+        data: JSON-serializable data
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    temp_path = filepath.with_name(filepath.name + ".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(temp_path, filepath)
+
 class Profile:
     """
     A configuration profile for launch options.
@@ -31,16 +71,116 @@ class Profile:
         self.description = description
         self.created_at = time.time()
         self.updated_at = time.time()
-        self.launch_options = launch_options or LaunchOptions()
+        self._launch_options = launch_options
+        self._loader: Optional[Callable[[], LaunchOptions]] = None
+        self._stored_options: Optional[str] = None
+        self._digest: Optional[str] = None
+    
+    @classmethod
+    def lazy(cls, name: str, description: str, created_at: float, updated_at: float,
+             loader: Callable[[], LaunchOptions], stored_options: Optional[str] = None,
+             digest: Optional[str] = None) -> 'Profile':
+        """
+        Create a profile whose launch options are loaded on first access.
+        
+        Args:
+            name: Profile name
+            description: Profile description
+            created_at: Creation time
+            updated_at: Time of the last update
+            loader: Returns the launch options from storage
+            stored_options: Launch options encoded by encode_options, used
+                by snapshot() until they are loaded
+            digest: Hash of the stored launch options, used by options_hash
+                until they are loaded
+            
+        Returns:
+            Profile: New profile instance
+        """
+        profile = cls(name, description)
+        profile.created_at = created_at
+        profile.updated_at = updated_at
+        profile._loader = loader
+        profile._stored_options = stored_options
+        profile._digest = digest
+        return profile
+    
+    @classmethod
+    def from_manifest(cls, entry: ManifestEntry, loader: Callable[[], LaunchOptions]) -> 'Profile':
+        """
+        Create a profile from its manifest entry.
+        
+        Args:
+            entry: Manifest entry of the profile
+            loader: Returns the launch options from the profile file
+            
+        Returns:
+            Profile: New profile instance
+        """
+        return cls.lazy(entry.name, entry.description, entry.created_at, entry.updated_at,
+                        loader, entry.options, entry.digest)
+    
+    @property
+    def launch_options(self) -> LaunchOptions:
+        """Launch options of the profile, loaded on first access."""
+        if self._launch_options is None:
+            with _load_lock:
+                if self._launch_options is None:
+                    loader, self._loader = self._loader, None
+                    self._launch_options = loader() if loader else LaunchOptions()
+        return self._launch_options
+    
+    @launch_options.setter
+    def launch_options(self, launch_options: LaunchOptions) -> None:
+        self._launch_options = launch_options
+        self._loader = None
+        self._stored_options = None
+        self._digest = None
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the launch options have been loaded."""
+        return self._launch_options is not None
+    
+    def snapshot(self) -> CompactOptions:
+        """
+        Get the compact form of the launch options.
+        
+        Until the launch options are loaded, the form recorded in the
+        profile manifest is used if it is still valid.
+        
+        Returns:
+            CompactOptions: The launch options
+        """
+        if self._launch_options is None:
+            options = decode_options(self._stored_options)
+            if options is not None:
+                return options
+        return self.launch_options.snapshot()
+    
+    @property
+    def options_hash(self) -> str:
+        """
+        Hash of the canonical form of the launch options.
+        
+        Profiles with equal launch options have equal hashes, so comparing
+        them does not need their options loaded.
+        """
+        if self._launch_options is None and self._digest is not None:
+            return self._digest
+        return options_digest(self.snapshot())
     
     def update(self, launch_options: LaunchOptions) -> None:
         """
         Update the profile with new launch options.
         
+        The profile keeps a copy, so later edits of the given options do
+        not change it.
+        
         Args:
             launch_options: New launch options
         """
-        self.launch_options = launch_options
+        self.launch_options = launch_options.copy()
         self.updated_at = time.time()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -87,6 +227,18 @@ class Profile:
 class ProfileManager:
     """
     Manager for configuration profiles.
+    
+    Profiles are stored as one JSON file each. A manifest in the same
+    directory records their metadata, so listing them only reads the files
+    that changed since the manifest was written.
+    
+    Profile files refer to their launch options by hash; the options are
+    stored once per distinct set in an OptionStore and removed when no
+    profile refers to them any more. Files written with inline launch
+    options are still read and are converted when next saved.
+    
+    Listeners are told about every added, updated and removed profile, on
+    the thread that made the change.
     """
     
     def __init__(self, profiles_dir: Optional[Path] = None):
@@ -101,7 +253,23 @@ class ProfileManager:
             profiles_dir = Path.home() / ".config" / "steamlaunchergui" / "profiles"
         
         self.profiles_dir = profiles_dir
+        self.manifest_path = profiles_dir / MANIFEST_NAME
+        self.option_store = OptionStore(profiles_dir / OPTION_STORE_NAME)
         self.profiles: Dict[str, Profile] = {}
+        self._index: Optional[ProfileIndex] = None
+        
+        # Profile file names by profile name, and manifest entries by file name
+        self._files: Dict[str, str] = {}
+        self._manifest: Dict[str, ManifestEntry] = {}
+        
+        # Number of manifest entries referring to each option blob
+        self._references: Counter = Counter()
+        
+        # Guards the in-memory state, which a ProfileWriter changes from its
+        # worker thread; file I/O happens outside of it where possible
+        self._lock = threading.RLock()
+        self._manifest_lock = threading.Lock()
+        self._listeners: List[ProfileListener] = []
         
         # Create the profiles directory if it doesn't exist
         os.makedirs(self.profiles_dir, exist_ok=True)
@@ -109,21 +277,155 @@ class ProfileManager:
         # Load existing profiles
         self.load_profiles()
     
+    def add_listener(self, callback: ProfileListener) -> None:
+        """
+        Register a callback for profile changes.
+        
+        The callback receives PROFILE_ADDED, PROFILE_UPDATED or
+        PROFILE_REMOVED with the profile concerned, or PROFILES_RELOADED
+        with None after all profiles were listed again. It is called on the
+        thread that made the change, e.g. the worker of a ProfileWriter.
+        
+        Args:
+            callback: Function to call after each change
+        """
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback: ProfileListener) -> None:
+        """
+        Unregister a change callback.
+        
+        Args:
+            callback: Previously registered function
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self, event: str, profile: Optional[Profile]) -> None:
+        """Call the registered listeners."""
+        for callback in list(self._listeners):
+            try:
+                callback(event, profile)
+            except Exception as e:
+                logger.error(f"Error in profile listener: {e}")
+    
     def load_profiles(self) -> None:
-        """Load all profiles from the profiles directory."""
+        """
+        Load all profiles from the profiles directory.
+        
+        Profiles whose file is unchanged since the manifest was written are
+        listed from the manifest; only new or changed files are read.
+        """
         self.profiles.clear()
+        self._files.clear()
+        self._references.clear()
+        self._index = None
+        
+        manifest = read_manifest(self.manifest_path)
+        entries: Dict[str, ManifestEntry] = {}
         
         try:
-            for profile_file in self.profiles_dir.glob("*.json"):
-                try:
-                    with open(profile_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        profile = Profile.from_dict(data)
+            with os.scandir(self.profiles_dir) as directory:
+                for file_entry in directory:
+                    filename = file_entry.name
+                    if filename.startswith(".") or not filename.endswith(".json"):
+                        continue
+                    
+                    try:
+                        stat = file_entry.stat()
+                        entry = manifest.get(filename)
+                        if entry is not None and entry.matches(stat):
+                            profile = Profile.from_manifest(
+                                entry, partial(self._load_launch_options, filename)
+                            )
+                        else:
+                            profile, digest = self._read_profile(Path(file_entry.path))
+                            if profile is None:
+                                continue
+                            entry = entry_for(profile, stat, digest)
+                        
+                        entries[filename] = entry
+                        if entry.digest is not None:
+                            self._references[entry.digest] += 1
                         self.profiles[profile.name] = profile
-                except Exception as e:
-                    logger.error(f"Error loading profile from {profile_file}: {e}")
+                        self._files[profile.name] = filename
+                    except Exception as e:
+                        logger.error(f"Error loading profile from {file_entry.path}: {e}")
         except Exception as e:
             logger.error(f"Error accessing profiles directory: {e}")
+        
+        self._manifest = entries
+        if entries != manifest:
+            write_manifest(self.manifest_path, entries)
+        
+        logger.debug("Loaded %d profiles, %d from the manifest",
+                     len(self.profiles), sum(not p.loaded for p in self.profiles.values()))
+        self._notify(PROFILES_RELOADED, None)
+    
+    def _read_profile(self, filepath: Path) -> Tuple[Optional[Profile], Optional[str]]:
+        """
+        Read a profile file.
+        
+        Args:
+            filepath: Path to the profile file
+            
+        Returns:
+            Tuple: The profile, or None if it could not be read, and the hash
+                of the option blob the file refers to, or None if the file
+                holds its launch options inline
+        """
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            digest = data.pop('options', None)
+            if digest is not None:
+                options = self.option_store.get(digest)
+                if options is None:
+                    raise ValueError(f"missing option set {digest}")
+                data['launch_options'] = options
+            
+            return Profile.from_dict(data), digest
+        except Exception as e:
+            logger.error(f"Error loading profile from {filepath}: {e}")
+            return None, None
+    
+    def _load_launch_options(self, filename: str) -> LaunchOptions:
+        """Read the launch options of a profile listed from the manifest."""
+        entry = self._manifest.get(filename)
+        if entry is not None and entry.digest is not None:
+            options = self.option_store.get(entry.digest)
+            if options is not None:
+                launch_options = LaunchOptions()
+                launch_options.from_dict(options)
+                return launch_options
+        
+        profile, _ = self._read_profile(self.profiles_dir / filename)
+        return profile.launch_options if profile else LaunchOptions()
+    
+    def _set_entry(self, filename: str, entry: Optional[ManifestEntry]) -> None:
+        """
+        Replace or remove the manifest entry of a profile file.
+        
+        Option blobs no longer referred to by any entry are removed.
+        
+        Args:
+            filename: Profile file name
+            entry: New entry, or None to remove it
+        """
+        if entry is None:
+            old_entry = self._manifest.pop(filename, None)
+        else:
+            old_entry = self._manifest.get(filename)
+            self._manifest[filename] = entry
+            if entry.digest is not None:
+                self._references[entry.digest] += 1
+        
+        if old_entry is not None and old_entry.digest is not None:
+            self._references[old_entry.digest] -= 1
+            if self._references[old_entry.digest] <= 0:
+                del self._references[old_entry.digest]
+                self.option_store.discard(old_entry.digest)
     
     def save_profile(self, profile: Profile) -> bool:
         """
@@ -135,18 +437,77 @@ class ProfileManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        filename = self._safe_filename(profile.name) + ".json"
-        filepath = self.profiles_dir / filename
+        if not self._write_profile(profile):
+            return False
         
+        self._save_manifest()
+        return True
+    
+    def import_profiles(self, profiles: Iterable[Profile]) -> int:
+        """
+        Save many profiles, writing the manifest once.
+        
+        Args:
+            profiles: Profiles to save
+            
+        Returns:
+            int: Number of profiles saved
+        """
+        count = sum(1 for profile in profiles if self._write_profile(profile))
+        self._save_manifest()
+        return count
+    
+    def _save_manifest(self) -> None:
+        """Write the in-memory manifest."""
+        with self._lock:
+            entries = dict(self._manifest)
+        with self._manifest_lock:
+            write_manifest(self.manifest_path, entries)
+    
+    def _write_profile(self, profile: Profile) -> bool:
+        """
+        Write a profile file and update the in-memory manifest.
+        
+        Args:
+            profile: Profile to write
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(profile.to_dict(), f, indent=2)
+            if not isinstance(profile.name, str) or not profile.name:
+                raise ValueError(f"Invalid profile name: {profile.name!r}")
+            filename = self._safe_filename(profile.name) + ".json"
+            filepath = self.profiles_dir / filename
+            
+            # Profiles whose options are stored already, loaded or not,
+            # only need their file rewritten
+            digest = profile.options_hash
+            if digest not in self.option_store:
+                digest = self.option_store.put(profile.launch_options)
+            
+            data = {
+                'name': profile.name,
+                'description': profile.description,
+                'created_at': profile.created_at,
+                'updated_at': profile.updated_at,
+                'options': digest
+            }
+            write_json(filepath, data)
+            entry = entry_for(profile, os.stat(filepath), digest)
             
             # Update our in-memory cache
-            self.profiles[profile.name] = profile
+            with self._lock:
+                existed = profile.name in self.profiles
+                self.profiles[profile.name] = profile
+                self._files[profile.name] = filename
+                self._index = None
+                self._set_entry(filename, entry)
+            
+            self._notify(PROFILE_UPDATED if existed else PROFILE_ADDED, profile)
             return True
         except Exception as e:
-            logger.error(f"Error saving profile to {filepath}: {e}")
+            logger.error(f"Error saving profile {profile.name!r}: {e}")
             return False
     
     def delete_profile(self, name: str) -> bool:
@@ -163,7 +524,7 @@ class ProfileManager:
             logger.warning(f"Profile not found: {name}")
             return False
         
-        filename = self._safe_filename(name) + ".json"
+        filename = self._files.get(name) or self._safe_filename(name) + ".json"
         filepath = self.profiles_dir / filename
         
         try:
@@ -171,7 +532,18 @@ class ProfileManager:
                 os.remove(filepath)
             
             # Remove from our in-memory cache
-            del self.profiles[name]
+            with self._lock:
+                profile = self.profiles.pop(name, None)
+                self._files.pop(name, None)
+                self._index = None
+                listed = filename in self._manifest
+                if listed:
+                    self._set_entry(filename, None)
+            
+            if listed:
+                self._save_manifest()
+            if profile is not None:
+                self._notify(PROFILE_REMOVED, profile)
             return True
         except Exception as e:
             logger.error(f"Error deleting profile {name}: {e}")
@@ -181,13 +553,62 @@ class ProfileManager:
         """
         Get a profile by name.
         
+        A profile whose file was changed or removed outside the application
+        since it was listed is reloaded or dropped first.
+        
         Args:
             name: Profile name
             
         Returns:
             Profile or None: The profile if found, None otherwise
         """
-        return self.profiles.get(name)
+        profile = self.profiles.get(name)
+        filename = self._files.get(name)
+        if profile is None or filename is None:
+            return profile
+        
+        filepath = self.profiles_dir / filename
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            logger.info(f"Profile {name} was removed from {filepath}")
+            with self._lock:
+                self.profiles.pop(name, None)
+                self._files.pop(name, None)
+                self._set_entry(filename, None)
+                self._index = None
+            self._save_manifest()
+            self._notify(PROFILE_REMOVED, profile)
+            return None
+        except OSError as e:
+            logger.error(f"Error checking profile file {filepath}: {e}")
+            return profile
+        
+        entry = self._manifest.get(filename)
+        if entry is not None and entry.matches(stat):
+            return profile
+        
+        reloaded, digest = self._read_profile(filepath)
+        if reloaded is None:
+            return profile
+        
+        logger.info(f"Reloading profile {name} changed in {filepath}")
+        entry = entry_for(reloaded, stat, digest)
+        with self._lock:
+            self.profiles.pop(name, None)
+            self._files.pop(name, None)
+            self.profiles[reloaded.name] = reloaded
+            self._files[reloaded.name] = filename
+            self._set_entry(filename, entry)
+            self._index = None
+        self._save_manifest()
+        
+        if reloaded.name == name:
+            self._notify(PROFILE_UPDATED, reloaded)
+        else:
+            self._notify(PROFILE_REMOVED, profile)
+            self._notify(PROFILE_ADDED, reloaded)
+        return reloaded
     
     def get_profiles(self) -> List[Profile]:
         """
@@ -196,7 +617,48 @@ class ProfileManager:
         Returns:
             List[Profile]: List of all profiles
         """
-        return list(self.profiles.values())
+        with self._lock:
+            return list(self.profiles.values())
+    
+    @property
+    def index(self) -> ProfileIndex:
+        """Similarity index over the profiles, rebuilt after changes."""
+        with self._lock:
+            if self._index is None:
+                self._index = ProfileIndex(self.profiles.values())
+            return self._index
+    
+    def match_profiles(self, launch_options: LaunchOptions, k: int = 3,
+                       min_score: float = 0.0) -> List[ProfileMatch]:
+        """
+        Find the profiles closest to a set of launch options.
+        
+        Args:
+            launch_options: Options to match
+            k: Maximum number of matches
+            min_score: Minimum similarity from 0.0 to 1.0
+            
+        Returns:
+            List[ProfileMatch]: Matches, best first
+        """
+        return self.index.match(launch_options, k, min_score)
+    
+    def find_identical_profiles(self, launch_options: LaunchOptions) -> List[Profile]:
+        """
+        Find the profiles whose launch options equal the given ones.
+        
+        Profiles are compared by the hash of their options, so profiles
+        that were not loaded yet stay unloaded.
+        
+        Args:
+            launch_options: Options to compare
+            
+        Returns:
+            List[Profile]: Profiles with the same options, sorted by name
+        """
+        digest = options_digest(launch_options)
+        return sorted((profile for profile in self.get_profiles()
+                       if profile.options_hash == digest), key=lambda profile: profile.name)
     
     def import_profile(self, filepath: Path) -> Optional[Profile]:
         """
@@ -243,13 +705,15 @@ class ProfileManager:
             return False
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(profile.to_dict(), f, indent=2)
+            write_json(filepath, profile.to_dict())
             return True
         except Exception as e:
             logger.error(f"Error exporting profile to {filepath}: {e}")
             return False
     
+    def close(self) -> None:
+        """Release the storage; profile files need no cleanup."""
+    
     def _safe_filename(self, name: str) -> str:
         """
         Convert a profile name to a safe filename.
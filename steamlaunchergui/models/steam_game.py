@@ -98,16 +98,7 @@ class SteamGame:
             return self._proton_prefix
             
         # Proton prefixes are typically in steamapps/compatdata/<app_id>
-        compat_data_path = steam_dir / "steamapps" / "compatdata" / self.app_id
-        
-        # Also check in other library locations
-        if not compat_data_path.exists():
-            library_folders = self._find_library_folders(steam_dir)
-            for library in library_folders:
-                candidate = library / "steamapps" / "compatdata" / self.app_id
-                if candidate.exists():
-                    compat_data_path = candidate
-                    break
+        compat_data_path = self._find_compat_data_path(steam_dir)
         
         if compat_data_path.exists():
             # The actual prefix is in the pfx directory
@@ -140,16 +131,7 @@ class SteamGame:
             return self._current_proton_version
             
         # Check in the game's compatdata directory for version info
-        compat_data_path = steam_dir / "steamapps" / "compatdata" / self.app_id
-        
-        # Also check in other library locations
-        if not compat_data_path.exists():
-            library_folders = self._find_library_folders(steam_dir)
-            for library in library_folders:
-                candidate = library / "steamapps" / "compatdata" / self.app_id
-                if candidate.exists():
-                    compat_data_path = candidate
-                    break
+        compat_data_path = self._find_compat_data_path(steam_dir)
         
         if compat_data_path.exists():
             # Look for version.txt or similar files
@@ -181,6 +163,54 @@ class SteamGame:
         # This would require parsing the Steam config files
         return ""
     
+    def get_proton_state_files(self, steam_dir: Path) -> List[Path]:
+        """
+        Get the files the Proton prefix and version are looked up in.
+        
+        Steam changes them when the game is switched to another Proton
+        version or first run with one, so callers caching the results of
+        get_proton_prefix and get_current_proton_version can compare their
+        modification times to tell when to look again.
+        
+        Args:
+            steam_dir: Path to the Steam directory
+            
+        Returns:
+            List[Path]: Steam's configuration with the compatibility tool
+                of each game, the game's compatdata directory and its
+                version file; the files need not exist
+        """
+        compat_data_path = self._find_compat_data_path(steam_dir)
+        return [steam_dir / "config" / "config.vdf", compat_data_path, compat_data_path / "version"]
+    
+    def clear_proton_cache(self) -> None:
+        """Forget the Proton prefix and version found by earlier lookups."""
+        self._proton_prefix = None
+        self._current_proton_version = None
+    
+    def _find_compat_data_path(self, steam_dir: Path) -> Path:
+        """
+        Find the compatdata directory of this game.
+        
+        Args:
+            steam_dir: Path to the Steam directory
+            
+        Returns:
+            Path: The directory in the first library that has one, or the
+                path in the main library if none exists
+        """
+        compat_data_path = steam_dir / "steamapps" / "compatdata" / self.app_id
+        
+        # Also check in other library locations
+        if not compat_data_path.exists():
+            library_folders = self._find_library_folders(steam_dir)
+            for library in library_folders:
+                candidate = library / "steamapps" / "compatdata" / self.app_id
+                if candidate.exists():
+                    return candidate
+        
+        return compat_data_path
+    
     def launch_with_proton(self, proton_version: str, steam_dir: Path, env_vars: Dict[str, str] = None) -> bool:
         """
         Launch the game with a specific Proton version without using Steam.
@@ -7,3 +7,4 @@ from .main_window import SteamLauncherWindow
 from .general_tab import create_general_tab
 from .tab_builder import create_tab_content
 from .profile_manager_dialog import ProfileManagerDialog
+from .option_search import OptionSearchDialog
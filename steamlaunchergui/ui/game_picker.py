@@ -0,0 +1,231 @@
+"""
+Search-as-you-type game picker for SteamLauncherGUI.
+
+Games are listed in a fixed-height tree view, which only renders the
+visible rows, under a filter model driven by a visibility column. Each
+query runs against a GameSearchIndex, and only the rows whose visibility
+changed since the previous query are touched.
+"""
+
+import logging
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gtk, Pango
+
+from steamlaunchergui.models.game_search import GameSearchIndex
+
+logger = logging.getLogger(__name__)
+
+# Store columns
+COLUMN_NAME, COLUMN_APP_ID, COLUMN_VISIBLE = range(3)
+
+# Rows changed at once beyond which the view is detached while updating
+DETACH_THRESHOLD = 200
+
+class GamePicker(Gtk.Box):
+    """
+    Search entry over a filtered list of games.
+    """
+    
+    def __init__(self, on_selected):
+        """
+        Initialize the picker.
+        
+        Args:
+            on_selected: Called with the app ID of a newly selected game
+        """
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        self.on_selected = on_selected
+        
+        self._entries = ()
+        self._iters = []
+        self._positions = {}
+        self._reported = None
+        self._index = GameSearchIndex(())
+        self._visible = self._index.all
+        self._updating = False
+        
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_placeholder_text("Search games by name or App ID")
+        self.search_entry.connect("search-changed", self._on_search_changed)
+        self.search_entry.connect("activate", self._on_search_activate)
+        self.pack_start(self.search_entry, False, False, 0)
+        
+        self.store = Gtk.ListStore(str, str, bool)  # name, app_id, visible
+        self.filter = self._create_filter(self.store)
+        
+        self.tree_view = Gtk.TreeView(model=self.filter)
+        self.tree_view.set_headers_visible(False)
+        self.tree_view.set_enable_search(False)
+        self.tree_view.set_fixed_height_mode(True)
+        
+        name_renderer = Gtk.CellRendererText(ellipsize=Pango.EllipsizeMode.END)
+        name_column = Gtk.TreeViewColumn("Game", name_renderer, text=COLUMN_NAME)
+        name_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+        name_column.set_expand(True)
+        self.tree_view.append_column(name_column)
+        
+        app_id_renderer = Gtk.CellRendererText(xalign=1.0)
+        app_id_column = Gtk.TreeViewColumn("App ID", app_id_renderer, text=COLUMN_APP_ID)
+        app_id_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+        app_id_column.set_fixed_width(90)
+        self.tree_view.append_column(app_id_column)
+        
+        self.tree_view.get_selection().connect("changed", self._on_selection_changed)
+        
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_min_content_height(160)
+        scrolled.add(self.tree_view)
+        self.pack_start(scrolled, True, True, 0)
+    
+    @staticmethod
+    def _create_filter(store):
+        """Create a filter model showing the visible rows of a store."""
+        model_filter = store.filter_new()
+        model_filter.set_visible_column(COLUMN_VISIBLE)
+        return model_filter
+    
+    def set_games(self, games):
+        """
+        Show a list of games.
+        
+        The list is only rebuilt if names or app IDs changed. The new store
+        is filled before it is attached, so the view redraws once.
+        
+        Args:
+            games: The SteamGame objects
+            
+        Returns:
+            bool: Whether the list changed
+        """
+        entries = tuple(sorted((game.name, game.app_id) for game in games))
+        if entries == self._entries:
+            return False
+        
+        selected = self.get_selected()
+        index = GameSearchIndex(entries)
+        visible = index.search(self.search_entry.get_text())
+        
+        store = Gtk.ListStore(str, str, bool)
+        iters = [store.append([name, app_id, position in visible])
+                 for position, (name, app_id) in enumerate(entries)]
+        
+        self._updating = True
+        try:
+            self.store = store
+            self.filter = self._create_filter(store)
+            self.tree_view.set_model(self.filter)
+        finally:
+            self._updating = False
+        
+        self._entries = entries
+        self._iters = iters
+        self._positions = {app_id: position for position, (_, app_id) in enumerate(entries)}
+        self._index = index
+        self._visible = visible
+        
+        if selected is not None:
+            self.select(selected)
+        
+        logger.debug("Game picker holds %d games", len(entries))
+        return True
+    
+    def get_selected(self):
+        """
+        Get the app ID of the selected game.
+        
+        Returns:
+            str or None: The app ID, or None if no game is selected
+        """
+        model, tree_iter = self.tree_view.get_selection().get_selected()
+        if tree_iter is None:
+            return None
+        return model[tree_iter][COLUMN_APP_ID]
+    
+    def select(self, app_id):
+        """
+        Select a game if it is listed.
+        
+        Args:
+            app_id: Steam App ID
+            
+        Returns:
+            bool: Whether the game was selected
+        """
+        position = self._positions.get(app_id)
+        if position is None:
+            return False
+        return self._select_position(position)
+    
+    def select_first(self):
+        """
+        Select the first listed game.
+        
+        Returns:
+            bool: Whether a game was selected
+        """
+        tree_iter = self.filter.get_iter_first()
+        if tree_iter is None:
+            return False
+        self._select_filter_iter(tree_iter)
+        return True
+    
+    def _select_position(self, position):
+        """Select the row of an entry if it passes the filter."""
+        if position not in self._visible:
+            return False
+        store_path = self.store.get_path(self._iters[position])
+        filter_path = self.filter.convert_child_path_to_path(store_path)
+        if filter_path is None:
+            return False
+        self._select_filter_iter(self.filter.get_iter(filter_path))
+        return True
+    
+    def _select_filter_iter(self, tree_iter):
+        """Select and reveal a row of the filter model."""
+        self.tree_view.get_selection().select_iter(tree_iter)
+        self.tree_view.scroll_to_cell(self.filter.get_path(tree_iter), None, False, 0, 0)
+    
+    def _on_search_changed(self, entry):
+        """Show only the games matching the search text."""
+        visible = self._index.search(entry.get_text())
+        changed = visible ^ self._visible
+        self._visible = visible
+        if not changed:
+            return
+        
+        # Row updates emit a signal each; with many of them it is cheaper
+        # to detach the view and let it reload the filter once
+        detach = len(changed) > DETACH_THRESHOLD
+        selected = self.get_selected()
+        self._updating = True
+        try:
+            if detach:
+                self.tree_view.set_model(None)
+            store, iters = self.store, self._iters
+            for position in changed:
+                store.set_value(iters[position], COLUMN_VISIBLE, position in visible)
+            if detach:
+                self.tree_view.set_model(self.filter)
+        finally:
+            self._updating = False
+        
+        if selected is not None:
+            self.select(selected)
+    
+    def _on_search_activate(self, entry):
+        """Select the first match when Enter is pressed in the search entry."""
+        self.select_first()
+    
+    def _on_selection_changed(self, selection):
+        """Report a newly selected game."""
+        if self._updating:
+            return
+        # Rows reselected after filtering or a refresh are not news
+        app_id = self.get_selected()
+        if app_id is not None and app_id != self._reported:
+            self._reported = app_id
+            self.on_selected(app_id)
@@ -9,6 +9,7 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, Gdk
 
 from steamlaunchergui.config.constants import GENERAL_OPTIONS, GENERAL_INPUTS, DX_LEVEL_PRESETS
+from steamlaunchergui.config.option_catalog import GENERAL_INPUT, GENERAL_TOGGLE
 from steamlaunchergui.utils.validation import validate_integer, validate_resolution
 
 logger = logging.getLogger(__name__)
@@ -21,34 +22,37 @@ def create_general_tab(launch_options):
         launch_options: LaunchOptions model
         
     Returns:
-        Gtk.Widget: The general tab content widget
+        Gtk.Widget: The general tab content widget, with the widget of each
+            option in option_widgets, keyed by (kind, option)
     """
     # Create main container
     main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+    option_widgets = {}
+    main_box.option_widgets = option_widgets
     
     # Display options section
-    display_frame = create_display_section(launch_options)
+    display_frame = create_display_section(launch_options, option_widgets)
     main_box.pack_start(display_frame, False, False, 0)
     
     # Performance options section
-    performance_frame = create_performance_section(launch_options)
+    performance_frame = create_performance_section(launch_options, option_widgets)
     main_box.pack_start(performance_frame, False, False, 0)
     
     # Debug options section
-    debug_frame = create_debug_section(launch_options)
+    debug_frame = create_debug_section(launch_options, option_widgets)
     main_box.pack_start(debug_frame, False, False, 0)
     
     # Audio options section
-    audio_frame = create_audio_section(launch_options)
+    audio_frame = create_audio_section(launch_options, option_widgets)
     main_box.pack_start(audio_frame, False, False, 0)
     
     # Specific inputs section
-    inputs_frame = create_inputs_section(launch_options)
+    inputs_frame = create_inputs_section(launch_options, option_widgets)
     main_box.pack_start(inputs_frame, False, False, 0)
     
     return main_box
 
-def create_display_section(launch_options):
+def create_display_section(launch_options, option_widgets):
     """Create the display options section."""
     frame = Gtk.Frame(label="Display Options")
     box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
@@ -64,6 +68,7 @@ def create_display_section(launch_options):
     fullscreen_check.set_tooltip_text("-fullscreen")
     fullscreen_check.set_active(launch_options.general_toggles.get("-fullscreen", False))
     fullscreen_check.connect("toggled", on_toggle_toggled, "-fullscreen", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-fullscreen")] = fullscreen_check
     display_box.pack_start(fullscreen_check, False, False, 0)
     
     # Windowed
@@ -71,6 +76,7 @@ def create_display_section(launch_options):
     windowed_check.set_tooltip_text("-windowed")
     windowed_check.set_active(launch_options.general_toggles.get("-windowed", False))
     windowed_check.connect("toggled", on_toggle_toggled, "-windowed", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-windowed")] = windowed_check
     display_box.pack_start(windowed_check, False, False, 0)
     
     # Borderless
@@ -78,6 +84,7 @@ def create_display_section(launch_options):
     borderless_check.set_tooltip_text("-noborder")
     borderless_check.set_active(launch_options.general_toggles.get("-noborder", False))
     borderless_check.connect("toggled", on_toggle_toggled, "-noborder", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-noborder")] = borderless_check
     display_box.pack_start(borderless_check, False, False, 0)
     
     # Resolution settings
@@ -94,6 +101,7 @@ def create_display_section(launch_options):
     if "-w" in launch_options.general_inputs:
         width_entry.set_text(launch_options.general_inputs["-w"])
     width_entry.connect("changed", on_input_changed, "-w", launch_options)
+    option_widgets[(GENERAL_INPUT, "-w")] = width_entry
     width_entry.connect("changed", on_resolution_changed, "width", launch_options)
     res_box.pack_start(width_entry, False, False, 0)
     
@@ -107,6 +115,7 @@ def create_display_section(launch_options):
     if "-h" in launch_options.general_inputs:
         height_entry.set_text(launch_options.general_inputs["-h"])
     height_entry.connect("changed", on_input_changed, "-h", launch_options)
+    option_widgets[(GENERAL_INPUT, "-h")] = height_entry
     height_entry.connect("changed", on_resolution_changed, "height", launch_options)
     res_box.pack_start(height_entry, False, False, 0)
     
@@ -127,11 +136,12 @@ def create_display_section(launch_options):
             dx_combo.set_active(DX_LEVEL_PRESETS.index(level))
     
     dx_combo.connect("changed", on_dx_level_changed, launch_options)
+    option_widgets[(GENERAL_INPUT, "-dxlevel")] = dx_combo
     dx_box.pack_start(dx_combo, False, False, 0)
     
     return frame
 
-def create_performance_section(launch_options):
+def create_performance_section(launch_options, option_widgets):
     """Create the performance options section."""
     frame = Gtk.Frame(label="Performance Options")
     box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
@@ -150,6 +160,7 @@ def create_performance_section(launch_options):
     high_check.set_tooltip_text("-high")
     high_check.set_active(launch_options.general_toggles.get("-high", False))
     high_check.connect("toggled", on_toggle_toggled, "-high", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-high")] = high_check
     priority_box.pack_start(high_check, False, False, 0)
     
     # Very high priority
@@ -157,6 +168,7 @@ def create_performance_section(launch_options):
     veryhigh_check.set_tooltip_text("-veryhigh")
     veryhigh_check.set_active(launch_options.general_toggles.get("-veryhigh", False))
     veryhigh_check.connect("toggled", on_toggle_toggled, "-veryhigh", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-veryhigh")] = veryhigh_check
     priority_box.pack_start(veryhigh_check, False, False, 0)
     
     # Low priority
@@ -164,6 +176,7 @@ def create_performance_section(launch_options):
     low_check.set_tooltip_text("-low")
     low_check.set_active(launch_options.general_toggles.get("-low", False))
     low_check.connect("toggled", on_toggle_toggled, "-low", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-low")] = low_check
     priority_box.pack_start(low_check, False, False, 0)
     
     # Background priority
@@ -171,6 +184,7 @@ def create_performance_section(launch_options):
     background_check.set_tooltip_text("-background")
     background_check.set_active(launch_options.general_toggles.get("-background", False))
     background_check.connect("toggled", on_toggle_toggled, "-background", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-background")] = background_check
     priority_box.pack_start(background_check, False, False, 0)
     
     # Graphics API
@@ -185,6 +199,7 @@ def create_performance_section(launch_options):
     vulkan_check.set_tooltip_text("-vulkan")
     vulkan_check.set_active(launch_options.general_toggles.get("-vulkan", False))
     vulkan_check.connect("toggled", on_toggle_toggled, "-vulkan", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-vulkan")] = vulkan_check
     api_box.pack_start(vulkan_check, False, False, 0)
     
     # Force OpenGL Core
@@ -192,6 +207,7 @@ def create_performance_section(launch_options):
     glcore_check.set_tooltip_text("-force-glcore")
     glcore_check.set_active(launch_options.general_toggles.get("-force-glcore", False))
     glcore_check.connect("toggled", on_toggle_toggled, "-force-glcore", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-force-glcore")] = glcore_check
     api_box.pack_start(glcore_check, False, False, 0)
     
     # Software rendering
@@ -199,6 +215,7 @@ def create_performance_section(launch_options):
     soft_check.set_tooltip_text("-soft")
     soft_check.set_active(launch_options.general_toggles.get("-soft", False))
     soft_check.connect("toggled", on_toggle_toggled, "-soft", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-soft")] = soft_check
     api_box.pack_start(soft_check, False, False, 0)
     
     # Additional performance options
@@ -210,6 +227,7 @@ def create_performance_section(launch_options):
     vsync_check.set_tooltip_text("-novsync")
     vsync_check.set_active(launch_options.general_toggles.get("-novsync", False))
     vsync_check.connect("toggled", on_toggle_toggled, "-novsync", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-novsync")] = vsync_check
     perf_box.pack_start(vsync_check, False, False, 0)
     
     # Disable threading
@@ -217,6 +235,7 @@ def create_performance_section(launch_options):
     threading_check.set_tooltip_text("-nothreading")
     threading_check.set_active(launch_options.general_toggles.get("-nothreading", False))
     threading_check.connect("toggled", on_toggle_toggled, "-nothreading", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nothreading")] = threading_check
     perf_box.pack_start(threading_check, False, False, 0)
     
     # CPU Count
@@ -232,12 +251,13 @@ def create_performance_section(launch_options):
     if "-CpuCount" in launch_options.general_inputs:
         cpu_entry.set_text(launch_options.general_inputs["-CpuCount"])
     cpu_entry.connect("changed", on_input_changed, "-CpuCount", launch_options)
+    option_widgets[(GENERAL_INPUT, "-CpuCount")] = cpu_entry
     cpu_entry.connect("changed", on_cpu_count_changed, launch_options)
     cpu_box.pack_start(cpu_entry, False, False, 0)
     
     return frame
 
-def create_debug_section(launch_options):
+def create_debug_section(launch_options, option_widgets):
     """Create the debug options section."""
     frame = Gtk.Frame(label="Debug and Troubleshooting")
     box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
@@ -253,6 +273,7 @@ def create_debug_section(launch_options):
     console_check.set_tooltip_text("-console")
     console_check.set_active(launch_options.general_toggles.get("-console", False))
     console_check.connect("toggled", on_toggle_toggled, "-console", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-console")] = console_check
     debug_box.pack_start(console_check, False, False, 0)
     
     # Debug
@@ -260,6 +281,7 @@ def create_debug_section(launch_options):
     debug_check.set_tooltip_text("-debug")
     debug_check.set_active(launch_options.general_toggles.get("-debug", False))
     debug_check.connect("toggled", on_toggle_toggled, "-debug", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-debug")] = debug_check
     debug_box.pack_start(debug_check, False, False, 0)
     
     # No crash dialog
@@ -267,6 +289,7 @@ def create_debug_section(launch_options):
     nocrash_check.set_tooltip_text("-nocrashdialog")
     nocrash_check.set_active(launch_options.general_toggles.get("-nocrashdialog", False))
     nocrash_check.connect("toggled", on_toggle_toggled, "-nocrashdialog", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nocrashdialog")] = nocrash_check
     debug_box.pack_start(nocrash_check, False, False, 0)
     
     # Network options
@@ -278,6 +301,7 @@ def create_debug_section(launch_options):
     insecure_check.set_tooltip_text("-insecure")
     insecure_check.set_active(launch_options.general_toggles.get("-insecure", False))
     insecure_check.connect("toggled", on_toggle_toggled, "-insecure", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-insecure")] = insecure_check
     network_box.pack_start(insecure_check, False, False, 0)
     
     # Secure
@@ -285,6 +309,7 @@ def create_debug_section(launch_options):
     secure_check.set_tooltip_text("-secure")
     secure_check.set_active(launch_options.general_toggles.get("-secure", False))
     secure_check.connect("toggled", on_toggle_toggled, "-secure", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-secure")] = secure_check
     network_box.pack_start(secure_check, False, False, 0)
     
     # LAN
@@ -292,6 +317,7 @@ def create_debug_section(launch_options):
     lan_check.set_tooltip_text("-lan")
     lan_check.set_active(launch_options.general_toggles.get("-lan", False))
     lan_check.connect("toggled", on_toggle_toggled, "-lan", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-lan")] = lan_check
     network_box.pack_start(lan_check, False, False, 0)
     
     # Skip intro
@@ -303,6 +329,7 @@ def create_debug_section(launch_options):
     nointro_check.set_tooltip_text("-nointro")
     nointro_check.set_active(launch_options.general_toggles.get("-nointro", False))
     nointro_check.connect("toggled", on_toggle_toggled, "-nointro", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nointro")] = nointro_check
     skip_box.pack_start(nointro_check, False, False, 0)
     
     # No logo
@@ -310,6 +337,7 @@ def create_debug_section(launch_options):
     nologo_check.set_tooltip_text("-nologo")
     nologo_check.set_active(launch_options.general_toggles.get("-nologo", False))
     nologo_check.connect("toggled", on_toggle_toggled, "-nologo", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nologo")] = nologo_check
     skip_box.pack_start(nologo_check, False, False, 0)
     
     # No startup movie
@@ -317,11 +345,12 @@ def create_debug_section(launch_options):
     nostartup_check.set_tooltip_text("-nostartupmovie")
     nostartup_check.set_active(launch_options.general_toggles.get("-nostartupmovie", False))
     nostartup_check.connect("toggled", on_toggle_toggled, "-nostartupmovie", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nostartupmovie")] = nostartup_check
     skip_box.pack_start(nostartup_check, False, False, 0)
     
     return frame
 
-def create_audio_section(launch_options):
+def create_audio_section(launch_options, option_widgets):
     """Create the audio options section."""
     frame = Gtk.Frame(label="Audio Options")
     box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
@@ -337,6 +366,7 @@ def create_audio_section(launch_options):
     nosound_check.set_tooltip_text("-nosound")
     nosound_check.set_active(launch_options.general_toggles.get("-nosound", False))
     nosound_check.connect("toggled", on_toggle_toggled, "-nosound", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nosound")] = nosound_check
     audio_box.pack_start(nosound_check, False, False, 0)
     
     # No audio
@@ -344,6 +374,7 @@ def create_audio_section(launch_options):
     noaudio_check.set_tooltip_text("-noaudio")
     noaudio_check.set_active(launch_options.general_toggles.get("-noaudio", False))
     noaudio_check.connect("toggled", on_toggle_toggled, "-noaudio", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-noaudio")] = noaudio_check
     audio_box.pack_start(noaudio_check, False, False, 0)
     
     # Sound buffer
@@ -359,12 +390,13 @@ def create_audio_section(launch_options):
     if "-soundbuffer" in launch_options.general_inputs:
         buffer_entry.set_text(launch_options.general_inputs["-soundbuffer"])
     buffer_entry.connect("changed", on_input_changed, "-soundbuffer", launch_options)
+    option_widgets[(GENERAL_INPUT, "-soundbuffer")] = buffer_entry
     buffer_entry.connect("changed", validate_numeric_input, launch_options)
     buffer_box.pack_start(buffer_entry, False, False, 0)
     
     return frame
 
-def create_inputs_section(launch_options):
+def create_inputs_section(launch_options, option_widgets):
     """Create the inputs section for other general options."""
     frame = Gtk.Frame(label="Additional Options")
     box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
@@ -380,6 +412,7 @@ def create_inputs_section(launch_options):
     nojoy_check.set_tooltip_text("-nojoy")
     nojoy_check.set_active(launch_options.general_toggles.get("-nojoy", False))
     nojoy_check.connect("toggled", on_toggle_toggled, "-nojoy", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nojoy")] = nojoy_check
     input_box.pack_start(nojoy_check, False, False, 0)
     
     # No gamepad
@@ -387,6 +420,7 @@ def create_inputs_section(launch_options):
     nogamepad_check.set_tooltip_text("-nogamepad")
     nogamepad_check.set_active(launch_options.general_toggles.get("-nogamepad", False))
     nogamepad_check.connect("toggled", on_toggle_toggled, "-nogamepad", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nogamepad")] = nogamepad_check
     input_box.pack_start(nogamepad_check, False, False, 0)
     
     # No mouse
@@ -394,6 +428,7 @@ def create_inputs_section(launch_options):
     nomouse_check.set_tooltip_text("-nomouse")
     nomouse_check.set_active(launch_options.general_toggles.get("-nomouse", False))
     nomouse_check.connect("toggled", on_toggle_toggled, "-nomouse", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nomouse")] = nomouse_check
     input_box.pack_start(nomouse_check, False, False, 0)
     
     # Mouse acceleration
@@ -401,6 +436,7 @@ def create_inputs_section(launch_options):
     mouseaccel_check.set_tooltip_text("-nomouseaccel")
     mouseaccel_check.set_active(launch_options.general_toggles.get("-nomouseaccel", False))
     mouseaccel_check.connect("toggled", on_toggle_toggled, "-nomouseaccel", launch_options)
+    option_widgets[(GENERAL_TOGGLE, "-nomouseaccel")] = mouseaccel_check
     input_box.pack_start(mouseaccel_check, False, False, 0)
     
     # Custom option entry
@@ -424,18 +460,13 @@ def create_inputs_section(launch_options):
 def on_toggle_toggled(checkbutton, option, launch_options):
     """Handle checkbox toggle for general options."""
     enabled = checkbutton.get_active()
-    launch_options.general_toggles[option] = enabled
+    launch_options.set_general_toggle(option, enabled)
     logger.debug(f"General option '{option}' set to: {enabled}")
 
 def on_input_changed(entry, option, launch_options):
     """Handle input entry change for general options."""
     value = entry.get_text()
-    if value:
-        launch_options.general_inputs[option] = value
-    else:
-        if option in launch_options.general_inputs:
-            del launch_options.general_inputs[option]
-    logger.debug(f"General input '{option}' set to: {value}")
+    launch_options.set_general_input(option, value)
 
 def on_dx_level_changed(combo, launch_options):
     """Handle DirectX level selection."""
@@ -444,7 +475,7 @@ def on_dx_level_changed(combo, launch_options):
         return
     
     level = DX_LEVEL_PRESETS[active]
-    launch_options.general_inputs["-dxlevel"] = level
+    launch_options.set_general_input("-dxlevel", level)
     logger.debug(f"DirectX level set to: {level}")
 
 def on_resolution_changed(entry, dimension, launch_options):
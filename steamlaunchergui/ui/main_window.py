@@ -6,22 +6,38 @@ import logging
 import gi
 import os
 import subprocess
+import threading
+import time
 from pathlib import Path
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, Gdk, GLib
 
-from steamlaunchergui.config import TAB_CONFIGS, ConfigManager
-from steamlaunchergui.models import LaunchOptions, SteamGame, ProfileManager
-from steamlaunchergui.utils.software_detection import check_software, detect_steam_location
+from steamlaunchergui.config import SETTINGS_WRITE_DELAY, TAB_CONFIGS, ConfigManager
+from steamlaunchergui.models import LaunchOptions, SteamGame
+from steamlaunchergui.models.command_tokenizer import ENV
+from steamlaunchergui.models.command_tree import CommandTree
+from steamlaunchergui.models.game_cache import GameDetails, GameOptionsCache, copy_options, file_stamp
+from steamlaunchergui.models.profile_db import SqliteProfileManager, open_profile_manager
+from steamlaunchergui.models.profile_writer import ProfileWriter
+from steamlaunchergui.ui.update_scheduler import UpdateScheduler
+from steamlaunchergui.ui.game_picker import GamePicker
+from steamlaunchergui.utils.software_detection import check_software_batch, detect_steam_installs
 from steamlaunchergui.ui.styles import load_css, apply_theme
-from steamlaunchergui.ui.tab_builder import create_tab_content
+from steamlaunchergui.ui.tab_builder import create_tab_content, set_software_status
 from steamlaunchergui.ui.general_tab import create_general_tab
 from steamlaunchergui.ui.profile_manager_dialog import ProfileManagerDialog
-from steamlaunchergui.utils.validation import validate_option_combinations
+from steamlaunchergui.ui.option_search import OptionSearchDialog
+from steamlaunchergui.utils.rule_engine import ConflictChecker
 
 logger = logging.getLogger(__name__)
 
+# Minimum similarity for a profile to be shown as a match
+PROFILE_MATCH_THRESHOLD = 0.5
+
+# How long an option found by search stays highlighted (milliseconds)
+SEARCH_HIGHLIGHT_DURATION = 1500
+
 class SteamLauncherWindow(Gtk.Window):
     """
     Main application window for SteamLauncherGUI.
@@ -48,6 +64,9 @@ class SteamLauncherWindow(Gtk.Window):
         # Set up the UI
         self._setup_ui()
         
+        # Detect required software in the background
+        self._start_software_detection()
+        
         # Connect signals
         self.connect("destroy", self.on_destroy)
         
@@ -59,17 +78,40 @@ class SteamLauncherWindow(Gtk.Window):
     
     def _init_models(self):
         """Initialize the model components."""
-        # Create configuration manager
-        self.config_manager = ConfigManager()
+        # Create configuration manager; settings changed while the window is
+        # open are written behind, and flushed when it closes
+        self.config_manager = ConfigManager(write_delay=SETTINGS_WRITE_DELAY)
         
         # Create launch options model
         self.launch_options = LaunchOptions()
         
-        # Create profile manager
-        self.profile_manager = ProfileManager()
+        # Parsed form of the command box, kept in step with each edit; the
+        # options are read back from it once per frame while typing
+        self.command_tree = CommandTree()
+        self._command_edited = False
+        self._command_model_stale = False
+        self._applying_command_edit = False
+        
+        # Refresh derived views at most once per frame on option changes
+        self.update_scheduler = UpdateScheduler()
+        self.update_scheduler.register("command_model", self._apply_command_model)
+        self.update_scheduler.register("command", self._refresh_command_display)
+        self.update_scheduler.register("warnings", self.update_warnings)
+        self.update_scheduler.register("profile_match", self.update_profile_match)
+        self.launch_options.add_listener(self._on_options_changed)
+        
+        # Create profile manager for the configured storage ("json" or "sqlite")
+        self.profile_manager = open_profile_manager(
+            self.config_manager.get_setting("profile_storage", "json")
+        )
+        
+        # Profile writes run on a worker thread and report back on this one
+        self.profile_writer = ProfileWriter(self.profile_manager, GLib.idle_add)
+        self.profile_manager.add_listener(self._on_profiles_changed)
         
         # Detect Steam location
-        steam_dir = detect_steam_location()
+        self.steam_installs = detect_steam_installs()
+        steam_dir = self.steam_installs[0].path if self.steam_installs else None
         self.steam_directory = steam_dir
         
         if steam_dir:
@@ -85,13 +127,22 @@ class SteamLauncherWindow(Gtk.Window):
             self.proton_versions = []
             logger.warning("Steam directory not found, game detection disabled")
         
+        # Games by app ID, and their parsed options and details by launch string
+        self.games_by_id = {game.app_id: game for game in self.steam_games}
+        self.game_cache = GameOptionsCache()
+        
         # Currently selected game
         self.selected_game = None
         
+        # Software detection results, filled in by a background thread
+        self.software_status = {}
+        
         logger.info("Models initialized")
     
     def _setup_ui(self):
         """Set up the user interface components."""
+        setup_start = time.perf_counter()
+        
         # Create main vertical box
         self.main_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         self.add(self.main_vbox)
@@ -107,9 +158,9 @@ class SteamLauncherWindow(Gtk.Window):
         game_select_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         game_details_box.pack_start(game_select_box, True, True, 0)
         
-        # Add game selection combobox if games were found
-        if self.steam_games:
-            self._create_game_selector(game_select_box)
+        # Add the game picker; it is filled again on refresh, so it is
+        # created even if no games were found
+        self._create_game_selector(game_select_box)
         
         # Right side: Game details and Proton controls
         self.game_details_frame = Gtk.Frame(label="Game Details")
@@ -122,13 +173,29 @@ class SteamLauncherWindow(Gtk.Window):
         self.notebook = Gtk.Notebook()
         self.main_vbox.pack_start(self.notebook, True, True, 0)
         
+        # Tabs whose content has not been built yet, keyed by page widget
+        self._pending_tabs = {}
+        
+        # Built tab contents, keyed by tab name
+        self._tab_contents = {}
+        
+        # Notebook pages, keyed by tab name
+        self._tab_pages = {}
+        
+        # Widget waiting to be laid out before an option search reveals
+        # it, and its size-allocate handler
+        self._pending_reveal = None
+        
         # Add General tab
         self._add_general_tab()
         
-        # Add a tab for each configuration in TAB_CONFIGS
+        # Add a placeholder tab for each configuration in TAB_CONFIGS;
+        # the content is built when the tab is first shown
         for tab_name, config in TAB_CONFIGS.items():
             self._add_tab(tab_name, config)
         
+        self.notebook.connect("switch-page", self.on_tab_switched)
+        
         # Add command display
         self._create_command_display()
         
@@ -147,7 +214,8 @@ class SteamLauncherWindow(Gtk.Window):
         # Update status
         self.status_bar.push(self.status_context, "Ready")
         
-        logger.info("UI setup complete")
+        elapsed_ms = (time.perf_counter() - setup_start) * 1000
+        logger.info(f"UI setup complete in {elapsed_ms:.1f} ms")
     
     def _create_header(self):
         """Create the header section."""
@@ -166,7 +234,7 @@ class SteamLauncherWindow(Gtk.Window):
         header_box.pack_start(subtitle_label, False, False, 0)
     
     def _create_game_selector(self, parent_box):
-        """Create the game selection combobox."""
+        """Create the searchable game list."""
         game_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
         parent_box.pack_start(game_box, False, False, 5)
         
@@ -174,22 +242,15 @@ class SteamLauncherWindow(Gtk.Window):
         game_label = Gtk.Label(label="Selected Game:")
         game_box.pack_start(game_label, False, False, 5)
         
-        # Create combobox for game selection
-        game_store = Gtk.ListStore(str, str)  # name, app_id
-        for game in sorted(self.steam_games, key=lambda g: g.name):
-            game_store.append([game.name, game.app_id])
-        
-        self.game_combo = Gtk.ComboBox.new_with_model(game_store)
-        renderer_text = Gtk.CellRendererText()
-        self.game_combo.pack_start(renderer_text, True)
-        self.game_combo.add_attribute(renderer_text, "text", 0)
-        self.game_combo.connect("changed", self.on_game_selected)
-        game_box.pack_start(self.game_combo, True, True, 0)
-        
         # Add refresh button
         refresh_button = Gtk.Button(label="Refresh Games")
         refresh_button.connect("clicked", self.on_refresh_games)
-        game_box.pack_start(refresh_button, False, False, 0)
+        game_box.pack_end(refresh_button, False, False, 0)
+        
+        # Search entry over a filtered list of games
+        self.game_picker = GamePicker(self.on_game_selected)
+        self.game_picker.set_games(self.steam_games)
+        parent_box.pack_start(self.game_picker, True, True, 0)
     
     def _create_game_details(self):
         """Create the game details section."""
@@ -242,6 +303,15 @@ class SteamLauncherWindow(Gtk.Window):
         self.proton_version_value.set_halign(Gtk.Align.START)
         details_grid.attach(self.proton_version_value, 1, 3, 1, 1)
         
+        # Closest saved profile
+        profile_match_label = Gtk.Label(label="Closest Profile:")
+        profile_match_label.set_halign(Gtk.Align.START)
+        details_grid.attach(profile_match_label, 0, 4, 1, 1)
+        
+        self.profile_match_value = Gtk.Label(label="")
+        self.profile_match_value.set_halign(Gtk.Align.START)
+        details_grid.attach(self.profile_match_value, 1, 4, 1, 1)
+        
         # Open prefix button
         open_prefix_button = Gtk.Button(label="Open Prefix Folder")
         open_prefix_button.connect("clicked", self.on_open_prefix)
@@ -256,30 +326,177 @@ class SteamLauncherWindow(Gtk.Window):
         tab_content = create_general_tab(self.launch_options)
         tab_content.get_style_context().add_class("tab-content")
         scrolled.add(tab_content)
+        self._general_content = tab_content
         
         label = Gtk.Label(label="General")
         self.notebook.append_page(scrolled, label)
+        self._tab_pages["General"] = scrolled
     
     def _add_tab(self, tab_name, config):
-        """Add a tab to the notebook."""
+        """Add a placeholder tab to the notebook."""
         # Create a scrolled window
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_border_width(10)
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         
-        # Check if required software is installed
+        # Content is created by _materialize_tab on first switch-page
+        self._pending_tabs[scrolled] = (tab_name, config)
+        
+        # Add the tab to the notebook
+        self.notebook.append_page(scrolled, Gtk.Label(label=tab_name))
+        self._tab_pages[tab_name] = scrolled
+    
+    def _materialize_tab(self, scrolled):
+        """
+        Build the content of a placeholder tab.
+        
+        The widgets are created from the current state of the launch
+        options model, so they are in sync at the moment the tab is shown.
+        
+        Args:
+            scrolled: The placeholder page widget
+        """
+        tab_name, config = self._pending_tabs.pop(scrolled)
+        build_start = time.perf_counter()
+        
+        # Check if required software is installed (None while still checking)
         software_available = True
         if "software_requirement" in config:
             software = config["software_requirement"]
-            software_available = check_software(software)
+            software_available = self.software_status.get(software)
         
         # Create tab content
         tab_content = create_tab_content(tab_name, config, self.launch_options, software_available)
         tab_content.get_style_context().add_class("tab-content")
         scrolled.add(tab_content)
+        scrolled.show_all()
+        self._tab_contents[tab_name] = (tab_content, config)
         
-        # Add the tab to the notebook
-        self.notebook.append_page(scrolled, Gtk.Label(label=tab_name))
+        elapsed_ms = (time.perf_counter() - build_start) * 1000
+        logger.debug(f"Tab '{tab_name}' built in {elapsed_ms:.1f} ms")
+    
+    def show_option(self, option):
+        """
+        Switch to the tab of an option and focus its control.
+        
+        A tab that has not been shown yet is built first.
+        
+        Args:
+            option: OptionSpec from the option catalog
+        """
+        tab_name = option.tab or "General"
+        page = self._tab_pages.get(tab_name)
+        if page is None:
+            logger.warning(f"No tab for option {option.name}: {tab_name}")
+            return
+        
+        if page in self._pending_tabs:
+            self._materialize_tab(page)
+        self.notebook.set_current_page(self.notebook.page_num(page))
+        
+        if option.tab is None:
+            tab_content = self._general_content
+        else:
+            tab_content = self._tab_contents[tab_name][0]
+        
+        widget = tab_content.option_widgets.get((option.kind, option.name))
+        if widget is None:
+            self.status_bar.push(
+                self.status_context,
+                f"{option.name} has no control, add it under Custom Launch Options"
+            )
+            return
+        
+        if not widget.is_sensitive():
+            # Options of a disabled tab cannot be focused, point at the switch
+            widget = tab_content.enable_check
+            self.status_bar.push(
+                self.status_context, f"Enable {tab_name} to change {option.name}"
+            )
+        else:
+            self.status_bar.push(self.status_context, f"{option.name}: {option.description}")
+        
+        # Wait for the tab to be laid out before scrolling to the widget
+        self._cancel_reveal()
+        if widget.get_mapped() and widget.get_allocated_height() > 1:
+            GLib.idle_add(self._reveal_widget, page, tab_content, widget)
+        else:
+            handler = widget.connect("size-allocate", self._on_reveal_allocated, page, tab_content)
+            self._pending_reveal = (widget, handler)
+    
+    def _cancel_reveal(self):
+        """Stop waiting for the layout of a widget to reveal."""
+        if self._pending_reveal is not None:
+            widget, handler = self._pending_reveal
+            self._pending_reveal = None
+            widget.disconnect(handler)
+    
+    def _on_reveal_allocated(self, widget, allocation, page, tab_content):
+        """Reveal a widget once it has a size, if its tab is still shown."""
+        if allocation.height <= 1:
+            return
+        self._cancel_reveal()
+        if self.notebook.get_current_page() == self.notebook.page_num(page):
+            # Scroll after the rest of the tab has been allocated too
+            GLib.idle_add(self._reveal_widget, page, tab_content, widget)
+    
+    def _reveal_widget(self, page, tab_content, widget):
+        """Scroll a widget into view, focus it and highlight it briefly."""
+        if not widget.get_mapped():
+            return False
+        
+        coordinates = widget.translate_coordinates(tab_content, 0, 0)
+        if coordinates is not None:
+            top = coordinates[1]
+            page.get_vadjustment().clamp_page(top, top + widget.get_allocated_height())
+        
+        widget.grab_focus()
+        style_context = widget.get_style_context()
+        style_context.add_class("search-highlight")
+        GLib.timeout_add(SEARCH_HIGHLIGHT_DURATION, self._clear_highlight, style_context)
+        return False
+    
+    def _clear_highlight(self, style_context):
+        """Remove the search highlight from a widget."""
+        style_context.remove_class("search-highlight")
+        return False
+    
+    def _start_software_detection(self):
+        """Check all software requirements on a background thread."""
+        software_names = sorted({
+            config["software_requirement"]
+            for config in TAB_CONFIGS.values()
+            if "software_requirement" in config
+        })
+        
+        thread = threading.Thread(
+            target=self._detect_software_worker,
+            args=(software_names,),
+            name="software-detection",
+            daemon=True
+        )
+        thread.start()
+    
+    def _detect_software_worker(self, software_names):
+        """Run software detection and hand the results to the GTK thread."""
+        try:
+            results = check_software_batch(software_names)
+        except Exception as e:
+            logger.error(f"Error detecting software: {e}")
+            results = {name: False for name in software_names}
+        GLib.idle_add(self._on_software_detected, results)
+    
+    def _on_software_detected(self, results):
+        """Apply software detection results to the built tabs."""
+        self.software_status.update(results)
+        
+        for tab_name, (tab_content, config) in self._tab_contents.items():
+            software = config.get("software_requirement")
+            if software in results:
+                set_software_status(tab_content, tab_name, config, results[software])
+        
+        logger.info(f"Software detection finished: {results}")
+        return False
     
     def _create_command_display(self):
         """Create the command display area."""
@@ -294,17 +511,26 @@ class SteamLauncherWindow(Gtk.Window):
         
         # Create command text view
         self.command_textview = Gtk.TextView()
-        self.command_textview.set_editable(False)
+        self.command_textview.set_editable(True)
         self.command_textview.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self.command_textview.set_tooltip_text("Edit the command directly to update the options")
         self.command_textview.get_style_context().add_class("command-display")
         command_scroll.add(self.command_textview)
         
-        # Create text buffer
+        # Create text buffer, feeding each edit to the command tree
         self.command_buffer = self.command_textview.get_buffer()
+        self._command_handlers = (
+            self.command_buffer.connect("insert-text", self.on_command_text_inserted),
+            self.command_buffer.connect("delete-range", self.on_command_range_deleted),
+        )
         
         # Add warnings area
         self.warnings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
         self.main_vbox.pack_start(self.warnings_box, False, False, 0)
+        
+        # Conflict warnings, maintained incrementally, and their labels keyed by message
+        self.conflict_checker = ConflictChecker()
+        self._warning_labels = {}
     
     def _create_launch_section(self):
         """Create the section for launching with Proton."""
@@ -366,6 +592,17 @@ class SteamLauncherWindow(Gtk.Window):
         profiles_button.connect("clicked", self.on_profiles_clicked)
         button_box.pack_start(profiles_button, False, False, 0)
         
+        # Add option search button, also opened with Ctrl+F
+        search_button = Gtk.Button(label="Search Options")
+        search_button.set_tooltip_text("Search the options of all tabs (Ctrl+F)")
+        search_button.connect("clicked", self.on_search_options_clicked)
+        accel_group = Gtk.AccelGroup()
+        self.add_accel_group(accel_group)
+        search_button.add_accelerator(
+            "clicked", accel_group, Gdk.KEY_f, Gdk.ModifierType.CONTROL_MASK, Gtk.AccelFlags.VISIBLE
+        )
+        button_box.pack_start(search_button, False, False, 0)
+        
         # Add reset button
         reset_button = Gtk.Button(label="Reset")
         reset_button.connect("clicked", self.on_reset_clicked)
@@ -383,49 +620,140 @@ class SteamLauncherWindow(Gtk.Window):
     
     def update_command_display(self):
         """Update the command display with the current command."""
-        command = self.launch_options.generate_command(TAB_CONFIGS)
-        self.command_buffer.set_text(command)
-        logger.info(f"Generated command: {command}")
+        self.update_scheduler.cancel("command", "warnings")
+        self._refresh_command_display()
         
         # Check for conflicts and issues
         self.update_warnings()
     
-    def update_warnings(self):
-        """Update the warnings display based on current options."""
-        # Clear existing warnings
-        for child in self.warnings_box.get_children():
-            self.warnings_box.remove(child)
-        
-        # Get warnings for current options
-        option_dict = {}
-        
-        # Add general toggles
-        for key, value in self.launch_options.general_toggles.items():
-            option_dict[key] = value
-        
-        # Add general inputs
-        for key, value in self.launch_options.general_inputs.items():
-            option_dict[key] = value
-        
-        warnings = validate_option_combinations(option_dict)
+    def _refresh_command_display(self):
+        """Show the generated command, replacing any hand edits."""
+        command = self.launch_options.generate_command(TAB_CONFIGS)
         
-        # Display warnings
-        for warning in warnings:
-            label = Gtk.Label(label=f"⚠️ {warning}")
-            label.get_style_context().add_class("warning-text")
-            label.set_halign(Gtk.Align.START)
-            self.warnings_box.pack_start(label, False, False, 0)
+        for handler in self._command_handlers:
+            self.command_buffer.handler_block(handler)
+        try:
+            self.command_buffer.set_text(command)
+        finally:
+            for handler in self._command_handlers:
+                self.command_buffer.handler_unblock(handler)
+        
+        self.command_tree.reset(command)
+        self._command_edited = False
+        self._command_model_stale = False
+        self.update_scheduler.cancel("command_model")
+        logger.debug("Generated command: %s", command)
+    
+    def _on_options_changed(self, launch_options, section, option):
+        """Schedule a refresh after any change to the launch options."""
+        if self._applying_command_edit:
+            # The command box already shows the text the options came from
+            self.update_scheduler.request("warnings", "profile_match")
+        else:
+            self.update_scheduler.request("command", "warnings", "profile_match")
+    
+    def _apply_command_edit(self, start, end, text):
+        """
+        Apply an edit of the command box to the tree.
+        
+        Only the words touching the edit are re-tokenized here; the options
+        are read back from the tree once per frame by _apply_command_model,
+        so a burst of keystrokes updates the model and its listeners once.
+        """
+        self.command_tree.edit(start, end, text)
+        self._command_edited = True
+        self._command_model_stale = True
+        self.update_scheduler.request("command_model")
+    
+    def _apply_command_model(self):
+        """Update the launch options from the edited command box."""
+        # Keep the last valid options while a quote is still open
+        if not self._command_model_stale or self.command_tree.error:
+            return
         
-        self.warnings_box.show_all()
+        self._command_model_stale = False
+        self._applying_command_edit = True
+        try:
+            self.launch_options.parse_tree(self.command_tree, TAB_CONFIGS)
+        finally:
+            self._applying_command_edit = False
+    
+    def _sync_command_model(self):
+        """Apply a pending command box edit before the options are read."""
+        self.update_scheduler.cancel("command_model")
+        self._apply_command_model()
+    
+    def get_command(self):
+        """
+        Get the command to save or launch.
+        
+        Returns:
+            str: The command box text as typed if it was edited by hand,
+                otherwise the command generated from the options
+        """
+        self._sync_command_model()
+        if self._command_edited and not self.command_tree.error:
+            return self.command_tree.source
+        return self.launch_options.generate_command(TAB_CONFIGS)
     
-    def update_game_details(self, game):
-        """Update the game details display."""
+    def update_warnings(self):
+        """Update the warnings display based on current options."""
+        # Only rules reading a changed option are re-evaluated
+        if self.conflict_checker.update(self.launch_options.effective_options()):
+            self._show_warnings(self.conflict_checker.warnings)
+    
+    def _show_warnings(self, warnings):
+        """
+        Update the warnings panel, only adding and removing changed labels.
+        
+        Args:
+            warnings: Warning messages in display order
+        """
+        for warning in set(self._warning_labels) - set(warnings):
+            self.warnings_box.remove(self._warning_labels.pop(warning))
+        
+        for position, warning in enumerate(warnings):
+            label = self._warning_labels.get(warning)
+            if label is None:
+                label = Gtk.Label(label=f"⚠️ {warning}")
+                label.get_style_context().add_class("warning-text")
+                label.set_halign(Gtk.Align.START)
+                self.warnings_box.pack_start(label, False, False, 0)
+                label.show()
+                self._warning_labels[warning] = label
+            self.warnings_box.reorder_child(label, position)
+    
+    def update_profile_match(self):
+        """Show the saved profile closest to the current options."""
+        match = self.profile_manager.index.best_match(
+            self.launch_options, PROFILE_MATCH_THRESHOLD
+        )
+        if match is None:
+            self.profile_match_value.set_text("No similar profile")
+        elif match.score >= 1.0:
+            self.profile_match_value.set_text(f"Matches profile {match.profile.name}")
+        else:
+            self.profile_match_value.set_text(
+                f"Matches profile {match.profile.name} ({match.score:.0%})"
+            )
+    
+    def update_game_details(self, game, details=None):
+        """
+        Update the game details display.
+        
+        Args:
+            game: The selected game, or None
+            details: Cached details of the game, looked up if None
+        """
         if not game:
             self.app_id_value.set_text("")
             self.install_dir_value.set_text("")
             self.proton_prefix_value.set_text("")
             self.proton_version_value.set_text("")
             return
+        
+        if details is None:
+            details = self.get_game_details(game)
             
         # Update app ID - ensure it's a string
         self.app_id_value.set_text(str(game.app_id) if game.app_id else "")
@@ -433,38 +761,86 @@ class SteamLauncherWindow(Gtk.Window):
         # Update install directory
         self.install_dir_value.set_text(game.install_dir if game.install_dir else "")
         
-        # Update Proton prefix
+        # Update Proton prefix and current Proton version
         if self.steam_directory:
-            proton_prefix = game.get_proton_prefix(self.steam_directory)
-            self.proton_prefix_value.set_text(proton_prefix if proton_prefix else "None")
-            
-            # Update current Proton version
-            proton_version = game.get_current_proton_version(self.steam_directory)
-            self.proton_version_value.set_text(proton_version if proton_version else "Unknown")
+            self.proton_prefix_value.set_text(details.proton_prefix or "None")
+            self.proton_version_value.set_text(details.proton_version or "Unknown")
             
         # Log the values for debugging
-        logger.debug(f"Updating game details - App ID: {game.app_id}, Install Dir: {game.install_dir}, "
-                    f"Prefix: {game.get_proton_prefix(self.steam_directory) if self.steam_directory else 'N/A'}")
+        logger.debug("Updating game details - App ID: %s, Install Dir: %s, Prefix: %s",
+                     game.app_id, game.install_dir, details.proton_prefix or "N/A")
+    
+    def get_game_details(self, game):
+        """
+        Get the parsed launch options and resolved details of a game.
+        
+        Results are cached per launch string, so switching back to a game
+        does not re-parse its options. The Proton details are looked up
+        again only when one of the files they are read from changed, e.g.
+        after the game was switched to another Proton version in Steam.
+        
+        Args:
+            game: The game
+            
+        Returns:
+            GameDetails: The details
+        """
+        details = self.game_cache.get(game.app_id, game.launch_options)
+        if details is not None:
+            if details.proton_stamp == file_stamp(details.proton_files):
+                return details
+            options, error, source = details.options, details.error, details.source
+        else:
+            options = error = source = None
+        
+        if details is None and game.launch_options:
+            parsed = LaunchOptions()
+            try:
+                parsed.parse_command(game.launch_options, TAB_CONFIGS)
+                options = parsed.to_dict()
+                source = parsed.source
+            except Exception as e:
+                error = str(e)
+        
+        proton_prefix = proton_version = ""
+        proton_files = proton_stamp = ()
+        if self.steam_directory:
+            # Stamped before reading, so a change made meanwhile is seen
+            # on the next lookup
+            proton_files = tuple(
+                str(path) for path in game.get_proton_state_files(self.steam_directory)
+            )
+            proton_stamp = file_stamp(proton_files)
+            game.clear_proton_cache()
+            proton_prefix = game.get_proton_prefix(self.steam_directory)
+            proton_version = game.get_current_proton_version(self.steam_directory)
+        
+        details = GameDetails(options, error, proton_prefix, proton_version, source,
+                              proton_files, proton_stamp)
+        self.game_cache.put(game.app_id, game.launch_options, details)
+        return details
     
     def load_game_options(self, game):
         """Load launch options for the selected game."""
-        logger.debug(f"Loading options for game: {game.name if game else 'None'}, "
-                    f"App ID: {game.app_id if game else 'None'}")
+        logger.debug("Loading options for game: %s, App ID: %s",
+                     game.name if game else None, game.app_id if game else None)
         
         self.selected_game = game
+        details = self.get_game_details(game) if game else None
         
         # Always update game details first
-        self.update_game_details(game)
+        self.update_game_details(game, details)
         
         if game and game.launch_options:
-            try:
-                self.launch_options.parse_command(game.launch_options, TAB_CONFIGS)
+            if details.options is not None:
+                # The cache keeps its own copy of the parsed options
+                self.launch_options.from_dict(copy_options(details.options), details.source)
                 self.update_command_display()
                 self.status_bar.push(
                     self.status_context, f"Loaded options for {game.name}"
                 )
-            except Exception as e:
-                logger.error(f"Error parsing game launch options: {e}")
+            else:
+                logger.error(f"Error parsing game launch options: {details.error}")
                 self.status_bar.push(
                     self.status_context, f"Error loading options for {game.name}"
                 )
@@ -478,17 +854,25 @@ class SteamLauncherWindow(Gtk.Window):
                 )
     
     # Event handlers
-    def on_game_selected(self, combo):
+    def on_command_text_inserted(self, buffer, location, text, length):
+        """Handle typing or pasting into the command box."""
+        offset = location.get_offset()
+        self._apply_command_edit(offset, offset, text)
+    
+    def on_command_range_deleted(self, buffer, start, end):
+        """Handle deletions in the command box."""
+        self._apply_command_edit(start.get_offset(), end.get_offset(), "")
+    
+    def on_tab_switched(self, notebook, page, page_num):
+        """Build the tab content the first time a tab is shown."""
+        if page in self._pending_tabs:
+            self._materialize_tab(page)
+    
+    def on_game_selected(self, app_id):
         """Handle game selection."""
-        tree_iter = combo.get_active_iter()
-        if tree_iter is not None:
-            model = combo.get_model()
-            name, app_id = model[tree_iter][:2]
-            
-            # Find the game
-            game = next((g for g in self.steam_games if g.app_id == app_id), None)
-            if game:
-                self.load_game_options(game)
+        game = self.games_by_id.get(app_id)
+        if game:
+            self.load_game_options(game)
     
     def on_refresh_games(self, button):
         """Handle refresh games button click."""
@@ -496,24 +880,24 @@ class SteamLauncherWindow(Gtk.Window):
         self.status_bar.push(self.status_context, "Refreshing games list...")
         
         # Re-detect Steam location
-        steam_dir = detect_steam_location()
+        self.steam_installs = detect_steam_installs(refresh=True)
+        steam_dir = self.steam_installs[0].path if self.steam_installs else None
         self.steam_directory = steam_dir
         
         if steam_dir:
             # Reload games
             self.steam_games = SteamGame.find_steam_games(steam_dir)
+            self.games_by_id = {game.app_id: game for game in self.steam_games}
+            self.game_cache.invalidate()
             logger.info(f"Found {len(self.steam_games)} games")
             
             # Reload Proton versions
             self.proton_versions = SteamGame.get_available_proton_versions(steam_dir)
             logger.info(f"Found {len(self.proton_versions)} Proton versions")
             
-            # Update game combobox
-            game_store = self.game_combo.get_model()
-            game_store.clear()
-            
-            for game in sorted(self.steam_games, key=lambda g: g.name):
-                game_store.append([game.name, game.app_id])
+            # Update the game list; it is left alone if no game was
+            # added, removed or renamed
+            self.game_picker.set_games(self.steam_games)
             
             # Update Proton combobox
             proton_store = self.proton_combo.get_model()
@@ -528,7 +912,12 @@ class SteamLauncherWindow(Gtk.Window):
             
             # Reset current game selection
             if len(self.steam_games) > 0:
-                self.game_combo.set_active(0)
+                game = self.games_by_id.get(self.game_picker.get_selected())
+                if game:
+                    # The cache was cleared, so this picks up changed options
+                    self.load_game_options(game)
+                else:
+                    self.game_picker.select_first()
             else:
                 # No games found, clear details
                 self.update_game_details(None)
@@ -539,12 +928,12 @@ class SteamLauncherWindow(Gtk.Window):
             )
         else:
             self.steam_games = []
+            self.games_by_id = {}
+            self.game_cache.invalidate()
             self.proton_versions = []
             
-            # Clear game combobox
-            if hasattr(self, 'game_combo'):
-                game_store = self.game_combo.get_model()
-                game_store.clear()
+            # Clear game list
+            self.game_picker.set_games([])
             
             # Clear Proton combobox
             if hasattr(self, 'proton_combo'):
@@ -578,7 +967,10 @@ class SteamLauncherWindow(Gtk.Window):
     
     def on_profiles_clicked(self, button):
         """Handle profiles button click."""
-        dialog = ProfileManagerDialog(self, self.profile_manager, self.launch_options)
+        self._sync_command_model()
+        dialog = ProfileManagerDialog(
+            self, self.profile_manager, self.launch_options, self.profile_writer
+        )
         response = dialog.run()
         
         if response == Gtk.ResponseType.APPLY:
@@ -588,6 +980,25 @@ class SteamLauncherWindow(Gtk.Window):
         
         dialog.destroy()
     
+    def _on_profiles_changed(self, event, profile):
+        """Recompute the closest profile once profiles change on any thread."""
+        GLib.idle_add(self._request_profile_match)
+    
+    def _request_profile_match(self):
+        """Request the closest profile update from the GTK thread."""
+        self.update_scheduler.request("profile_match")
+        return False
+    
+    def on_search_options_clicked(self, button):
+        """Handle search options button click."""
+        dialog = OptionSearchDialog(self)
+        response = dialog.run()
+        option = dialog.selected_option
+        dialog.destroy()
+        
+        if response == Gtk.ResponseType.OK and option is not None:
+            self.show_option(option)
+    
     def on_generate_clicked(self, button):
         """Handle generate command button click."""
         self.update_command_display()
@@ -596,42 +1007,46 @@ class SteamLauncherWindow(Gtk.Window):
     def on_save_clicked(self, button):
         """Handle save button click."""
         # Get the current game
-        active_iter = self.game_combo.get_active_iter()
-        if active_iter is None:
+        game = self.selected_game
+        if game is None:
             self.status_bar.push(self.status_context, "No game selected")
             return
         
-        model = self.game_combo.get_model()
-        name, app_id = model[active_iter][:2]
+        name, app_id = game.name, game.app_id
         
         # Generate command
-        command = self.launch_options.generate_command(TAB_CONFIGS)
+        command = self.get_command()
         
-        # Find the game
-        game = next((g for g in self.steam_games if g.app_id == app_id), None)
-        if game:
-            # Update the game's launch options
-            game.set_launch_options(command)
-            
-            # Save to Steam
-            if self.steam_directory:
-                success = SteamGame.save_launch_options(
-                    self.steam_directory, app_id, command
+        # Update the game's launch options
+        game.set_launch_options(command)
+        
+        # Save to Steam
+        if self.steam_directory:
+            success = SteamGame.save_launch_options(
+                self.steam_directory, app_id, command
+            )
+            if success:
+                self.status_bar.push(
+                    self.status_context, f"Options saved for {name}"
                 )
-                if success:
-                    self.status_bar.push(
-                        self.status_context, f"Options saved for {name}"
-                    )
-                else:
-                    self.status_bar.push(
-                        self.status_context, 
-                        f"Options updated in memory but could not save to Steam config"
+                
+                # The database backend also keeps which profile a game uses
+                if isinstance(self.profile_manager, SqliteProfileManager):
+                    identical = self.profile_manager.find_identical_profiles(self.launch_options)
+                    self.profile_manager.set_game_options(
+                        app_id, command, identical[0].name if identical else None,
+                        self.launch_options
                     )
             else:
                 self.status_bar.push(
-                    self.status_context,
-                    "Steam directory not found, cannot save options"
+                    self.status_context, 
+                    f"Options updated in memory but could not save to Steam config"
                 )
+        else:
+            self.status_bar.push(
+                self.status_context,
+                "Steam directory not found, cannot save options"
+            )
     
     def on_reset_clicked(self, button):
         """Handle reset button click."""
@@ -663,18 +1078,13 @@ class SteamLauncherWindow(Gtk.Window):
         # Check if we should use the generated command options
         if self.use_command_checkbox.get_active():
             # Get the current generated command
-            command = self.launch_options.generate_command(TAB_CONFIGS)
+            command = self.get_command()
             
             # Extract environment variables from the command
-            # This extracts variables in the format VAR=value from the command
-            for part in command.split():
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    if key.startswith("PROTON_") or key.startswith("STEAM_"):
-                        # Remove quotes if present
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        env_vars[key] = value
+            for token in CommandTree(command).tokens():
+                if token.kind == ENV:
+                    if token.name.startswith("PROTON_") or token.name.startswith("STEAM_"):
+                        env_vars[token.name] = token.value
         else:
             # Add environment variables from tab toggles
             for tab_name, toggles in self.launch_options.tab_toggles.items():
@@ -740,5 +1150,11 @@ class SteamLauncherWindow(Gtk.Window):
     
     def on_destroy(self, window):
         """Handle window close."""
+        self.update_scheduler.cancel()
+        logger.debug("UI refresh stats: %s", self.update_scheduler.stats())
+        self.profile_writer.close()
+        self.profile_manager.remove_listener(self._on_profiles_changed)
+        self.profile_manager.close()
+        self.config_manager.close()
         logger.info("Window closed")
         Gtk.main_quit()
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Option search palette for SteamLauncherGUI.
+
+Searches every option of every tab by name, label or tooltip through the
+index of the compiled option catalog and returns the option picked.
+"""
+
+import logging
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gtk, Gdk, Pango
+
+from steamlaunchergui.config.option_catalog import get_option_catalog
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of results listed
+SEARCH_RESULT_LIMIT = 50
+
+# Store columns
+COLUMN_NAME, COLUMN_TAB, COLUMN_DESCRIPTION, COLUMN_INDEX = range(4)
+
+class OptionSearchDialog(Gtk.Dialog):
+    """Command palette listing the options matching a search."""
+    
+    def __init__(self, parent, catalog=None):
+        """
+        Initialize the search dialog.
+        
+        Args:
+            parent: Parent window
+            catalog: Option catalog to search, defaults to the shared catalog
+        """
+        super().__init__(title="Search Options", transient_for=parent, flags=0)
+        self.set_modal(True)
+        self.set_default_size(600, 400)
+        
+        self.catalog = catalog or get_option_catalog()
+        self.selected_option = None
+        
+        content_area = self.get_content_area()
+        content_area.set_spacing(5)
+        content_area.set_border_width(10)
+        
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_placeholder_text("Search options by name, label or tab")
+        self.search_entry.connect("search-changed", self._on_search_changed)
+        self.search_entry.connect("activate", self._on_search_activate)
+        self.search_entry.connect("key-press-event", self._on_search_key_press)
+        content_area.pack_start(self.search_entry, False, False, 0)
+        
+        self.store = Gtk.ListStore(str, str, str, int)  # name, tab, description, option index
+        self.tree_view = Gtk.TreeView(model=self.store)
+        self.tree_view.set_enable_search(False)
+        self.tree_view.connect("row-activated", self._on_row_activated)
+        
+        for title, column_id in (("Option", COLUMN_NAME), ("Tab", COLUMN_TAB)):
+            column = Gtk.TreeViewColumn(title, Gtk.CellRendererText(), text=column_id)
+            self.tree_view.append_column(column)
+        
+        description_renderer = Gtk.CellRendererText(ellipsize=Pango.EllipsizeMode.END)
+        description_column = Gtk.TreeViewColumn(
+            "Description", description_renderer, text=COLUMN_DESCRIPTION
+        )
+        description_column.set_expand(True)
+        self.tree_view.append_column(description_column)
+        
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.add(self.tree_view)
+        content_area.pack_start(scrolled, True, True, 0)
+        
+        self.show_all()
+    
+    def _on_search_changed(self, entry):
+        """List the options matching the search text."""
+        self.store.clear()
+        for spec in self.catalog.search(entry.get_text(), SEARCH_RESULT_LIMIT):
+            self.store.append([spec.name, spec.tab or "General", spec.description, spec.index])
+        
+        first = self.store.get_iter_first()
+        if first is not None:
+            self.tree_view.get_selection().select_iter(first)
+    
+    def _on_search_activate(self, entry):
+        """Pick the selected result when Enter is pressed in the search entry."""
+        model, tree_iter = self.tree_view.get_selection().get_selected()
+        if tree_iter is not None:
+            self._pick(model[tree_iter][COLUMN_INDEX])
+    
+    def _on_search_key_press(self, entry, event):
+        """Move the selection with the arrow keys while typing."""
+        if event.keyval not in (Gdk.KEY_Up, Gdk.KEY_Down):
+            return False
+        
+        model, tree_iter = self.tree_view.get_selection().get_selected()
+        if tree_iter is None:
+            return True
+        
+        if event.keyval == Gdk.KEY_Down:
+            tree_iter = model.iter_next(tree_iter)
+        else:
+            tree_iter = model.iter_previous(tree_iter)
+        if tree_iter is not None:
+            self.tree_view.get_selection().select_iter(tree_iter)
+            self.tree_view.scroll_to_cell(model.get_path(tree_iter), None, False, 0, 0)
+        return True
+    
+    def _on_row_activated(self, tree_view, path, column):
+        """Pick a double-clicked result."""
+        self._pick(self.store[path][COLUMN_INDEX])
+    
+    def _pick(self, index):
+        """Close the dialog with an option picked."""
+        self.selected_option = self.catalog.options[index]
+        logger.debug("Option search picked %s", self.selected_option.name)
+        self.response(Gtk.ResponseType.OK)
@@ -0,0 +1,165 @@
+"""
+Background path validation for SteamLauncherGUI entries.
+
+Path entries are validated once typing pauses, on a worker thread, so
+existence checks on slow or network file systems never block the UI. A
+result is only applied if the entry still holds the text it was computed
+for. The worker also fills a completion popup from cached directory
+listings.
+"""
+
+import logging
+import queue
+import threading
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gtk, GLib
+
+from steamlaunchergui.utils.path_cache import get_path_cache
+from steamlaunchergui.utils.validation import validate_path
+
+logger = logging.getLogger(__name__)
+
+# Delay after the last keystroke before a path is checked (milliseconds)
+PATH_VALIDATION_DELAY = 300
+
+def set_entry_error(entry, valid, error=""):
+    """
+    Show or clear the error state of an entry.
+    
+    Args:
+        entry: The Gtk.Entry
+        valid: Whether the entry text is valid
+        error: Message shown as tooltip when invalid
+    """
+    style_context = entry.get_style_context()
+    if valid:
+        style_context.remove_class("error-text")
+        entry.set_tooltip_text(None)
+    else:
+        style_context.add_class("error-text")
+        entry.set_tooltip_text(error)
+
+class PathValidator:
+    """
+    Debounces path entries and validates them on a worker thread.
+    """
+    
+    def __init__(self, delay=PATH_VALIDATION_DELAY, cache=None):
+        """
+        Initialize the validator.
+        
+        Args:
+            delay: Debounce delay in milliseconds
+            cache: Path cache, defaults to the shared cache
+        """
+        self.delay = delay
+        self.cache = cache or get_path_cache()
+        self._timeouts = {}
+        self._latest = {}
+        self._queue = queue.Queue()
+        self._thread = None
+    
+    def attach(self, entry):
+        """
+        Validate an entry as a path and offer path completions.
+        
+        Args:
+            entry: The Gtk.Entry
+        """
+        store = Gtk.ListStore(str)
+        completion = Gtk.EntryCompletion()
+        completion.set_model(store)
+        completion.set_text_column(0)
+        completion.set_minimum_key_length(1)
+        entry.set_completion(completion)
+        
+        entry.connect("changed", self._on_changed)
+        entry.connect("destroy", self._on_destroy)
+    
+    def _on_changed(self, entry):
+        """Restart the debounce timer of an entry."""
+        self._cancel_timeout(entry)
+        
+        text = entry.get_text()
+        self._latest[entry] = text
+        if not text:
+            set_entry_error(entry, True)
+            return
+        
+        self._timeouts[entry] = GLib.timeout_add(self.delay, self._on_timeout, entry)
+    
+    def _on_timeout(self, entry):
+        """Queue the entry text for validation once typing paused."""
+        self._timeouts.pop(entry, None)
+        self._ensure_worker()
+        self._queue.put((entry, entry.get_text()))
+        return False
+    
+    def _on_destroy(self, entry):
+        """Forget a destroyed entry."""
+        self._cancel_timeout(entry)
+        self._latest.pop(entry, None)
+    
+    def _cancel_timeout(self, entry):
+        """Remove the pending debounce timer of an entry."""
+        source_id = self._timeouts.pop(entry, None)
+        if source_id is not None:
+            GLib.source_remove(source_id)
+    
+    def _ensure_worker(self):
+        """Start the worker thread on first use."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._worker, name="path-validation", daemon=True
+            )
+            self._thread.start()
+    
+    def _worker(self):
+        """Validate queued paths and hand the results to the GTK thread."""
+        while True:
+            entry, text = self._queue.get()
+            
+            # Skip texts the user has typed past while this one was queued
+            if self._latest.get(entry) != text:
+                continue
+            
+            try:
+                valid, error = validate_path(text, self.cache)
+                completions = self.cache.complete(text)
+            except Exception as e:
+                logger.error(f"Error validating path {text}: {e}")
+                continue
+            
+            GLib.idle_add(self._apply, entry, text, valid, error, completions)
+    
+    def _apply(self, entry, text, valid, error, completions):
+        """Show a validation result if the entry text is unchanged."""
+        if self._latest.get(entry) != text or entry.get_text() != text:
+            return False
+        
+        set_entry_error(entry, valid, error)
+        
+        store = entry.get_completion().get_model()
+        store.clear()
+        for completion in completions:
+            if completion != text:
+                store.append([completion])
+        
+        return False
+
+_path_validator = None
+
+def get_path_validator():
+    """
+    Get the shared path validator.
+    
+    Returns:
+        PathValidator: The shared validator
+    """
+    global _path_validator
+    if _path_validator is None:
+        _path_validator = PathValidator()
+    return _path_validator
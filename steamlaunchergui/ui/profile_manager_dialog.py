@@ -1,5 +1,10 @@
 """
 Profile manager dialog for SteamLauncherGUI.
+
+Profile writes are queued on a ProfileWriter and their results arrive
+through GLib.idle_add, so the dialog never waits for the disk. The list
+follows the change events of the profile manager row by row; sorting and
+filtering are left to GTK models.
 """
 
 import logging
@@ -11,13 +16,21 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, Gdk, GLib
 
 from steamlaunchergui.models import Profile
+from steamlaunchergui.models.profile_bundle import BUNDLE_PATTERNS, is_bundle
+from steamlaunchergui.models.profile_writer import ProfileWriter
+from steamlaunchergui.models.profiles import (
+    PROFILE_ADDED, PROFILE_REMOVED, PROFILE_UPDATED, PROFILES_RELOADED
+)
 
 logger = logging.getLogger(__name__)
 
+# Store columns
+COLUMN_NAME, COLUMN_DESCRIPTION, COLUMN_CREATED, COLUMN_CREATED_AT, COLUMN_SEARCH = range(5)
+
 class ProfileManagerDialog(Gtk.Dialog):
     """Dialog for managing profiles."""
     
-    def __init__(self, parent, profile_manager, launch_options):
+    def __init__(self, parent, profile_manager, launch_options, profile_writer=None):
         """
         Initialize the profile manager dialog.
         
@@ -25,6 +38,8 @@ class ProfileManagerDialog(Gtk.Dialog):
             parent: Parent window
             profile_manager: ProfileManager instance
             launch_options: Current LaunchOptions instance
+            profile_writer: ProfileWriter reporting through GLib.idle_add, or
+                None to use one owned by the dialog
         """
         super().__init__(
             title="Profile Manager",
@@ -36,6 +51,17 @@ class ProfileManagerDialog(Gtk.Dialog):
         self.profile_manager = profile_manager
         self.launch_options = launch_options
         
+        # Writes still running when the dialog closes finish on the writer;
+        # their results are ignored once the dialog is gone
+        self._owns_writer = profile_writer is None
+        self.profile_writer = profile_writer or ProfileWriter(profile_manager, GLib.idle_add)
+        self._destroyed = False
+        self.connect("destroy", self._on_destroy)
+        
+        # Store rows by profile name, and the lowercase filter text
+        self._rows = {}
+        self._filter_text = ""
+        
         # Add buttons
         self.add_button("Close", Gtk.ResponseType.CLOSE)
         self.add_button("Apply Selected", Gtk.ResponseType.APPLY)
@@ -43,8 +69,9 @@ class ProfileManagerDialog(Gtk.Dialog):
         # Set up the dialog content
         self._setup_ui()
         
-        # Refresh the profile list
+        # Fill the profile list and follow later changes
         self.refresh_profiles()
+        self.profile_manager.add_listener(self._on_profiles_changed)
         
         # Show all widgets
         self.show_all()
@@ -74,32 +101,49 @@ class ProfileManagerDialog(Gtk.Dialog):
         list_frame = Gtk.Frame(label="Profiles")
         parent_box.pack_start(list_frame, True, True, 0)
         
+        list_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        list_frame.add(list_box)
+        
+        # Create filter box
+        self.filter_entry = Gtk.SearchEntry()
+        self.filter_entry.set_placeholder_text("Filter profiles by name or description")
+        self.filter_entry.connect("search-changed", self.on_filter_changed)
+        list_box.pack_start(self.filter_entry, False, False, 0)
+        
         # Create scrolled window
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        list_frame.add(scrolled)
+        list_box.pack_start(scrolled, True, True, 0)
         
-        # Create list store
-        self.profile_store = Gtk.ListStore(str, str, str)  # name, description, created_at
+        # Create list store, filtered and then sorted for the view
+        self.profile_store = self._create_store()
+        self._attach_store(self.profile_store)
         
         # Create tree view
-        self.profile_view = Gtk.TreeView(model=self.profile_store)
+        self.profile_view = Gtk.TreeView(model=self.profile_sort)
         self.profile_view.set_headers_visible(True)
+        self.profile_view.set_fixed_height_mode(True)
         
         # Create columns
-        name_column = Gtk.TreeViewColumn("Name", Gtk.CellRendererText(), text=0)
-        name_column.set_sort_column_id(0)
+        name_column = Gtk.TreeViewColumn("Name", Gtk.CellRendererText(), text=COLUMN_NAME)
+        name_column.set_sort_column_id(COLUMN_NAME)
+        name_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+        name_column.set_fixed_width(180)
         name_column.set_resizable(True)
         name_column.set_expand(True)
         self.profile_view.append_column(name_column)
         
-        desc_column = Gtk.TreeViewColumn("Description", Gtk.CellRendererText(), text=1)
+        desc_column = Gtk.TreeViewColumn("Description", Gtk.CellRendererText(), text=COLUMN_DESCRIPTION)
+        desc_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+        desc_column.set_fixed_width(180)
         desc_column.set_resizable(True)
         desc_column.set_expand(True)
         self.profile_view.append_column(desc_column)
         
-        date_column = Gtk.TreeViewColumn("Created", Gtk.CellRendererText(), text=2)
-        date_column.set_sort_column_id(2)
+        date_column = Gtk.TreeViewColumn("Created", Gtk.CellRendererText(), text=COLUMN_CREATED)
+        date_column.set_sort_column_id(COLUMN_CREATED_AT)
+        date_column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+        date_column.set_fixed_width(130)
         self.profile_view.append_column(date_column)
         
         # Connect selection signal
@@ -133,6 +177,12 @@ class ProfileManagerDialog(Gtk.Dialog):
         export_button.connect("clicked", self.on_export_profile_clicked)
         button_box.pack_start(export_button, True, True, 0)
         
+        # Add bundle export button
+        export_bundle_button = Gtk.Button(label="Export Listed")
+        export_bundle_button.set_tooltip_text("Export all listed profiles to one bundle")
+        export_bundle_button.connect("clicked", self.on_export_bundle_clicked)
+        button_box.pack_start(export_bundle_button, True, True, 0)
+        
         # Add import button
         import_button = Gtk.Button(label="Import")
         import_button.connect("clicked", self.on_import_profile_clicked)
@@ -173,33 +223,112 @@ class ProfileManagerDialog(Gtk.Dialog):
         update_button.connect("clicked", self.on_update_details_clicked)
         grid.attach(update_button, 1, 2, 1, 1)
     
+    @staticmethod
+    def _create_store():
+        """Create an empty profile store."""
+        # name, description, formatted creation date, creation time, search text
+        return Gtk.ListStore(str, str, str, float, str)
+    
+    def _attach_store(self, store):
+        """Put the filter and sort models over a store."""
+        self.profile_filter = store.filter_new()
+        self.profile_filter.set_visible_func(self._is_profile_visible)
+        
+        # Keep the sort order the user picked when the models are replaced
+        sort_column = getattr(self, "profile_sort", None)
+        sort_column = sort_column.get_sort_column_id() if sort_column else (None, None)
+        self.profile_sort = Gtk.TreeModelSort(model=self.profile_filter)
+        if sort_column[0] is None:
+            self.profile_sort.set_sort_column_id(COLUMN_NAME, Gtk.SortType.ASCENDING)
+        else:
+            self.profile_sort.set_sort_column_id(*sort_column)
+    
+    @staticmethod
+    def _row_values(profile):
+        """Get the store row of a profile."""
+        created_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(profile.created_at))
+        search = f"{profile.name}\n{profile.description}".lower()
+        return [profile.name, profile.description, created_at, profile.created_at, search]
+    
     def refresh_profiles(self):
-        """Refresh the profile list from the profile manager."""
-        # Clear the list store
-        self.profile_store.clear()
-        
-        # Load profiles
-        profiles = self.profile_manager.get_profiles()
-        
-        # Add profiles to list store
-        for profile in sorted(profiles, key=lambda p: p.name):
-            # Format created_at date
-            created_at = time.strftime(
-                "%Y-%m-%d %H:%M", time.localtime(profile.created_at)
-            )
-            
-            self.profile_store.append([profile.name, profile.description, created_at])
+        """
+        Rebuild the profile list from the profile manager.
+        
+        The new store is filled before it is attached, so the view sorts
+        and redraws once.
+        """
+        store = self._create_store()
+        self._rows = {
+            profile.name: store.append(self._row_values(profile))
+            for profile in self.profile_manager.get_profiles()
+        }
+        
+        self.profile_store = store
+        self._attach_store(store)
+        self.profile_view.set_model(self.profile_sort)
+    
+    def _on_profiles_changed(self, event, profile):
+        """Hand a profile change, made on any thread, to the GTK thread."""
+        GLib.idle_add(self._apply_profile_event, event, profile)
+    
+    def _apply_profile_event(self, event, profile):
+        """Apply a profile change to the list in place."""
+        if self._destroyed:
+            return False
+        
+        if event == PROFILES_RELOADED:
+            self.refresh_profiles()
+        elif event == PROFILE_REMOVED:
+            tree_iter = self._rows.pop(profile.name, None)
+            if tree_iter is not None:
+                self.profile_store.remove(tree_iter)
+        elif event in (PROFILE_ADDED, PROFILE_UPDATED):
+            tree_iter = self._rows.get(profile.name)
+            if tree_iter is None:
+                self._rows[profile.name] = self.profile_store.append(self._row_values(profile))
+            else:
+                values = self._row_values(profile)
+                self.profile_store.set(tree_iter, list(range(len(values))), values)
+        return False
+    
+    def _is_profile_visible(self, model, tree_iter, data=None):
+        """Show the profiles matching the filter text."""
+        return not self._filter_text or self._filter_text in model[tree_iter][COLUMN_SEARCH]
+    
+    def on_filter_changed(self, entry):
+        """Show only the profiles matching the filter text."""
+        self._filter_text = entry.get_text().strip().lower()
+        self.profile_filter.refilter()
+    
+    def _on_destroy(self, widget):
+        """Stop reporting write results to the closed dialog."""
+        self._destroyed = True
+        self.profile_manager.remove_listener(self._on_profiles_changed)
+        if self._owns_writer:
+            self.profile_writer.close()
+    
+    def _show_message(self, message_type, text):
+        """Show a message box unless the dialog was closed meanwhile."""
+        if self._destroyed:
+            return
+        dialog = Gtk.MessageDialog(
+            transient_for=self,
+            flags=0,
+            message_type=message_type,
+            buttons=Gtk.ButtonsType.OK,
+            text=text
+        )
+        dialog.run()
+        dialog.destroy()
     
     # Event handlers
     def on_profile_selection_changed(self, selection):
         """Handle profile selection change."""
         model, treeiter = selection.get_selected()
         if treeiter is not None:
-            name = model[treeiter][0]
-            profile = self.profile_manager.get_profile(name)
-            if profile:
-                self.name_entry.set_text(profile.name)
-                self.desc_entry.set_text(profile.description)
+            # The row holds the listed details, so the disk is not touched
+            self.name_entry.set_text(model[treeiter][COLUMN_NAME])
+            self.desc_entry.set_text(model[treeiter][COLUMN_DESCRIPTION])
     
     def on_new_profile_clicked(self, button):
         """Handle new profile button click."""
@@ -252,11 +381,8 @@ class ProfileManagerDialog(Gtk.Dialog):
                 profile = Profile(name, description)
                 profile.update(self.launch_options)
                 
-                # Save the profile
-                self.profile_manager.save_profile(profile)
-                
-                # Refresh the list
-                self.refresh_profiles()
+                # Save the profile in the background; it is listed once written
+                self.profile_writer.save(profile)
         
         dialog.destroy()
     
@@ -268,28 +394,16 @@ class ProfileManagerDialog(Gtk.Dialog):
         
         if treeiter is not None:
             # Update existing profile
-            name = model[treeiter][0]
-            profile = self.profile_manager.get_profile(name)
+            name = model[treeiter][COLUMN_NAME]
             
-            if profile:
-                # Update with current launch options
-                profile.update(self.launch_options)
-                
-                # Save the profile
-                self.profile_manager.save_profile(profile)
-                
-                # Show message
-                dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=0,
-                    message_type=Gtk.MessageType.INFO,
-                    buttons=Gtk.ButtonsType.OK,
-                    text=f"Profile '{name}' updated"
+            # Look up and save the profile with the current launch options in
+            # the background, and report the result
+            self.profile_writer.update_options(
+                name, self.launch_options, lambda success: self._show_message(
+                    Gtk.MessageType.INFO if success else Gtk.MessageType.ERROR,
+                    f"Profile '{name}' updated" if success else f"Failed to save profile '{name}'"
                 )
-                dialog.run()
-                dialog.destroy()
-            else:
-                logger.error(f"Profile not found: {name}")
+            )
         else:
             # No profile selected, prompt to create new
             self.on_new_profile_clicked(button)
@@ -301,7 +415,7 @@ class ProfileManagerDialog(Gtk.Dialog):
         model, treeiter = selection.get_selected()
         
         if treeiter is not None:
-            name = model[treeiter][0]
+            name = model[treeiter][COLUMN_NAME]
             
             # Confirm deletion
             dialog = Gtk.MessageDialog(
@@ -319,27 +433,21 @@ class ProfileManagerDialog(Gtk.Dialog):
             dialog.destroy()
             
             if response == Gtk.ResponseType.YES:
-                # Delete the profile
-                success = self.profile_manager.delete_profile(name)
-                
-                if success:
-                    # Refresh the list
-                    self.refresh_profiles()
-                    
-                    # Clear the detail fields
-                    self.name_entry.set_text("")
-                    self.desc_entry.set_text("")
-                else:
-                    # Show error
-                    error_dialog = Gtk.MessageDialog(
-                        transient_for=self,
-                        flags=0,
-                        message_type=Gtk.MessageType.ERROR,
-                        buttons=Gtk.ButtonsType.OK,
-                        text="Failed to delete profile"
-                    )
-                    error_dialog.run()
-                    error_dialog.destroy()
+                # Delete the profile in the background
+                self.profile_writer.delete(name, self._on_profile_deleted)
+    
+    def _on_profile_deleted(self, success):
+        """Handle the result of a queued profile deletion."""
+        if self._destroyed:
+            return
+        
+        if success:
+            # Clear the detail fields
+            self.name_entry.set_text("")
+            self.desc_entry.set_text("")
+        else:
+            # Show error
+            self._show_message(Gtk.MessageType.ERROR, "Failed to delete profile")
     
     def on_export_profile_clicked(self, button):
         """Handle export profile button click."""
@@ -348,7 +456,7 @@ class ProfileManagerDialog(Gtk.Dialog):
         model, treeiter = selection.get_selected()
         
         if treeiter is not None:
-            name = model[treeiter][0]
+            name = model[treeiter][COLUMN_NAME]
             
             # Create file chooser dialog
             dialog = Gtk.FileChooserDialog(
@@ -372,34 +480,57 @@ class ProfileManagerDialog(Gtk.Dialog):
             if response == Gtk.ResponseType.OK:
                 filepath = Path(dialog.get_filename())
                 
-                # Export the profile
-                success = self.profile_manager.export_profile(name, filepath)
-                
-                if success:
-                    # Show success message
-                    success_dialog = Gtk.MessageDialog(
-                        transient_for=self,
-                        flags=0,
-                        message_type=Gtk.MessageType.INFO,
-                        buttons=Gtk.ButtonsType.OK,
-                        text=f"Profile exported to {filepath}"
-                    )
-                    success_dialog.run()
-                    success_dialog.destroy()
-                else:
-                    # Show error
-                    error_dialog = Gtk.MessageDialog(
-                        transient_for=self,
-                        flags=0,
-                        message_type=Gtk.MessageType.ERROR,
-                        buttons=Gtk.ButtonsType.OK,
-                        text="Failed to export profile"
-                    )
-                    error_dialog.run()
-                    error_dialog.destroy()
+                # Export the profile in the background and report the result
+                self.profile_writer.export(name, filepath, lambda success: self._show_message(
+                    Gtk.MessageType.INFO if success else Gtk.MessageType.ERROR,
+                    f"Profile exported to {filepath}" if success else "Failed to export profile"
+                ))
             
             dialog.destroy()
     
+    def _add_bundle_filter(self, dialog):
+        """Add a file filter for profile bundles to a file chooser."""
+        filter_bundle = Gtk.FileFilter()
+        filter_bundle.set_name("Profile bundles")
+        for pattern in BUNDLE_PATTERNS:
+            filter_bundle.add_pattern(pattern)
+        dialog.add_filter(filter_bundle)
+    
+    def on_export_bundle_clicked(self, button):
+        """Handle export bundle button click."""
+        # Export the profiles shown by the current filter
+        names = [row[COLUMN_NAME] for row in self.profile_sort]
+        if not names:
+            self._show_message(Gtk.MessageType.ERROR, "No profiles to export")
+            return
+        
+        # Create file chooser dialog
+        dialog = Gtk.FileChooserDialog(
+            title="Export Profile Bundle",
+            parent=self,
+            action=Gtk.FileChooserAction.SAVE
+        )
+        dialog.add_button("Cancel", Gtk.ResponseType.CANCEL)
+        dialog.add_button("Export", Gtk.ResponseType.OK)
+        dialog.set_do_overwrite_confirmation(True)
+        self._add_bundle_filter(dialog)
+        
+        # Set default filename; a .tar.xz name selects xz compression
+        dialog.set_current_name("profiles.tar.gz")
+        
+        response = dialog.run()
+        if response == Gtk.ResponseType.OK:
+            filepath = Path(dialog.get_filename())
+            
+            # Export the bundle in the background and report the result
+            self.profile_writer.export_bundle(filepath, names, lambda count: self._show_message(
+                Gtk.MessageType.INFO if count >= 0 else Gtk.MessageType.ERROR,
+                f"{count} profiles exported to {filepath}" if count >= 0
+                else "Failed to export profiles"
+            ))
+        
+        dialog.destroy()
+    
     def on_import_profile_clicked(self, button):
         """Handle import profile button click."""
         # Create file chooser dialog
@@ -416,42 +547,46 @@ class ProfileManagerDialog(Gtk.Dialog):
         filter_json.set_name("JSON files")
         filter_json.add_pattern("*.json")
         dialog.add_filter(filter_json)
+        self._add_bundle_filter(dialog)
         
         response = dialog.run()
         if response == Gtk.ResponseType.OK:
             filepath = Path(dialog.get_filename())
             
-            # Import the profile
-            profile = self.profile_manager.import_profile(filepath)
-            
-            if profile:
-                # Refresh the list
-                self.refresh_profiles()
-                
-                # Show success message
-                success_dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=0,
-                    message_type=Gtk.MessageType.INFO,
-                    buttons=Gtk.ButtonsType.OK,
-                    text=f"Profile '{profile.name}' imported"
-                )
-                success_dialog.run()
-                success_dialog.destroy()
+            # Import the profile or bundle in the background
+            if is_bundle(filepath):
+                self.profile_writer.import_bundle(filepath, callback=self._on_bundle_imported)
             else:
-                # Show error
-                error_dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=0,
-                    message_type=Gtk.MessageType.ERROR,
-                    buttons=Gtk.ButtonsType.OK,
-                    text="Failed to import profile"
-                )
-                error_dialog.run()
-                error_dialog.destroy()
+                self.profile_writer.import_file(filepath, self._on_profile_imported)
         
         dialog.destroy()
     
+    def _on_profile_imported(self, profile):
+        """Handle the result of a queued profile import."""
+        if self._destroyed:
+            return
+        
+        if profile:
+            # Show success message
+            self._show_message(Gtk.MessageType.INFO, f"Profile '{profile.name}' imported")
+        else:
+            # Show error
+            self._show_message(Gtk.MessageType.ERROR, "Failed to import profile")
+    
+    def _on_bundle_imported(self, result):
+        """Handle the result of a queued bundle import."""
+        if self._destroyed:
+            return
+        
+        if result is not None:
+            self._show_message(
+                Gtk.MessageType.INFO,
+                f"{result.imported} profiles imported ({result.renamed} renamed, "
+                f"{result.skipped} skipped)"
+            )
+        else:
+            self._show_message(Gtk.MessageType.ERROR, "Failed to import profile bundle")
+    
     def on_update_details_clicked(self, button):
         """Handle update details button click."""
         # Get selected profile
@@ -459,37 +594,17 @@ class ProfileManagerDialog(Gtk.Dialog):
         model, treeiter = selection.get_selected()
         
         if treeiter is not None:
-            old_name = model[treeiter][0]
+            old_name = model[treeiter][COLUMN_NAME]
             new_name = self.name_entry.get_text()
             new_desc = self.desc_entry.get_text()
             
-            profile = self.profile_manager.get_profile(old_name)
-            if profile:
-                # Update profile
-                if old_name != new_name:
-                    # We need to create a new profile and delete the old one
-                    # since the name is the key
-                    new_profile = Profile(new_name, new_desc, profile.launch_options)
-                    new_profile.created_at = profile.created_at
-                    new_profile.updated_at = time.time()
-                    
-                    # Save new profile
-                    self.profile_manager.save_profile(new_profile)
-                    
-                    # Delete old profile
-                    self.profile_manager.delete_profile(old_name)
-                else:
-                    # Just update the description
-                    profile.description = new_desc
-                    profile.updated_at = time.time()
-                    
-                    # Save profile
-                    self.profile_manager.save_profile(profile)
-                
-                # Refresh the list
-                self.refresh_profiles()
-            else:
-                logger.error(f"Profile not found: {old_name}")
+            # Look the profile up, rename it and save it in the background;
+            # a renamed profile is only deleted under its old name once it
+            # was saved under the new one
+            self.profile_writer.update_details(
+                old_name, new_name, new_desc,
+                lambda success: self._on_details_updated(old_name, success)
+            )
         else:
             # Show warning
             warning_dialog = Gtk.MessageDialog(
@@ -500,4 +615,9 @@ class ProfileManagerDialog(Gtk.Dialog):
                 text="No profile selected"
             )
             warning_dialog.run()
-            warning_dialog.destroy()
\ No newline at end of file
+            warning_dialog.destroy()
+    
+    def _on_details_updated(self, name, success):
+        """Report a failed rename or description change."""
+        if not success:
+            self._show_message(Gtk.MessageType.ERROR, f"Failed to update profile '{name}'")
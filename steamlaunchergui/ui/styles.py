@@ -102,6 +102,11 @@ scrolledwindow {
     padding: 12px;
 }
 
+.search-highlight {
+    outline: 2px solid #4a90d9;
+    outline-offset: 1px;
+}
+
 .command-display {
     background-color: #252525;
     color: #e0e0e0;
@@ -8,7 +8,9 @@ import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, Gdk
 
-from steamlaunchergui.utils.validation import validate_path, validate_number, validate_color
+from steamlaunchergui.config.option_catalog import TAB_DROPDOWN, TAB_FLAG, TAB_INPUT, TAB_SLIDER, TAB_TOGGLE
+from steamlaunchergui.ui.path_validation import get_path_validator, set_entry_error
+from steamlaunchergui.utils.validation import validate_number, validate_color
 
 logger = logging.getLogger(__name__)
 
@@ -20,36 +22,23 @@ def create_tab_content(tab_name, config, launch_options, software_available=True
         tab_name: Name of the tab
         config: Tab configuration
         launch_options: LaunchOptions model
-        software_available: Whether required software is available
+        software_available: Whether required software is available, or
+            None while detection is still running
         
     Returns:
-        Gtk.Widget: The tab content widget
+        Gtk.Widget: The tab content widget, with the widget of each option
+            in option_widgets, keyed by (kind, option)
     """
     # Create main container
     main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+    option_widgets = {}
+    main_box.option_widgets = option_widgets
     
-    # Add warning if software is not available
-    if not software_available:
-        software_name = config.get("software_requirement", tab_name)
-        warning_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
-        warning_icon = Gtk.Image.new_from_icon_name("dialog-warning", Gtk.IconSize.MENU)
-        warning_label = Gtk.Label(
-            label=f"{software_name} is not installed. Some options may not work."
-        )
-        warning_label.get_style_context().add_class("warning-text")
-        
-        install_button = Gtk.Button(label=f"Install {software_name}")
-        install_button.connect("clicked", on_install_clicked, software_name)
-        
-        warning_box.pack_start(warning_icon, False, False, 5)
-        warning_box.pack_start(warning_label, False, False, 0)
-        warning_box.pack_end(install_button, False, False, 0)
-        
-        main_box.pack_start(warning_box, False, False, 0)
-        
-        # Add separator
-        separator = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        main_box.pack_start(separator, False, False, 5)
+    # Add software requirement status area
+    status_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+    main_box.pack_start(status_box, False, False, 0)
+    main_box.software_status_box = status_box
+    set_software_status(main_box, tab_name, config, software_available)
     
     # Add enable checkbox
     enable_label = config.get("enable_label", f"Enable {tab_name}")
@@ -67,6 +56,7 @@ def create_tab_content(tab_name, config, launch_options, software_available=True
     )
     
     main_box.pack_start(enable_check, False, False, 0)
+    main_box.enable_check = enable_check
     
     # Create content box (for all options)
     content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
@@ -98,6 +88,8 @@ def create_tab_content(tab_name, config, launch_options, software_available=True
             )
             
             toggles_box.pack_start(check, False, False, 0)
+            kind = TAB_FLAG if toggle_option.startswith('-') else TAB_TOGGLE
+            option_widgets[(kind, toggle_option)] = check
         
         content_box.pack_start(toggles_frame, False, False, 0)
     
@@ -131,7 +123,8 @@ def create_tab_content(tab_name, config, launch_options, software_available=True
             
             # Validate based on input type
             if "path" in input_label.lower():
-                entry.connect("changed", validate_entry, "path")
+                # Checked off the UI thread once typing pauses
+                get_path_validator().attach(entry)
             elif "color" in input_label.lower():
                 entry.connect("changed", validate_entry, "color")
             elif any(x in input_label.lower() for x in ["size", "width", "height", "level"]):
@@ -140,6 +133,7 @@ def create_tab_content(tab_name, config, launch_options, software_available=True
             # Add to grid
             inputs_grid.attach(label, 0, row, 1, 1)
             inputs_grid.attach(entry, 1, row, 1, 1)
+            option_widgets[(TAB_INPUT, input_option)] = entry
         
         content_box.pack_start(inputs_frame, False, False, 0)
     
@@ -183,6 +177,7 @@ def create_tab_content(tab_name, config, launch_options, software_available=True
             # Add to grid
             dropdowns_grid.attach(label, 0, row, 1, 1)
             dropdowns_grid.attach(combo, 1, row, 1, 1)
+            option_widgets[(TAB_DROPDOWN, key)] = combo
         
         content_box.pack_start(dropdowns_frame, False, False, 0)
     
@@ -217,16 +212,68 @@ def create_tab_content(tab_name, config, launch_options, software_available=True
             # Add to grid
             sliders_grid.attach(label, 0, row, 1, 1)
             sliders_grid.attach(scale, 1, row, 1, 1)
+            option_widgets[(TAB_SLIDER, slider_option)] = scale
         
         content_box.pack_start(sliders_frame, False, False, 0)
     
     return main_box
 
+def set_software_status(tab_content, tab_name, config, software_available):
+    """
+    Show the software requirement status of a tab.
+    
+    Args:
+        tab_content: Widget returned by create_tab_content
+        tab_name: Name of the tab
+        config: Tab configuration
+        software_available: Whether required software is available, or
+            None while detection is still running
+    """
+    status_box = tab_content.software_status_box
+    for child in status_box.get_children():
+        status_box.remove(child)
+    
+    software_name = config.get("software_requirement", tab_name)
+    
+    if software_available is None:
+        # Detection has not finished yet
+        checking_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        spinner = Gtk.Spinner()
+        spinner.start()
+        checking_label = Gtk.Label(label=f"Checking for {software_name}…")
+        
+        checking_box.pack_start(spinner, False, False, 5)
+        checking_box.pack_start(checking_label, False, False, 0)
+        status_box.pack_start(checking_box, False, False, 0)
+    elif not software_available:
+        # Add warning if software is not available
+        warning_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        warning_icon = Gtk.Image.new_from_icon_name("dialog-warning", Gtk.IconSize.MENU)
+        warning_label = Gtk.Label(
+            label=f"{software_name} is not installed. Some options may not work."
+        )
+        warning_label.get_style_context().add_class("warning-text")
+        
+        install_button = Gtk.Button(label=f"Install {software_name}")
+        install_button.connect("clicked", on_install_clicked, software_name)
+        
+        warning_box.pack_start(warning_icon, False, False, 5)
+        warning_box.pack_start(warning_label, False, False, 0)
+        warning_box.pack_end(install_button, False, False, 0)
+        
+        status_box.pack_start(warning_box, False, False, 0)
+        
+        # Add separator
+        separator = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
+        status_box.pack_start(separator, False, False, 5)
+    
+    status_box.show_all()
+
 # Signal handlers
 def on_tab_enabled_toggled(checkbutton, tab_name, launch_options):
     """Handle tab enable checkbox toggle."""
     enabled = checkbutton.get_active()
-    launch_options.tab_enabled[tab_name] = enabled
+    launch_options.set_tab_enabled(tab_name, enabled)
     logger.debug(f"Tab '{tab_name}' enabled: {enabled}")
 
 def on_content_sensitivity_toggled(checkbutton, content_box):
@@ -236,24 +283,13 @@ def on_content_sensitivity_toggled(checkbutton, content_box):
 def on_toggle_toggled(checkbutton, tab_name, option, launch_options):
     """Handle option toggle checkbox."""
     enabled = checkbutton.get_active()
-    
-    # Ensure tab_toggles for this tab exists
-    if tab_name not in launch_options.tab_toggles:
-        launch_options.tab_toggles[tab_name] = {}
-    
-    launch_options.tab_toggles[tab_name][option] = enabled
+    launch_options.set_tab_toggle(tab_name, option, enabled)
     logger.debug(f"Option '{option}' in tab '{tab_name}' set to: {enabled}")
 
 def on_input_changed(entry, tab_name, option, launch_options):
     """Handle input entry change."""
     value = entry.get_text()
-    
-    # Ensure tab_inputs for this tab exists
-    if tab_name not in launch_options.tab_inputs:
-        launch_options.tab_inputs[tab_name] = {}
-    
-    launch_options.tab_inputs[tab_name][option] = value
-    logger.debug(f"Input '{option}' in tab '{tab_name}' set to: {value}")
+    launch_options.set_tab_input(tab_name, option, value)
 
 def on_dropdown_changed(combo, tab_name, key, options, launch_options):
     """Handle dropdown selection change."""
@@ -262,24 +298,15 @@ def on_dropdown_changed(combo, tab_name, key, options, launch_options):
         return
     
     value = options[active]
-    
-    # Ensure tab_dropdowns for this tab exists
-    if tab_name not in launch_options.tab_dropdowns:
-        launch_options.tab_dropdowns[tab_name] = {}
-    
-    launch_options.tab_dropdowns[tab_name][key] = value
+    launch_options.set_tab_dropdown(tab_name, key, value)
     logger.debug(f"Dropdown '{key}' in tab '{tab_name}' set to: {value}")
 
 def on_slider_changed(scale, tab_name, option, launch_options):
     """Handle slider value change."""
-    value = scale.get_value()
-    
-    # Ensure tab_sliders for this tab exists
-    if tab_name not in launch_options.tab_sliders:
-        launch_options.tab_sliders[tab_name] = {}
-    
-    launch_options.tab_sliders[tab_name][option] = value
-    logger.debug(f"Slider '{option}' in tab '{tab_name}' set to: {value}")
+    # Round to the generated precision so drag ticks that do not change
+    # the command are no-ops
+    value = round(scale.get_value(), 2)
+    launch_options.set_tab_slider(tab_name, option, value)
 
 def on_install_clicked(button, software_name):
     """Handle install button click."""
@@ -307,20 +334,14 @@ def validate_entry(entry, input_type):
     """Validate entry input and show feedback."""
     text = entry.get_text()
     if not text:
-        entry.remove_css_class("error-text")
+        set_entry_error(entry, True)
         return
     
-    if input_type == "path":
-        valid, error = validate_path(text)
-    elif input_type == "color":
+    if input_type == "color":
         valid, error = validate_color(text)
     elif input_type == "integer":
         valid, error = validate_number(text)
     else:
         valid, error = True, ""
     
-    if valid:
-        entry.remove_css_class("error-text")
-    else:
-        entry.add_css_class("error-text")
-        entry.set_tooltip_text(error)
\ No newline at end of file
+    set_entry_error(entry, valid, error)
@@ -0,0 +1,144 @@
+"""
+Coalescing refresh scheduler for the SteamLauncherGUI user interface.
+
+Widget signals such as slider drags and entry keystrokes can fire hundreds
+of times per second. Instead of refreshing derived views on each signal,
+handlers request a named refresh here; all pending refreshes run once from
+a single idle callback scheduled ahead of GTK's redraw, so each view is
+updated at most once per frame.
+"""
+
+import logging
+import time
+from typing import Callable, Dict
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import GLib
+
+logger = logging.getLogger(__name__)
+
+# Runs after input and resize handling but before GTK redraws (HIGH_IDLE + 20)
+REFRESH_PRIORITY = GLib.PRIORITY_HIGH_IDLE + 10
+
+class UpdateScheduler:
+    """
+    Collects refresh requests and runs each requested target once per flush.
+    """
+    
+    def __init__(self, priority: int = REFRESH_PRIORITY):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            priority: GLib priority of the flush callback
+        """
+        self.priority = priority
+        self._targets: Dict[str, Callable[[], None]] = {}
+        self._pending: Dict[str, None] = {}
+        self._source_id = None
+        
+        # Instrumentation counters
+        self.requests = 0
+        self.flushes = 0
+        self.runs: Dict[str, int] = {}
+        self.flush_time = 0.0
+        self.max_flush_time = 0.0
+    
+    def register(self, name: str, callback: Callable[[], None]) -> None:
+        """
+        Register a refresh target.
+        
+        Targets run in registration order within a flush.
+        
+        Args:
+            name: Name used to request the refresh
+            callback: Function performing the refresh
+        """
+        self._targets[name] = callback
+        self.runs.setdefault(name, 0)
+    
+    def request(self, *names: str) -> None:
+        """
+        Request refreshes, scheduling a flush if none is pending.
+        
+        Args:
+            names: Names of registered targets
+        """
+        self.requests += 1
+        for name in names:
+            self._pending[name] = None
+        
+        if self._source_id is None and self._pending:
+            self._source_id = GLib.idle_add(self._on_idle, priority=self.priority)
+    
+    def cancel(self, *names: str) -> None:
+        """
+        Drop pending requests, e.g. after refreshing synchronously.
+        
+        Args:
+            names: Names of targets, or none to drop all pending requests
+        """
+        if names:
+            for name in names:
+                self._pending.pop(name, None)
+        else:
+            self._pending.clear()
+        
+        if not self._pending and self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+    
+    def flush(self) -> None:
+        """Run all pending refreshes now."""
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+        self._run_pending()
+    
+    def _on_idle(self):
+        """Idle callback running the pending refreshes."""
+        self._source_id = None
+        self._run_pending()
+        return False
+    
+    def _run_pending(self):
+        """Run pending targets in registration order."""
+        if not self._pending:
+            return
+        
+        start = time.perf_counter()
+        self.flushes += 1
+        
+        # Targets may request further refreshes while running
+        pending = self._pending
+        self._pending = {}
+        for name, callback in self._targets.items():
+            if name in pending:
+                self.runs[name] += 1
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Error refreshing {name}: {e}")
+        
+        elapsed = time.perf_counter() - start
+        self.flush_time += elapsed
+        self.max_flush_time = max(self.max_flush_time, elapsed)
+    
+    def stats(self) -> Dict[str, object]:
+        """
+        Get the instrumentation counters.
+        
+        Returns:
+            Dict: Requests, flushes, runs per target, requests saved by
+                coalescing and flush timings in milliseconds
+        """
+        return {
+            "requests": self.requests,
+            "flushes": self.flushes,
+            "runs": dict(self.runs),
+            "coalesced": self.requests - self.flushes,
+            "avg_flush_ms": self.flush_time / self.flushes * 1000 if self.flushes else 0.0,
+            "max_flush_ms": self.max_flush_time * 1000,
+        }
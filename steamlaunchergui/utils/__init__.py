@@ -3,4 +3,6 @@ Utility functions for SteamLauncherGUI.
 """
 
 from .logging import setup_logging
-from .software_detection import check_software
+from .software_detection import (
+    check_software, check_software_batch, detect_steam_installs, SteamInstall
+)
@@ -0,0 +1,165 @@
+"""
+Short-lived file system lookup cache for SteamLauncherGUI.
+
+Path inputs are validated while the user types. Caching existence checks
+and directory listings for a few seconds keeps repeated lookups of the
+same directories, e.g. on a network mount, off the file system.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long cached lookups stay valid (seconds)
+PATH_CACHE_TTL = 5.0
+
+# Maximum number of cached entries of each kind
+PATH_CACHE_SIZE = 512
+
+class PathStatCache:
+    """
+    Thread-safe cache of path existence checks and directory listings.
+    """
+    
+    def __init__(self, ttl: float = PATH_CACHE_TTL, max_entries: int = PATH_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds a lookup stays valid
+            max_entries: Maximum number of cached entries of each kind
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._exists: Dict[str, Tuple[float, bool]] = {}
+        # Listings map entry names to whether they are directories, and
+        # keep the names of symbolic links, which may not resolve
+        self._listings: Dict[str, Tuple[float, Tuple[Dict[str, bool], FrozenSet[str]]]] = {}
+        self._lock = threading.Lock()
+    
+    def exists(self, path: str) -> bool:
+        """
+        Check whether a path exists.
+        
+        Args:
+            path: Path to check, with ~ already expanded
+            
+        Returns:
+            bool: Whether the path exists
+        """
+        cached = self._get(self._exists, path)
+        if cached is not None:
+            return cached
+        
+        # A fresh listing of the parent answers without another stat, for
+        # plain names of entries that are not symbolic links
+        directory, name = os.path.split(path)
+        if name and name not in (os.curdir, os.pardir) and os.path.normpath(path) == path:
+            listing = self._get(self._listings, directory)
+            if listing is not None:
+                entries, links = listing
+                if name not in entries:
+                    return False
+                if name not in links:
+                    return True
+        
+        result = os.path.exists(path)
+        self._put(self._exists, path, result)
+        return result
+    
+    def listdir(self, directory: str) -> Dict[str, bool]:
+        """
+        Get the entries of a directory.
+        
+        Args:
+            directory: Directory to list, with ~ already expanded
+            
+        Returns:
+            Dict[str, bool]: Entry names in sorted order, mapped to whether
+                the entry is a directory; empty if it cannot be read
+        """
+        listing = self._get(self._listings, directory)
+        if listing is None:
+            entries = {}
+            links = set()
+            try:
+                with os.scandir(directory) as scan:
+                    for entry in sorted(scan, key=lambda entry: entry.name):
+                        try:
+                            entries[entry.name] = entry.is_dir()
+                            if entry.is_symlink():
+                                links.add(entry.name)
+                        except OSError:
+                            entries[entry.name] = False
+                            links.add(entry.name)
+            except OSError:
+                pass
+            listing = (entries, frozenset(links))
+            self._put(self._listings, directory, listing)
+        return listing[0]
+    
+    def complete(self, text: str, limit: int = 50) -> List[str]:
+        """
+        Get paths starting with the given text.
+        
+        Args:
+            text: Partially typed absolute or ~ path
+            limit: Maximum number of suggestions
+            
+        Returns:
+            List[str]: Matching paths, as typed up to the last separator,
+                with a trailing separator on directories
+        """
+        typed_directory, prefix = os.path.split(text)
+        directory = os.path.expanduser(typed_directory)
+        if not os.path.isabs(directory):
+            return []
+        
+        suggestions = []
+        for name, is_dir in self.listdir(directory).items():
+            if not name.startswith(prefix) or (name.startswith(".") and not prefix.startswith(".")):
+                continue
+            suggestions.append(os.path.join(typed_directory, name) + (os.sep if is_dir else ""))
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+    
+    def clear(self) -> None:
+        """Drop all cached lookups."""
+        with self._lock:
+            self._exists.clear()
+            self._listings.clear()
+    
+    def _get(self, entries, key):
+        """Get a cached value if it has not expired."""
+        with self._lock:
+            entry = entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+    
+    def _put(self, entries, key, value):
+        """Cache a value, dropping the oldest entry when full."""
+        with self._lock:
+            entries.pop(key, None)
+            if len(entries) >= self.max_entries:
+                del entries[next(iter(entries))]
+            entries[key] = (time.monotonic(), value)
+
+_path_cache: Optional[PathStatCache] = None
+
+def get_path_cache() -> PathStatCache:
+    """
+    Get the shared path cache.
+    
+    Returns:
+        PathStatCache: The shared cache
+    """
+    global _path_cache
+    if _path_cache is None:
+        _path_cache = PathStatCache()
+    return _path_cache
@@ -0,0 +1,215 @@
+"""
+Conflict rule engine for SteamLauncherGUI.
+
+Compiles the declarative conflict rules into an index from each option to
+the rules that read it, so that checking a changed set of options only
+re-evaluates the rules the change can affect.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from steamlaunchergui.config.conflict_rules import CONFLICT, CONFLICT_RULES, OVERRIDES, REQUIRES
+from steamlaunchergui.config.option_catalog import get_option_catalog
+
+logger = logging.getLogger(__name__)
+
+class Rule(NamedTuple):
+    """A compiled conflict rule."""
+    index: int
+    type: str
+    options: Tuple[str, ...]
+    message: str
+
+class RuleEngine:
+    """
+    Immutable, precompiled set of conflict rules.
+    """
+    
+    def __init__(self, rules: Sequence[Mapping[str, Any]]):
+        """
+        Compile the rules.
+        
+        Args:
+            rules: Rule definitions with "type", "options" and "message" keys
+            
+        Raises:
+            ValueError: If a rule has an unknown type or too few options
+        """
+        compiled: List[Rule] = []
+        index: Dict[str, List[int]] = {}
+        
+        for definition in rules:
+            rule = Rule(len(compiled), definition["type"],
+                        tuple(definition["options"]), definition["message"])
+            if rule.type not in (CONFLICT, REQUIRES, OVERRIDES):
+                raise ValueError(f"Unknown rule type: {rule.type}")
+            if len(rule.options) < 2:
+                raise ValueError(f"Rule needs at least two options: {rule.options}")
+            
+            compiled.append(rule)
+            for option in rule.options:
+                index.setdefault(option, []).append(rule.index)
+        
+        self.rules: Tuple[Rule, ...] = tuple(compiled)
+        self.index: Dict[str, Tuple[int, ...]] = {
+            option: tuple(indices) for option, indices in index.items()
+        }
+        self.options: FrozenSet[str] = frozenset(self.index)
+        
+        logger.debug(f"Compiled {len(self.rules)} conflict rules over {len(self.options)} options")
+    
+    def __len__(self) -> int:
+        return len(self.rules)
+    
+    def check(self, rule: Rule, options: Mapping[str, Any]) -> Optional[str]:
+        """
+        Evaluate a single rule.
+        
+        Args:
+            rule: The rule
+            options: Effective options, mapping each set option to its value
+            
+        Returns:
+            str or None: The warning message, or None if the rule holds
+        """
+        first, rest = rule.options[0], rule.options[1:]
+        
+        if rule.type == CONFLICT:
+            matched = [option for option in rule.options if option in options]
+            if len(matched) < 2:
+                return None
+        elif first not in options:
+            return None
+        elif rule.type == REQUIRES:
+            matched = [option for option in rest if option not in options]
+            if not matched:
+                return None
+        else:
+            matched = [option for option in rest if option in options]
+            if not matched:
+                return None
+        
+        return rule.message.format(options=", ".join(matched))
+    
+    def evaluate(self, options: Mapping[str, Any]) -> List[str]:
+        """
+        Evaluate every rule that reads a set option.
+        
+        Args:
+            options: Effective options, mapping each set option to its value
+            
+        Returns:
+            List[str]: Warning messages in rule order
+        """
+        affected = set()
+        for option in options:
+            affected.update(self.index.get(option, ()))
+        
+        warnings = []
+        for index in sorted(affected):
+            warning = self.check(self.rules[index], options)
+            if warning:
+                warnings.append(warning)
+        return warnings
+    
+    def unknown_options(self) -> List[str]:
+        """
+        Get rule options that do not name any known option.
+        
+        Returns:
+            List[str]: Unknown option names, e.g. typos in the rule table
+        """
+        catalog = get_option_catalog()
+        unknown = []
+        for option in sorted(self.options):
+            tab, _, name = option.rpartition(":")
+            if tab:
+                known = any(spec.tab == tab for spec in catalog.lookup(name))
+            else:
+                known = bool(catalog.lookup(name)) or name in catalog.prefixes
+            if not known:
+                unknown.append(option)
+        return unknown
+
+class ConflictChecker:
+    """
+    Incrementally maintained warnings for a changing set of options.
+    
+    Each update diffs the options against the previous update and
+    re-evaluates only the rules that read a changed option.
+    """
+    
+    def __init__(self, engine: Optional['RuleEngine'] = None):
+        """
+        Initialize the checker.
+        
+        Args:
+            engine: Rule engine to use, defaults to the built-in rules
+        """
+        self.engine = engine or get_rule_engine()
+        self._options: Dict[str, Any] = {}
+        self._results: Dict[int, str] = {}
+        self.warnings: List[str] = []
+    
+    def update(self, options: Mapping[str, Any]) -> bool:
+        """
+        Re-check the rules affected by changes since the last update.
+        
+        Args:
+            options: Effective options, mapping each set option to its value
+            
+        Returns:
+            bool: Whether the warnings changed
+        """
+        index = self.engine.index
+        previous = self._options
+        affected = set()
+        
+        for option, value in options.items():
+            if option in index and previous.get(option, _MISSING) != value:
+                affected.update(index[option])
+        for option in previous:
+            if option not in options:
+                affected.update(index[option])
+        
+        self._options = {option: value for option, value in options.items() if option in index}
+        if not affected:
+            return False
+        
+        changed = False
+        for rule_index in affected:
+            warning = self.engine.check(self.engine.rules[rule_index], self._options)
+            if warning != self._results.get(rule_index):
+                changed = True
+                if warning:
+                    self._results[rule_index] = warning
+                else:
+                    del self._results[rule_index]
+        
+        if changed:
+            self.warnings = [self._results[i] for i in sorted(self._results)]
+        return changed
+
+_MISSING = object()
+
+_default_engine: Optional[RuleEngine] = None
+_default_engine_lock = threading.Lock()
+
+def get_rule_engine() -> RuleEngine:
+    """
+    Get the rule engine compiled from the built-in conflict rules.
+    
+    Returns:
+        RuleEngine: The shared engine
+    """
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                engine = RuleEngine(CONFLICT_RULES)
+                for option in engine.unknown_options():
+                    logger.warning(f"Conflict rule refers to unknown option: {option}")
+                _default_engine = engine
+    return _default_engine
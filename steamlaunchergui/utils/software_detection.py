@@ -3,13 +3,62 @@ Utilities for detecting required software components.
 """
 
 import os
+import json
+import hashlib
+import time
 import logging
 import shutil
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from steamlaunchergui.config.constants import (
+    SOFTWARE_CACHE_FILE, SOFTWARE_CACHE_TTL, STEAM_LOCATIONS_FILE
+)
 
 logger = logging.getLogger(__name__)
 
+# Package manager databases
+DPKG_STATUS_FILE = Path("/var/lib/dpkg/status")
+RPM_DATABASES = [
+    Path("/var/lib/rpm/rpmdb.sqlite"),
+    Path("/var/lib/rpm/Packages.db"),  # ndb, e.g. openSUSE
+    Path("/var/lib/rpm/Packages"),
+]
+PACMAN_LOCAL_DIR = Path("/var/lib/pacman/local")
+
+# Package databases whose modification time invalidates cached results
+PACKAGE_DATABASES = [DPKG_STATUS_FILE, *RPM_DATABASES, PACMAN_LOCAL_DIR]
+
+# Installed package sets, keyed by database with the mtime they were read at
+_package_sets: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+_package_sets_lock = threading.Lock()
+
+# Common Steam installation locations
+STEAM_LOCATIONS = [
+    Path.home() / ".steam" / "steam",
+    Path.home() / ".local" / "share" / "Steam",
+    Path("/usr/share/steam"),
+    Path("/opt/steam"),
+    Path.home() / ".var" / "app" / "com.valvesoftware.Steam" / "data" / "Steam",  # Flatpak
+    Path.home() / "snap" / "steam" / "common" / ".local" / "share" / "Steam",  # Snap
+]
+
+# Executable names of the Steam client processes
+STEAM_PROCESS_NAMES = {"steam", "steam.sh", "steamwebhelper"}
+
+class SteamInstall(NamedTuple):
+    """A detected Steam installation."""
+    kind: str  # "native", "flatpak" or "snap"
+    path: Path
+
+# Steam installations resolved during this session
+_steam_installs: Optional[List[SteamInstall]] = None
+
 def check_software(software):
     """
     Check if the required software is installed on the system.
@@ -31,53 +80,307 @@ def check_software(software):
     except Exception as e:
         logger.error(f"Error checking for software with 'which': {e}")
     
-    # Try using 'dpkg' for Debian-based systems
+    # Look the name up in the installed package databases
     try:
-        result = subprocess.run(
-            ["dpkg", "-l", software], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            text=True, 
-            check=False
-        )
-        if result.returncode == 0 and "ii" in result.stdout:
-            logger.info(f"Software '{software}' found via dpkg")
+        if software in installed_packages():
+            logger.info(f"Software '{software}' found in the package database")
             return True
     except Exception as e:
-        logger.debug(f"Error checking for software with dpkg: {e}")
+        logger.debug(f"Error checking for software in package databases: {e}")
+    
+    logger.warning(f"Software '{software}' not found")
+    return False
+
+def installed_packages() -> FrozenSet[str]:
+    """
+    Get the names of all installed packages.
+    
+    The dpkg and pacman databases are read in-process, the rpm database
+    with one rpm query. Each set is cached and only re-read when its
+    database mtime changes. If rpm is installed but none of the known rpm
+    database files exists, the rpm query result is kept for the session.
+    
+    Returns:
+        FrozenSet[str]: Names of installed packages from all package managers
+    """
+    rpm_database = next((db for db in RPM_DATABASES if db.exists()), None)
+    
+    dpkg = partial(read_dpkg_status, DPKG_STATUS_FILE)
+    pacman = partial(read_pacman_local, PACMAN_LOCAL_DIR)
     
-    # Try using 'rpm' for RPM-based systems
+    return (
+        _cached_package_set("dpkg", DPKG_STATUS_FILE, dpkg)
+        | _cached_package_set("pacman", PACMAN_LOCAL_DIR, pacman)
+        | _cached_package_set("rpm", rpm_database, read_rpm_packages)
+    )
+
+def read_dpkg_status(status_file: Path = DPKG_STATUS_FILE) -> FrozenSet[str]:
+    """
+    Read installed package names from a dpkg status file.
+    
+    The file is streamed one stanza at a time rather than loaded whole.
+    
+    Args:
+        status_file: Path to the dpkg status file
+        
+    Returns:
+        FrozenSet[str]: Names of packages with status "installed"
+    """
+    packages = set()
+    name = None
+    installed = False
+    
+    with open(status_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith("Package:"):
+                name = line[8:].strip()
+            elif line.startswith("Status:"):
+                installed = line.split()[-1] == "installed"
+            elif not line.strip():
+                # Blank line ends a stanza
+                if name and installed:
+                    packages.add(name)
+                name = None
+                installed = False
+    
+    if name and installed:
+        packages.add(name)
+    
+    return frozenset(packages)
+
+def read_pacman_local(local_dir: Path = PACMAN_LOCAL_DIR) -> FrozenSet[str]:
+    """
+    Read installed package names from the pacman local database.
+    
+    Args:
+        local_dir: Path to the pacman local database directory
+        
+    Returns:
+        FrozenSet[str]: Names of installed packages
+    """
+    packages = set()
+    
+    with os.scandir(local_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            
+            try:
+                with open(os.path.join(entry.path, "desc"), 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        if line.strip() == "%NAME%":
+                            packages.add(next(f).strip())
+                            break
+            except (OSError, StopIteration) as e:
+                logger.debug(f"Error reading pacman entry {entry.path}: {e}")
+    
+    return frozenset(packages)
+
+def read_rpm_packages() -> FrozenSet[str]:
+    """
+    Read installed package names with a single rpm query.
+    
+    Returns:
+        FrozenSet[str]: Names of installed packages, empty if rpm is missing
+    """
+    if not shutil.which("rpm"):
+        return frozenset()
+    
+    result = subprocess.run(
+        ["rpm", "-qa", "--queryformat", "%{NAME}\\n"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        logger.debug(f"rpm query failed: {result.stderr.strip()}")
+        return frozenset()
+    
+    return parse_rpm_query(result.stdout)
+
+def parse_rpm_query(output: str) -> FrozenSet[str]:
+    """
+    Parse the output of rpm -qa --queryformat '%{NAME}\\n'.
+    
+    Args:
+        output: Query output, one package name per line
+        
+    Returns:
+        FrozenSet[str]: Names of installed packages
+    """
+    return frozenset(line.strip() for line in output.splitlines() if line.strip())
+
+def _cached_package_set(key: str, database: Optional[Path],
+                        reader: Callable[[], FrozenSet[str]]) -> FrozenSet[str]:
+    """
+    Get a package set, re-reading it only when its database changed.
+    
+    Args:
+        key: Cache key for the package manager
+        database: Database path whose mtime validates the cache, or None
+            to read the set once per session
+        reader: Function that reads the package set
+        
+    Returns:
+        FrozenSet[str]: Cached or freshly read package names, empty if the
+            database does not exist
+    """
+    mtime = None
+    if database is not None:
+        try:
+            mtime = os.stat(database).st_mtime_ns
+        except OSError:
+            return frozenset()
+    
+    with _package_sets_lock:
+        cached = _package_sets.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        try:
+            packages = reader()
+        except Exception as e:
+            logger.debug(f"Error reading {key} package database: {e}")
+            packages = frozenset()
+        
+        _package_sets[key] = (mtime, packages)
+        logger.debug(f"Read {len(packages)} installed packages from {key}")
+        return packages
+
+def check_software_batch(software_names: Iterable[str], use_cache: bool = True,
+                         cache_file: Optional[str] = None,
+                         ttl: float = SOFTWARE_CACHE_TTL) -> Dict[str, bool]:
+    """
+    Check several pieces of software at once.
+    
+    Each name is checked concurrently with check_software. Results are
+    persisted and reused until the TTL expires or the fingerprint changes.
+    The fingerprint covers PATH and the package database mtimes.
+    This function blocks, so call it from a worker thread in the UI.
+    
+    Args:
+        software_names: Names of the software to check
+        use_cache: Whether to read and write the results cache
+        cache_file: Optional path to the cache file
+        ttl: Maximum age of cached results in seconds
+        
+    Returns:
+        Dict[str, bool]: Mapping of software name to availability
+    """
+    names = sorted(set(software_names))
+    if not names:
+        return {}
+    
+    cache_file = os.path.expanduser(cache_file or SOFTWARE_CACHE_FILE)
+    fingerprint = _detection_fingerprint()
+    
+    results = {}
+    if use_cache:
+        cached = _load_software_cache(cache_file, fingerprint, ttl)
+        results = {name: cached[name] for name in names if name in cached}
+    
+    missing = [name for name in names if name not in results]
+    if missing:
+        logger.info(f"Checking software in parallel: {', '.join(missing)}")
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            for name, available in zip(missing, executor.map(check_software, missing)):
+                results[name] = available
+        
+        if use_cache:
+            _save_software_cache(cache_file, fingerprint, results)
+    else:
+        logger.debug(f"Using cached software detection results for: {', '.join(names)}")
+    
+    return results
+
+def _detection_fingerprint() -> str:
+    """
+    Build a fingerprint of the state that software detection depends on.
+    
+    Returns:
+        str: Hash of PATH and package database mtimes
+    """
+    parts = [os.environ.get("PATH", "")]
+    for database in PACKAGE_DATABASES:
+        try:
+            parts.append(f"{database}:{os.stat(database).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{database}:-")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+def _load_software_cache(cache_file: str, fingerprint: str, ttl: float) -> Dict[str, bool]:
+    """
+    Load cached software detection results if they are still valid.
+    
+    Args:
+        cache_file: Path to the cache file
+        fingerprint: Current detection fingerprint
+        ttl: Maximum age of cached results in seconds
+        
+    Returns:
+        Dict[str, bool]: Cached results, or empty dict if stale or missing
+    """
     try:
-        result = subprocess.run(
-            ["rpm", "-q", software], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            text=True, 
-            check=False
-        )
-        if result.returncode == 0:
-            logger.info(f"Software '{software}' found via rpm")
-            return True
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
     except Exception as e:
-        logger.debug(f"Error checking for software with rpm: {e}")
+        logger.debug(f"Ignoring unreadable software cache {cache_file}: {e}")
+        return {}
+    
+    if data.get("fingerprint") != fingerprint:
+        logger.debug("Software cache fingerprint changed, rechecking")
+        return {}
+    if time.time() - data.get("timestamp", 0) > ttl:
+        logger.debug("Software cache expired, rechecking")
+        return {}
+    
+    return data.get("results", {})
+
+def _save_software_cache(cache_file: str, fingerprint: str, results: Dict[str, bool]) -> None:
+    """
+    Persist software detection results.
+    
+    Args:
+        cache_file: Path to the cache file
+        fingerprint: Detection fingerprint the results belong to
+        results: Mapping of software name to availability
+    """
+    _write_json_atomic(cache_file, {
+        "fingerprint": fingerprint,
+        "timestamp": time.time(),
+        "results": results,
+    })
+
+def _write_json_atomic(path: str, data: Dict) -> None:
+    """
+    Write a JSON cache file via a temporary file and rename.
+    
+    Failures are logged and ignored since caches can always be rebuilt.
     
-    # Try using 'pacman' for Arch-based systems
+    Args:
+        path: Path to the cache file
+        data: JSON-serializable data
+    """
+    temp_file = None
     try:
-        result = subprocess.run(
-            ["pacman", "-Q", software], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            text=True, 
-            check=False
-        )
-        if result.returncode == 0:
-            logger.info(f"Software '{software}' found via pacman")
-            return True
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, dir=cache_dir, encoding="utf-8"
+        ) as temp:
+            temp_file = temp.name
+            json.dump(data, temp)
+        os.replace(temp_file, path)
     except Exception as e:
-        logger.debug(f"Error checking for software with pacman: {e}")
-    
-    logger.warning(f"Software '{software}' not found")
-    return False
+        logger.debug(f"Failed to save cache file {path}: {e}")
+        if temp_file and os.path.exists(temp_file):
+            try:
+                os.unlink(temp_file)
+            except OSError:
+                pass
 
 def detect_steam_location():
     """
@@ -86,46 +389,169 @@ def detect_steam_location():
     Returns:
         Path or None: Path to the Steam directory if found, None otherwise
     """
-    logger.info("Attempting to detect Steam installation location")
+    installs = detect_steam_installs()
+    return installs[0].path if installs else None
+
+def detect_steam_installs(refresh: bool = False, cache_file: Optional[str] = None) -> List[SteamInstall]:
+    """
+    Detect all Steam installations (native, Flatpak and Snap).
+    
+    Resolved installations are remembered in memory and persisted. On reuse
+    they are validated with a single stat of the primary Steam root; a full
+    probe of the common locations and running processes only happens when
+    that check fails or refresh is requested.
+    
+    Args:
+        refresh: Ignore remembered installations and probe again
+        cache_file: Optional path to the persisted locations file
+        
+    Returns:
+        List[SteamInstall]: Detected installations, primary first
+    """
+    global _steam_installs
+    cache_file = os.path.expanduser(cache_file or STEAM_LOCATIONS_FILE)
+    
+    if not refresh:
+        installs = _steam_installs
+        if installs is None:
+            installs = _load_steam_installs(cache_file)
+        
+        if installs and os.path.isdir(installs[0].path):
+            _steam_installs = installs
+            return installs
+    
+    logger.info("Attempting to detect Steam installation locations")
+    
+    installs = []
+    seen = set()
+    
+    def add_install(path):
+        real_path = os.path.realpath(path)
+        if real_path in seen:
+            return
+        seen.add(real_path)
+        install = SteamInstall(_classify_steam_install(real_path), Path(path))
+        installs.append(install)
+        logger.info(f"Steam installation found at: {path} ({install.kind})")
     
     # Check common Steam installation locations
-    common_locations = [
-        Path.home() / ".steam" / "steam",
-        Path.home() / ".local" / "share" / "Steam",
-        Path("/usr/share/steam"),
-        Path("/opt/steam"),
-        Path.home() / ".var" / "app" / "com.valvesoftware.Steam" / "data" / "Steam",  # Flatpak
-    ]
-    
-    for location in common_locations:
-        if location.exists() and location.is_dir():
-            logger.info(f"Steam installation found at: {location}")
-            return location
-    
-    # Check using the Steam process
+    for location in STEAM_LOCATIONS:
+        if location.is_dir():
+            add_install(location)
+    
+    # Check running Steam processes
     try:
-        result = subprocess.run(
-            ["pgrep", "-a", "steam"], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            text=True, 
-            check=False
-        )
-        if result.returncode == 0 and result.stdout:
-            # Parse process info to extract path
-            process_info = result.stdout.strip().split("\n")[0]
-            if "/" in process_info:
-                path_parts = process_info.split(" ")[1:]
-                for part in path_parts:
-                    if "/" in part and "steam" in part.lower():
-                        steam_path = Path(part).parent
-                        if steam_path.exists():
-                            logger.info(f"Steam installation found at: {steam_path}")
-                            return steam_path
+        for root in _scan_steam_processes():
+            add_install(root)
     except Exception as e:
         logger.error(f"Error detecting Steam via process: {e}")
     
-    logger.warning("Could not detect Steam installation location")
+    if not installs:
+        logger.warning("Could not detect Steam installation location")
+    
+    _steam_installs = installs
+    _write_json_atomic(cache_file, {
+        "installs": [{"kind": install.kind, "path": str(install.path)} for install in installs]
+    })
+    
+    return installs
+
+def _load_steam_installs(cache_file: str) -> List[SteamInstall]:
+    """
+    Load persisted Steam installations.
+    
+    Args:
+        cache_file: Path to the persisted locations file
+        
+    Returns:
+        List[SteamInstall]: Persisted installations, or empty list
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return [
+            SteamInstall(entry["kind"], Path(entry["path"]))
+            for entry in data.get("installs", [])
+        ]
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable Steam locations file {cache_file}: {e}")
+        return []
+
+def _classify_steam_install(path: str) -> str:
+    """
+    Classify a Steam root by how it was installed.
+    
+    Args:
+        path: Resolved path of the Steam root
+        
+    Returns:
+        str: "flatpak", "snap" or "native"
+    """
+    if "/.var/app/com.valvesoftware.Steam/" in path:
+        return "flatpak"
+    if "/snap/steam/" in path:
+        return "snap"
+    return "native"
+
+def _scan_steam_processes(proc_dir: str = "/proc") -> List[Path]:
+    """
+    Find the Steam roots of running Steam client processes.
+    
+    Reads /proc/<pid>/exe and falls back to argv[0] from
+    /proc/<pid>/cmdline for processes started through a wrapper script.
+    
+    Args:
+        proc_dir: Mount point of procfs
+        
+    Returns:
+        List[Path]: Steam root directories of running clients
+    """
+    roots = []
+    
+    with os.scandir(proc_dir) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            
+            binary = None
+            try:
+                exe = os.readlink(os.path.join(entry.path, "exe"))
+                if os.path.basename(exe).lower() in STEAM_PROCESS_NAMES:
+                    binary = exe
+            except OSError:
+                pass
+            
+            if binary is None:
+                try:
+                    with open(os.path.join(entry.path, "cmdline"), 'rb') as f:
+                        argv0 = f.read().split(b"\0", 1)[0].decode("utf-8", "replace")
+                except OSError:
+                    continue
+                if os.path.isabs(argv0) and os.path.basename(argv0).lower() in STEAM_PROCESS_NAMES:
+                    binary = argv0
+            
+            if binary:
+                root = _steam_root_from_binary(Path(binary))
+                if root and root not in roots:
+                    roots.append(root)
+    
+    return roots
+
+def _steam_root_from_binary(binary: Path) -> Optional[Path]:
+    """
+    Walk up from a Steam binary to the Steam root directory.
+    
+    Args:
+        binary: Path to a Steam client executable
+        
+    Returns:
+        Path or None: The Steam root, identified by its steamapps directory
+    """
+    for parent in list(binary.parents)[:4]:
+        if (parent / "steamapps").is_dir():
+            return parent
     return None
 
 def get_install_command(software):
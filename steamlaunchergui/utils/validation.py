@@ -8,14 +8,18 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
+from steamlaunchergui.utils.path_cache import PathStatCache
+from steamlaunchergui.utils.rule_engine import get_rule_engine
+
 logger = logging.getLogger(__name__)
 
-def validate_path(path: str) -> Tuple[bool, str]:
+def validate_path(path: str, cache: Optional[PathStatCache] = None) -> Tuple[bool, str]:
     """
     Validate a file path input.
     
     Args:
         path: The path to validate
+        cache: Optional cache to answer the existence check from
         
     Returns:
         Tuple[bool, str]: (is_valid, error_message)
@@ -24,7 +28,8 @@ def validate_path(path: str) -> Tuple[bool, str]:
         return True, ""  # Empty path is valid (will use default)
     
     path = os.path.expanduser(path)
-    if not os.path.exists(path):
+    exists = cache.exists(path) if cache else os.path.exists(path)
+    if not exists:
         return False, f"Path does not exist: {path}"
     
     return True, ""
@@ -133,35 +138,15 @@ def validate_option_combinations(options: Dict[str, Any]) -> List[str]:
     Validate combinations of launch options for conflicts or issues.
     
     Args:
-        options: Dictionary of options and their values
+        options: Dictionary of options and their values, keyed as in
+            LaunchOptions.effective_options; options with a false or empty
+            value are not set
         
     Returns:
         List[str]: List of warning messages for conflicting options
     """
-    warnings = []
-    
-    # Check for conflicting fullscreen/windowed options
-    if options.get('-fullscreen') and options.get('-windowed'):
-        warnings.append("Conflicting options: -fullscreen and -windowed cannot be used together")
-    
-    if options.get('-fullscreen') and options.get('-nofullscreen'):
-        warnings.append("Conflicting options: -fullscreen and -nofullscreen cannot be used together")
-    
-    # Check for conflicting priority options
-    priority_options = ['-high', '-low', '-veryhigh', '-background']
-    active_priorities = [opt for opt in priority_options if options.get(opt)]
-    if len(active_priorities) > 1:
-        warnings.append(f"Conflicting priority options: {', '.join(active_priorities)}")
-    
-    # Check for conflicting sound options
-    if options.get('-nosound') and options.get('-soundbuffer'):
-        warnings.append("Conflicting sound options: -nosound will override -soundbuffer")
-    
-    # Check for potentially problematic combinations
-    if options.get('-fullscreen') and options.get('-noborder'):
-        warnings.append("Potentially unnecessary: -noborder has no effect in fullscreen mode")
-    
-    return warnings
+    # Rules test whether an option is present, so unset options are dropped
+    return get_rule_engine().evaluate({option: value for option, value in options.items() if value})
 
 def get_input_type_validator(input_type: str):
     """
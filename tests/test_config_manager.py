@@ -0,0 +1,108 @@
+"""
+Tests for the settings journal of ConfigManager.
+"""
+
+import glob
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from steamlaunchergui.config import config_manager
+from steamlaunchergui.config.config_manager import ConfigManager
+from steamlaunchergui.config.constants import FSYNC_NEVER
+
+class SettingsJournalTest(unittest.TestCase):
+    """Appending, replaying and compacting the journal."""
+    
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.settings_file = str(self.directory / "settings.json")
+        self.journal_file = self.settings_file + ".journal"
+    
+    def open(self):
+        """Open the settings as the application does."""
+        return ConfigManager(self.settings_file, fsync_policy=FSYNC_NEVER)
+    
+    def write(self, path, data):
+        """Write a file as a crashed run left it."""
+        with open(path, "wb") as f:
+            f.write(data)
+    
+    def snapshot(self):
+        """Settings in the settings file, without the journal."""
+        with open(self.settings_file) as f:
+            return json.load(f)
+    
+    def backups(self):
+        """Backups made of a corrupted journal."""
+        return glob.glob(self.journal_file + ".bak.*")
+    
+    def test_changes_are_appended_and_replayed(self):
+        config = self.open()
+        config.save_settings({"kept": 1, "removed": 2})
+        config = self.open()
+        config.set_setting("added", "value")
+        config.delete_setting("removed")
+        
+        # The snapshot is left alone; the journal holds the changes
+        self.assertEqual(self.snapshot(), {"kept": 1, "removed": 2})
+        with open(self.journal_file) as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+        self.assertEqual(self.open().settings, {"kept": 1, "added": "value"})
+    
+    def test_clear_record_drops_earlier_settings(self):
+        config = self.open()
+        config.set_setting("old", 1)
+        config.clear_settings()
+        config.set_setting("new", 2)
+        
+        self.assertEqual(self.open().settings, {"new": 2})
+    
+    def test_torn_last_record_is_dropped(self):
+        self.write(self.settings_file, b'{"kept": 1}')
+        self.write(self.journal_file, b'{"set":"added","value":2}\n{"set":"torn","val')
+        
+        config = self.open()
+        
+        self.assertEqual(config.settings, {"kept": 1, "added": 2})
+        # The journal is folded into a new snapshot; a torn record is no
+        # corruption, so nothing is backed up
+        self.assertEqual(self.snapshot(), {"kept": 1, "added": 2})
+        self.assertFalse(Path(self.journal_file).exists())
+        self.assertEqual(self.backups(), [])
+    
+    def test_corrupted_journal_is_backed_up(self):
+        self.write(self.settings_file, b'{"kept": 1}')
+        self.write(self.journal_file, b'{"set":"a","value":1}\nnot json\n{"unknown":1}\n'
+                                      b'{"set":"b","value":2}\n')
+        
+        config = self.open()
+        
+        # The readable records are applied around the bad ones
+        self.assertEqual(config.settings, {"kept": 1, "a": 1, "b": 2})
+        self.assertEqual(self.snapshot(), {"kept": 1, "a": 1, "b": 2})
+        self.assertFalse(Path(self.journal_file).exists())
+        backups = self.backups()
+        self.assertEqual(len(backups), 1)
+        with open(backups[0], "rb") as f:
+            self.assertIn(b"not json", f.read())
+    
+    def test_journal_is_compacted_past_its_limit(self):
+        config = self.open()
+        with mock.patch.object(config_manager, "SETTINGS_JOURNAL_LIMIT", 100):
+            for number in range(3):
+                config.set_setting(f"key{number}", "x" * 20)
+                if number == 0:
+                    self.assertTrue(Path(self.journal_file).exists())
+        
+        self.assertFalse(Path(self.journal_file).exists())
+        expected = {f"key{number}": "x" * 20 for number in range(3)}
+        self.assertEqual(self.snapshot(), expected)
+        self.assertEqual(self.open().settings, expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the ordering and coalescing of queued profile operations.
+"""
+
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from steamlaunchergui.models.launch_options import LaunchOptions
+from steamlaunchergui.models.profile_writer import ProfileWriter
+from steamlaunchergui.models.profiles import Profile, ProfileManager
+
+def make_profile(name, args):
+    """A profile whose options differ by their custom options."""
+    launch_options = LaunchOptions()
+    launch_options.set_general_input("custom_options", args)
+    return Profile(name, "", launch_options)
+
+class ProfileWriterOrderTest(unittest.TestCase):
+    """Operations queued while the worker is busy."""
+    
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.manager = ProfileManager(self.directory)
+        self.writer = ProfileWriter(self.manager)
+        self.addCleanup(self.writer.close)
+        
+        # The worker blocks in the callback of a first save until released
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.writer.save(make_profile("Hold", ""), lambda success: self.release.wait())
+    
+    def stored(self):
+        """Profile arguments as read back from disk, by name."""
+        self.release.set()
+        self.assertTrue(self.writer.flush(10))
+        manager = ProfileManager(self.directory)
+        return {profile.name: profile.launch_options.general_inputs.get("custom_options")
+                for profile in manager.get_profiles() if profile.name != "Hold"}
+    
+    def test_repeated_saves_are_coalesced(self):
+        results = []
+        self.writer.save(make_profile("A", "v1"), results.append)
+        self.writer.save(make_profile("A", "v2"), results.append)
+        
+        self.assertEqual(self.stored(), {"A": "v2"})
+        self.assertEqual(self.writer.coalesced, 1)
+        self.assertEqual(results, [True, True])
+    
+    def test_save_after_rename_runs_after_it(self):
+        self.writer.save(make_profile("A", "v1"))
+        self.writer.update_details("A", "B", "Renamed")
+        self.writer.save(make_profile("A", "v2"))
+        
+        # The rename is a barrier for both names, so nothing is coalesced
+        self.assertEqual(self.stored(), {"A": "v2", "B": "v1"})
+        self.assertEqual(self.writer.coalesced, 0)
+    
+    def test_save_after_rename_to_its_name_runs_after_it(self):
+        self.writer.save(make_profile("B", "v1"))
+        self.writer.update_details("A", "B", "Renamed")
+        self.writer.save(make_profile("B", "v2"))
+        
+        # Renaming a missing profile fails and leaves B alone
+        self.assertEqual(self.stored(), {"B": "v2"})
+        self.assertEqual(self.writer.coalesced, 0)
+    
+    def test_update_options_copies_the_options(self):
+        self.writer.save(make_profile("A", "v1"))
+        launch_options = make_profile("A", "v2").launch_options
+        self.writer.update_options("A", launch_options)
+        launch_options.set_general_input("custom_options", "edited")
+        
+        self.assertEqual(self.stored(), {"A": "v2"})
+
+if __name__ == "__main__":
+    unittest.main()
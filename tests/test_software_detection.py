@@ -0,0 +1,70 @@
+"""
+Tests for the package database readers in software_detection.
+"""
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from steamlaunchergui.utils import software_detection
+from steamlaunchergui.utils.software_detection import (
+    installed_packages, parse_rpm_query, read_dpkg_status, read_pacman_local
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+MISSING = FIXTURES / "missing"
+
+class PackageDatabaseTest(unittest.TestCase):
+    """Reading installed packages from fixture databases."""
+    
+    def setUp(self):
+        software_detection._package_sets.clear()
+        self.addCleanup(software_detection._package_sets.clear)
+    
+    def test_dpkg_status_lists_installed_packages_only(self):
+        packages = read_dpkg_status(FIXTURES / "dpkg_status")
+        
+        # Removed and half-configured packages are not installed
+        self.assertEqual(packages, {"gamemode", "gamescope"})
+    
+    def test_pacman_local_reads_names_from_desc(self):
+        packages = read_pacman_local(FIXTURES / "pacman_local")
+        
+        # Entries without a readable name are skipped
+        self.assertEqual(packages, {"gamemode", "mangohud"})
+    
+    def test_rpm_query_ignores_blank_lines(self):
+        output = (FIXTURES / "rpm_qa.txt").read_text()
+        
+        self.assertEqual(
+            parse_rpm_query(output), {"gamemode", "mangohud", "vulkan-tools", "wine-core"}
+        )
+    
+    def test_installed_packages_combines_databases(self):
+        rpm_packages = parse_rpm_query((FIXTURES / "rpm_qa.txt").read_text())
+        
+        with mock.patch.object(software_detection, "DPKG_STATUS_FILE", FIXTURES / "dpkg_status"), \
+                mock.patch.object(software_detection, "PACMAN_LOCAL_DIR", FIXTURES / "pacman_local"), \
+                mock.patch.object(software_detection, "RPM_DATABASES", [FIXTURES / "rpm_qa.txt"]), \
+                mock.patch.object(software_detection, "read_rpm_packages", return_value=rpm_packages):
+            packages = installed_packages()
+        
+        self.assertEqual(
+            packages, {"gamemode", "gamescope", "mangohud", "vulkan-tools", "wine-core"}
+        )
+    
+    def test_rpm_is_queried_once_without_a_known_database(self):
+        rpm_packages = parse_rpm_query((FIXTURES / "rpm_qa.txt").read_text())
+        
+        with mock.patch.object(software_detection, "DPKG_STATUS_FILE", MISSING), \
+                mock.patch.object(software_detection, "PACMAN_LOCAL_DIR", MISSING), \
+                mock.patch.object(software_detection, "RPM_DATABASES", [MISSING]), \
+                mock.patch.object(software_detection, "read_rpm_packages",
+                                  return_value=rpm_packages) as read_rpm:
+            self.assertIn("wine-core", installed_packages())
+            self.assertIn("wine-core", installed_packages())
+        
+        read_rpm.assert_called_once_with()
+
+if __name__ == "__main__":
+    unittest.main()